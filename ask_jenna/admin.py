@@ -0,0 +1,62 @@
+from django import forms
+from django.contrib import admin
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+from .models import PromptOverride, SuggestionJob
+from .prompts import bump_overrides_version
+
+
+@admin.register(PromptOverride)
+class PromptOverrideAdmin(admin.ModelAdmin):
+    list_display = ("key", "field", "model", "length", "enabled", "updated_at")
+    list_filter = ("enabled", "updated_at")
+    search_fields = ("key", "field", "prompt")
+    readonly_fields = ("created_at", "updated_at")
+    actions = ("enable_selected", "disable_selected")
+
+    def formfield_for_dbfield(self, db_field, request, **kwargs):
+        if db_field.name == "prompt":
+            kwargs["widget"] = forms.Textarea(
+                attrs={
+                    "rows": 10,
+                    "cols": 80,
+                    "style": "font-family: monospace; font-size: 13px;",
+                }
+            )
+        return super().formfield_for_dbfield(db_field, request, **kwargs)
+
+    @admin.action(description=_("Enable selected prompt overrides"))
+    def enable_selected(self, request, queryset):  # pragma: no cover
+        queryset.update(enabled=True)
+        transaction.on_commit(bump_overrides_version)
+
+    @admin.action(description=_("Disable selected prompt overrides"))
+    def disable_selected(self, request, queryset):  # pragma: no cover
+        queryset.update(enabled=False)
+        transaction.on_commit(bump_overrides_version)
+
+
+@admin.register(SuggestionJob)
+class SuggestionJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "app_label",
+        "model_name",
+        "object_pk",
+        "view",
+        "field",
+        "status",
+        "attempts",
+        "updated_at",
+    )
+    list_filter = ("status", "app_label", "model_name")
+    search_fields = ("object_pk", "field", "result", "error")
+    readonly_fields = [field.name for field in SuggestionJob._meta.fields]
+    actions = ("requeue_selected",)
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description=_("Queue selected suggestions again"))
+    def requeue_selected(self, request, queryset):  # pragma: no cover
+        queryset.update(status=SuggestionJob.Status.PENDING, error="")
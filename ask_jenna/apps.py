@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AskJennaConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "ask_jenna"
+
+    def ready(self):
+        from django.db.models.signals import post_save
+
+        from . import metrics  # noqa: F401  Connects the signal receivers
+        from .pregenerate import enqueue_on_save
+
+        post_save.connect(enqueue_on_save, dispatch_uid="ask_jenna_pregenerate")
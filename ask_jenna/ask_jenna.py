@@ -1,4 +1,4 @@
-from cms.toolbar.utils import get_object_preview_url
+from .preview import get_content_url
 
 
 PAGE_PROMTS: dict = {
@@ -6,15 +6,17 @@ PAGE_PROMTS: dict = {
         "title": {
             "type": "text",
             "prompt": """Generate a a JSON string with an engaging new title for this page in the language with the language code {{ instance.language|default:"en" }}""",
-            "dynamic_content": lambda x: get_object_preview_url(x) if x else None,
+            "dynamic_content": lambda x: get_content_url(x) if x else None,
         },
         "page_title": {
+            "length": 80,
             "prompt": """Return a JSON string with one or two new words for the page title in the language with the language code {{ instance.language|default:"en" }}""",
-            "dynamic_content": lambda x: get_object_preview_url(x) if x else None,
+            "dynamic_content": lambda x: get_content_url(x) if x else None,
         },
         "menu_title": {
+            "length": 80,
             "prompt": """Return a JSON string with one or two new words for the page title in the language with the language code {{ instance.language|default:"en" }}""",
-            "dynamic_content": lambda x: get_object_preview_url(x) if x else None,
+            "dynamic_content": lambda x: get_content_url(x) if x else None,
         },
         "meta_description": {
             "type": "text",
@@ -22,7 +24,9 @@ PAGE_PROMTS: dict = {
             "prompt": """
                 Generate a JSON string for a meta description with an approximate length of {{ length }} characters for this page
                 optimizing search engine results in the language with the language code {{ instance.language|default:"en" }}""",
-            "dynamic_content": lambda x: get_object_preview_url(x) if x else None,
+            "dynamic_content": lambda x: get_content_url(x) if x else None,
         },
     }
 }
+
+PROMPTS = PAGE_PROMTS
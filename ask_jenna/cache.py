@@ -0,0 +1,84 @@
+"""
+Caching of LLM responses.
+
+Generations are cached in the Django cache alias ``ASK_JENNA_CACHE`` by
+model, sampling parameters, rendered prompt and a hash of the dynamic
+content, so pressing the same button on an unchanged object is answered
+without calling the provider again.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+
+from . import config
+
+
+def get_cache():
+    return caches[config.ASK_JENNA_CACHE]
+
+
+def get_content_hash(content: str | None) -> str:
+    return hashlib.sha256((content or "").encode()).hexdigest()
+
+
+def get_response_key(prompt: str, content: str | None, options: dict[str, Any]) -> str:
+    data = json.dumps(
+        {
+            "options": options,
+            "prompt": prompt,
+            "content": get_content_hash(content),
+        },
+        sort_keys=True,
+        cls=DjangoJSONEncoder,
+    )
+    return f"ask_jenna:response:{hashlib.sha256(data.encode()).hexdigest()}"
+
+
+def is_cacheable(text: str) -> bool:
+    return bool(
+        config.ASK_JENNA_RESPONSE_CACHE_TIMEOUT
+        and text
+        and len(text) <= config.ASK_JENNA_RESPONSE_CACHE_MAX_SIZE
+    )
+
+
+def get_response(
+    prompt: str, content: str | None, options: dict[str, Any]
+) -> str | None:
+    if not config.ASK_JENNA_RESPONSE_CACHE_TIMEOUT:
+        return None
+    return get_cache().get(get_response_key(prompt, content, options))
+
+
+async def aget_response(
+    prompt: str, content: str | None, options: dict[str, Any]
+) -> str | None:
+    if not config.ASK_JENNA_RESPONSE_CACHE_TIMEOUT:
+        return None
+    return await get_cache().aget(get_response_key(prompt, content, options))
+
+
+def set_response(
+    prompt: str, content: str | None, options: dict[str, Any], text: str
+) -> None:
+    if is_cacheable(text):
+        get_cache().set(
+            get_response_key(prompt, content, options),
+            text,
+            config.ASK_JENNA_RESPONSE_CACHE_TIMEOUT,
+        )
+
+
+async def aset_response(
+    prompt: str, content: str | None, options: dict[str, Any], text: str
+) -> None:
+    if is_cacheable(text):
+        await get_cache().aset(
+            get_response_key(prompt, content, options),
+            text,
+            config.ASK_JENNA_RESPONSE_CACHE_TIMEOUT,
+        )
@@ -0,0 +1,504 @@
+"""
+Resilient HTTP transport for LLM providers.
+
+:class:`LLMClient` keeps a persistent connection pool, bounds the number of
+concurrent generations, retries transient failures with exponential backoff,
+and guards every provider with a circuit breaker. With a second provider
+configured it fails over to it, and it can optionally hedge slow requests.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+#: HTTP status codes worth retrying
+RETRY_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+class LLMError(Exception):
+    pass
+
+
+class CircuitOpenError(LLMError):
+    pass
+
+
+class CircuitBreaker:
+    """Stop calling a provider after ``threshold`` consecutive failures.
+
+    After ``reset_timeout`` seconds a single trial request is let through
+    (half-open); its outcome closes or re-opens the circuit. A trial without
+    outcome, e.g. a cancelled one, is followed by another after
+    ``reset_timeout`` seconds.
+    """
+
+    def __init__(self, threshold: int, reset_timeout: float):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < self.reset_timeout:
+                return False
+            self.opened_at = now  # The next trial waits for another timeout
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.threshold and self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class Backend:
+    """A provider together with the options (e.g. model) it is called with."""
+
+    def __init__(self, provider, options: dict[str, Any], breaker: CircuitBreaker):
+        self.provider = provider
+        self.options = options
+        self.breaker = breaker
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<Backend {self.provider.__class__.__name__} {self.options}>"
+
+    def request_kwargs(
+        self, messages: list[dict[str, str]], stream: bool, options: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "url": self.provider.get_url(),
+            "headers": self.provider.get_headers(),
+            "json": self.provider.get_payload(
+                messages, stream=stream, **{**options, **self.options}
+            ),
+        }
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def retry_after(error: Exception) -> float:
+    if isinstance(error, httpx.HTTPStatusError):
+        try:
+            return float(error.response.headers.get("Retry-After", 0))
+        except ValueError:
+            pass
+    return 0
+
+
+class LLMClient:
+    def __init__(
+        self,
+        backends: list[Backend],
+        timeout: float = 10,
+        retries: int = 2,
+        backoff: float = 0.5,
+        max_connections: int = 10,
+        max_concurrency: int = 10,
+        hedge_after: float = 0,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+    ):
+        self.backends = backends
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_concurrency = max_concurrency
+        self.hedge_after = hedge_after
+        self.limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        )
+        # A transport serving both clients, e.g. the replay of recorded responses
+        self.transport = transport
+        self._client = httpx.Client(
+            limits=self.limits, timeout=timeout, transport=transport
+        )
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="ask-jenna-llm"
+        )
+        # httpx.AsyncClient and asyncio.Semaphore are bound to an event loop
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._async_semaphores = weakref.WeakKeyDictionary()
+
+    def close(self) -> None:
+        self._client.close()
+        self._executor.shutdown(wait=False)
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the running event loop."""
+        loop = asyncio.get_running_loop()
+        self._async_semaphores.pop(loop, None)
+        client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if loop not in self._async_clients:
+            self._async_clients[loop] = httpx.AsyncClient(
+                limits=self.limits, timeout=self.timeout, transport=self.transport
+            )
+            self._async_semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._async_clients[loop]
+
+    def get_backends(self) -> Iterator[Backend]:
+        """Yield the backends to try in turn.
+
+        A backend's circuit breaker is asked only once it is its turn, so a
+        half-open fallback's trial request is not used up while the primary
+        works.
+        """
+        available = False
+        for backend in self.backends:
+            if backend.breaker.allow():
+                available = True
+                yield backend
+        if not available:
+            raise CircuitOpenError("All LLM providers are unavailable")
+
+    def get_delay(self, attempt: int, error: Exception) -> float:
+        return min(max(self.backoff * 2**attempt, retry_after(error)), self.timeout)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[set[Future]]:
+        """Hold a slot of the concurrent generations.
+
+        Calls of the executor added to the yielded set keep holding it until
+        they are done, even after the caller returned.
+        """
+        if not self._semaphore.acquire(timeout=self.timeout):
+            raise LLMError("Too many concurrent generations")
+        pending: set[Future] = set()
+        try:
+            yield pending
+        finally:
+            self._release_after(pending)
+
+    def _release_after(self, futures: set[Future]) -> None:
+        running = [future for future in futures if not future.done()]
+        if not running:
+            self._semaphore.release()
+            return
+        remaining = len(running)
+        lock = threading.Lock()
+
+        def done(future):
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                last = not remaining
+            if last:
+                self._semaphore.release()
+
+        for future in running:
+            future.add_done_callback(done)
+
+    @contextlib.asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        self.get_async_client()
+        semaphore = self._async_semaphores[asyncio.get_running_loop()]
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise LLMError("Too many concurrent generations") from None
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    # Synchronous API
+
+    def _call(
+        self,
+        backend: Backend,
+        request: Callable[[], Any],
+        cancelled: threading.Event | None = None,
+    ) -> Any:
+        """Make ``request``, retrying transient failures.
+
+        Once ``cancelled`` is set, e.g. as another hedged call succeeded, no
+        further attempt is made and the outcome is not recorded by the
+        circuit breaker.
+        """
+        if cancelled is None:
+            cancelled = threading.Event()
+        for attempt in range(self.retries + 1):
+            if cancelled.is_set():
+                raise CancelledError
+            try:
+                result = request()
+            except httpx.HTTPError as e:
+                if cancelled.is_set():
+                    raise CancelledError from e
+                if not is_retryable(e) or attempt == self.retries:
+                    backend.breaker.record_failure()
+                    raise
+                delay = self.get_delay(attempt, e)
+                logger.info("Retrying %r in %.2fs: %s", backend, delay, e)
+                cancelled.wait(delay)
+            else:
+                if cancelled.is_set():
+                    raise CancelledError
+                backend.breaker.record_success()
+                return result
+
+    def _complete(self, backend: Backend, messages, options, cancelled=None) -> str:
+        def request():
+            response = self._client.post(
+                **backend.request_kwargs(messages, False, options)
+            )
+            response.raise_for_status()
+            return backend.provider.parse_response(response.json())
+
+        return self._call(backend, request, cancelled)
+
+    def _failover(self, backends: Iterator[Backend], call: Callable[[Backend], Any]):
+        error = None
+        for backend in backends:
+            try:
+                return call(backend)
+            except httpx.HTTPError as e:
+                logger.warning("LLM provider %r failed: %s", backend, e)
+                error = e
+        raise error
+
+    def _hedge(
+        self,
+        backends: Iterator[Backend],
+        call: Callable[[Backend, threading.Event], Any],
+        pending: set[Future],
+    ):
+        """Call the backends in turn until one succeeds.
+
+        The next backend is started once the calls running take longer than
+        ``hedge_after``, or at once if they failed. The calls still running
+        then are cancelled and added to ``pending``.
+        """
+        cancelled = threading.Event()
+        futures = set()
+        error = None
+        try:
+            while True:
+                backend = next(backends, None)
+                if backend is not None:
+                    futures.add(self._executor.submit(call, backend, cancelled))
+                elif not futures:
+                    raise error
+                done, futures = wait(
+                    futures,
+                    timeout=self.hedge_after if backend is not None else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = future.exception()
+        finally:
+            cancelled.set()
+            for future in futures:
+                if not future.cancel():
+                    pending.add(future)  # Running: keeps its slot until done
+
+    def complete(self, messages: list[dict[str, str]], **options) -> str:
+        """Return the full completion, trying each provider in turn."""
+        with self.slot() as pending:
+
+            def call(backend, cancelled=None):
+                return self._complete(backend, messages, options, cancelled)
+
+            if self.hedge_after and len(self.backends) > 1:
+                return self._hedge(self.get_backends(), call, pending)
+            return self._failover(self.get_backends(), call)
+
+    def _stream(self, backend: Backend, messages, options) -> Iterator[str]:
+        for attempt in range(self.retries + 1):
+            started = False
+            try:
+                with self._client.stream(
+                    "POST", **backend.request_kwargs(messages, True, options)
+                ) as response:
+                    response.raise_for_status()
+                    for text in backend.provider.iter_text(response):
+                        started = True
+                        yield text
+            except httpx.HTTPError as e:
+                # Text already sent cannot be taken back
+                if started or not is_retryable(e) or attempt == self.retries:
+                    backend.breaker.record_failure()
+                    raise
+                delay = self.get_delay(attempt, e)
+                logger.info("Retrying %r in %.2fs: %s", backend, delay, e)
+                time.sleep(delay)
+            else:
+                backend.breaker.record_success()
+                return
+
+    def stream(self, messages: list[dict[str, str]], **options) -> Iterator[str]:
+        """Yield the completion as it is generated.
+
+        Besides text, the provider's :class:`~ask_jenna.llm.Usage` reports
+        are passed through. Fails over to the next provider only if no text
+        has been sent yet.
+        """
+        with self.slot():
+            error = None
+            for backend in self.get_backends():
+                started = False
+                try:
+                    for text in self._stream(backend, messages, options):
+                        started = True
+                        yield text
+                    return
+                except httpx.HTTPError as e:
+                    if started:
+                        raise
+                    logger.warning("LLM provider %r failed: %s", backend, e)
+                    error = e
+            raise error
+
+    # Asynchronous API
+
+    async def _acall(self, backend: Backend, request) -> Any:
+        for attempt in range(self.retries + 1):
+            try:
+                result = await request()
+            except httpx.HTTPError as e:
+                if not is_retryable(e) or attempt == self.retries:
+                    backend.breaker.record_failure()
+                    raise
+                delay = self.get_delay(attempt, e)
+                logger.info("Retrying %r in %.2fs: %s", backend, delay, e)
+                await asyncio.sleep(delay)
+            else:
+                backend.breaker.record_success()
+                return result
+
+    async def _acomplete(self, backend: Backend, messages, options) -> str:
+        client = self.get_async_client()
+
+        async def request():
+            response = await client.post(
+                **backend.request_kwargs(messages, False, options)
+            )
+            response.raise_for_status()
+            return backend.provider.parse_response(response.json())
+
+        return await self._acall(backend, request)
+
+    async def _ahedge(self, backends: Iterator[Backend], messages, options) -> str:
+        tasks = set()
+        error = None
+        try:
+            while True:
+                backend = next(backends, None)
+                if backend is not None:
+                    tasks.add(
+                        asyncio.ensure_future(
+                            self._acomplete(backend, messages, options)
+                        )
+                    )
+                elif not tasks:
+                    raise error
+                done, tasks = await asyncio.wait(
+                    tasks,
+                    timeout=self.hedge_after if backend is not None else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def acomplete(self, messages: list[dict[str, str]], **options) -> str:
+        """Asynchronous counterpart of :meth:`complete`."""
+        async with self.aslot():
+            if self.hedge_after and len(self.backends) > 1:
+                return await self._ahedge(self.get_backends(), messages, options)
+            error = None
+            for backend in self.get_backends():
+                try:
+                    return await self._acomplete(backend, messages, options)
+                except httpx.HTTPError as e:
+                    logger.warning("LLM provider %r failed: %s", backend, e)
+                    error = e
+            raise error
+
+    async def _astream(self, backend: Backend, messages, options) -> AsyncIterator[str]:
+        client = self.get_async_client()
+        for attempt in range(self.retries + 1):
+            started = False
+            try:
+                async with client.stream(
+                    "POST", **backend.request_kwargs(messages, True, options)
+                ) as response:
+                    response.raise_for_status()
+                    async for text in backend.provider.aiter_text(response):
+                        started = True
+                        yield text
+            except httpx.HTTPError as e:
+                if started or not is_retryable(e) or attempt == self.retries:
+                    backend.breaker.record_failure()
+                    raise
+                delay = self.get_delay(attempt, e)
+                logger.info("Retrying %r in %.2fs: %s", backend, delay, e)
+                await asyncio.sleep(delay)
+            else:
+                backend.breaker.record_success()
+                return
+
+    async def astream(
+        self, messages: list[dict[str, str]], **options
+    ) -> AsyncIterator[str]:
+        """Asynchronous counterpart of :meth:`stream`."""
+        async with self.aslot():
+            error = None
+            for backend in self.get_backends():
+                started = False
+                try:
+                    async for text in self._astream(backend, messages, options):
+                        started = True
+                        yield text
+                    return
+                except httpx.HTTPError as e:
+                    if started:
+                        raise
+                    logger.warning("LLM provider %r failed: %s", backend, e)
+                    error = e
+            raise error
@@ -9,6 +9,9 @@ ASK_JENNA_API_KEY = getattr(
 ASK_JENNA_SERVICE = getattr(
     settings, "ASK_JENNA_SERVICE", os.environ.get("ASK_JENNA_SERVICE", "openai")
 )
+ASK_JENNA_BASE_URL = getattr(
+    settings, "ASK_JENNA_BASE_URL", os.environ.get("ASK_JENNA_BASE_URL")
+)
 ASK_JENNA_MODEL = getattr(
     settings, "ASK_JENNA_MODEL", os.environ.get("ASK_JENNA_MODEL", "gpt-3.5-turbo")
 )
@@ -42,3 +45,131 @@ ASK_JENNA_PRESENCE_PENALTY = float(
 ASK_JENNA_TIMEOUT = int(
     getattr(settings, "ASK_JENNA_TIMEOUT", os.environ.get("ASK_JENNA_TIMEOUT", 10))
 )
+ASK_JENNA_DYNAMIC_CONTENT_TIMEOUT = int(
+    getattr(
+        settings,
+        "ASK_JENNA_DYNAMIC_CONTENT_TIMEOUT",
+        os.environ.get("ASK_JENNA_DYNAMIC_CONTENT_TIMEOUT", 0),
+    )
+)
+ASK_JENNA_PREVIEW_TIMEOUT = int(
+    getattr(
+        settings,
+        "ASK_JENNA_PREVIEW_TIMEOUT",
+        os.environ.get("ASK_JENNA_PREVIEW_TIMEOUT", 3600),
+    )
+)
+ASK_JENNA_RETRIES = int(
+    getattr(settings, "ASK_JENNA_RETRIES", os.environ.get("ASK_JENNA_RETRIES", 2))
+)
+ASK_JENNA_RETRY_BACKOFF = float(
+    getattr(
+        settings,
+        "ASK_JENNA_RETRY_BACKOFF",
+        os.environ.get("ASK_JENNA_RETRY_BACKOFF", 0.5),
+    )
+)
+ASK_JENNA_MAX_CONNECTIONS = int(
+    getattr(
+        settings,
+        "ASK_JENNA_MAX_CONNECTIONS",
+        os.environ.get("ASK_JENNA_MAX_CONNECTIONS", 10),
+    )
+)
+ASK_JENNA_MAX_CONCURRENCY = int(
+    getattr(
+        settings,
+        "ASK_JENNA_MAX_CONCURRENCY",
+        os.environ.get("ASK_JENNA_MAX_CONCURRENCY", 10),
+    )
+)
+ASK_JENNA_CIRCUIT_BREAKER_THRESHOLD = int(
+    getattr(
+        settings,
+        "ASK_JENNA_CIRCUIT_BREAKER_THRESHOLD",
+        os.environ.get("ASK_JENNA_CIRCUIT_BREAKER_THRESHOLD", 5),
+    )
+)
+ASK_JENNA_CIRCUIT_BREAKER_TIMEOUT = float(
+    getattr(
+        settings,
+        "ASK_JENNA_CIRCUIT_BREAKER_TIMEOUT",
+        os.environ.get("ASK_JENNA_CIRCUIT_BREAKER_TIMEOUT", 30),
+    )
+)
+ASK_JENNA_HEDGE_AFTER = float(
+    getattr(
+        settings, "ASK_JENNA_HEDGE_AFTER", os.environ.get("ASK_JENNA_HEDGE_AFTER", 0)
+    )
+)
+ASK_JENNA_FALLBACK_SERVICE = getattr(
+    settings, "ASK_JENNA_FALLBACK_SERVICE", os.environ.get("ASK_JENNA_FALLBACK_SERVICE")
+)
+ASK_JENNA_FALLBACK_API_KEY = getattr(
+    settings, "ASK_JENNA_FALLBACK_API_KEY", os.environ.get("ASK_JENNA_FALLBACK_API_KEY")
+)
+ASK_JENNA_FALLBACK_BASE_URL = getattr(
+    settings,
+    "ASK_JENNA_FALLBACK_BASE_URL",
+    os.environ.get("ASK_JENNA_FALLBACK_BASE_URL"),
+)
+ASK_JENNA_FALLBACK_MODEL = getattr(
+    settings, "ASK_JENNA_FALLBACK_MODEL", os.environ.get("ASK_JENNA_FALLBACK_MODEL")
+)
+ASK_JENNA_CACHE = getattr(
+    settings, "ASK_JENNA_CACHE", os.environ.get("ASK_JENNA_CACHE", "default")
+)
+ASK_JENNA_SCRIPTS_TIMEOUT = int(
+    getattr(
+        settings,
+        "ASK_JENNA_SCRIPTS_TIMEOUT",
+        os.environ.get("ASK_JENNA_SCRIPTS_TIMEOUT", 3600),
+    )
+)
+ASK_JENNA_RESPONSE_CACHE_TIMEOUT = int(
+    getattr(
+        settings,
+        "ASK_JENNA_RESPONSE_CACHE_TIMEOUT",
+        os.environ.get("ASK_JENNA_RESPONSE_CACHE_TIMEOUT", 86400),
+    )
+)
+ASK_JENNA_RESPONSE_CACHE_MAX_SIZE = int(
+    getattr(
+        settings,
+        "ASK_JENNA_RESPONSE_CACHE_MAX_SIZE",
+        os.environ.get("ASK_JENNA_RESPONSE_CACHE_MAX_SIZE", 20000),
+    )
+)
+ASK_JENNA_ROUTES = getattr(settings, "ASK_JENNA_ROUTES", [])
+ASK_JENNA_LATENCY_PROBE_INTERVAL = float(
+    getattr(
+        settings,
+        "ASK_JENNA_LATENCY_PROBE_INTERVAL",
+        os.environ.get("ASK_JENNA_LATENCY_PROBE_INTERVAL", 60),
+    )
+)
+ASK_JENNA_PREGENERATE = getattr(settings, "ASK_JENNA_PREGENERATE", [])
+ASK_JENNA_REPLAY_FILE = getattr(
+    settings,
+    "ASK_JENNA_REPLAY_FILE",
+    os.environ.get("ASK_JENNA_REPLAY_FILE", "ask_jenna_replay.json"),
+)
+ASK_JENNA_REPLAY_LATENCY = float(
+    getattr(
+        settings,
+        "ASK_JENNA_REPLAY_LATENCY",
+        os.environ.get("ASK_JENNA_REPLAY_LATENCY", 0),
+    )
+)
+ASK_JENNA_REPLAY_TOKEN_RATE = float(
+    getattr(
+        settings,
+        "ASK_JENNA_REPLAY_TOKEN_RATE",
+        os.environ.get("ASK_JENNA_REPLAY_TOKEN_RATE", 0),
+    )
+)
+ASK_JENNA_REPLAY_RECORD = getattr(
+    settings,
+    "ASK_JENNA_REPLAY_RECORD",
+    os.environ.get("ASK_JENNA_REPLAY_RECORD", "").lower() in ("1", "true", "yes"),
+)
@@ -0,0 +1,458 @@
+"""
+Server-side access to LLM providers.
+
+The API key never leaves the server: the admin posts the prompt field to
+:func:`ask_jenna.views.generate`, which streams the completion back.
+"""
+
+import json
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, NamedTuple
+
+import httpx
+
+from . import config, replay
+from .client import Backend, CircuitBreaker, LLMClient
+from .routing import latency
+
+
+class Usage(NamedTuple):
+    """Token counts of a completion."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    def __add__(self, other: "Usage") -> "Usage":
+        return Usage(
+            self.prompt_tokens + other.prompt_tokens,
+            self.completion_tokens + other.completion_tokens,
+        )
+
+
+def count_tokens(text: str) -> int:
+    """Estimate the number of tokens of ``text`` (about four characters each)."""
+    return (len(text) + 3) // 4
+
+
+def estimate_usage(messages: list[dict[str, str]], text: str) -> Usage:
+    return Usage(
+        sum(count_tokens(message["content"]) for message in messages),
+        count_tokens(text),
+    )
+
+
+def get_stats(
+    started: float,
+    usage: Usage | None = None,
+    latency: float | None = None,
+    cached: bool = False,
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Return the keyword arguments of the ``generation_finished`` signal."""
+    usage = usage or Usage()
+    return {
+        "duration": time.monotonic() - started,
+        "latency": latency,
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "cached": cached,
+        "error": error,
+    }
+
+
+class Provider:
+    """Adapter for a provider's chat completion API."""
+
+    base_url: str = ""
+
+    def __init__(self, api_key: str | None = None, base_url: str | None = None):
+        self.api_key = api_key
+        self.base_url = (base_url or self.base_url).rstrip("/")
+
+    def get_url(self) -> str:
+        raise NotImplementedError
+
+    def get_headers(self) -> dict[str, str]:
+        raise NotImplementedError
+
+    def get_payload(
+        self, messages: list[dict[str, str]], stream: bool, **options
+    ) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def parse_response(self, data: dict[str, Any]) -> str:
+        """Return the completion text of a non-streaming response."""
+        raise NotImplementedError
+
+    def parse_event(self, data: dict[str, Any]) -> str:
+        """Return the text delta contained in a streamed event."""
+        raise NotImplementedError
+
+    def parse_usage(self, data: dict[str, Any]) -> Usage | None:
+        """Return the token counts contained in a streamed event, if any."""
+        return None
+
+    def parse_line(self, line: str) -> str | Usage | None:
+        """Return the text delta or usage of a server-sent event line.
+
+        Returns None once the stream is finished.
+        """
+        if not line.startswith("data:"):
+            return ""
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return None
+        data = json.loads(data)
+        return self.parse_usage(data) or self.parse_event(data)
+
+    def iter_text(self, response: httpx.Response) -> Iterator[str | Usage]:
+        for line in response.iter_lines():
+            text = self.parse_line(line)
+            if text is None:
+                break
+            if text:
+                yield text
+
+    async def aiter_text(self, response: httpx.Response) -> AsyncIterator[str | Usage]:
+        async for line in response.aiter_lines():
+            text = self.parse_line(line)
+            if text is None:
+                break
+            if text:
+                yield text
+
+
+class OpenAIProvider(Provider):
+    """OpenAI and OpenAI-compatible chat completion APIs."""
+
+    base_url = "https://api.openai.com/v1"
+    #: Ask for the token usage at the end of streams
+    stream_usage = True
+
+    def get_url(self) -> str:
+        return f"{self.base_url}/chat/completions"
+
+    def get_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def get_payload(self, messages, stream, **options):
+        payload = {"messages": messages, "stream": stream}
+        if stream and self.stream_usage:
+            payload["stream_options"] = {"include_usage": True}
+        if options.pop("json", False):
+            payload["response_format"] = {"type": "json_object"}
+        return {**payload, **options}
+
+    def parse_response(self, data):
+        return data["choices"][0]["message"]["content"] or ""
+
+    def parse_event(self, data):
+        choices = data.get("choices") or [{}]
+        return choices[0].get("delta", {}).get("content") or ""
+
+    def parse_usage(self, data):
+        if usage := data.get("usage"):
+            return Usage(
+                usage.get("prompt_tokens") or 0, usage.get("completion_tokens") or 0
+            )
+        return None
+
+
+class AnthropicProvider(Provider):
+    base_url = "https://api.anthropic.com/v1"
+
+    def get_url(self) -> str:
+        return f"{self.base_url}/messages"
+
+    def get_headers(self) -> dict[str, str]:
+        return {"x-api-key": self.api_key or "", "anthropic-version": "2023-06-01"}
+
+    def get_payload(self, messages, stream, **options):
+        # The messages API knows neither frequency nor presence penalties nor
+        # a JSON mode; JSON output is asked for in the prompt instead
+        options.pop("frequency_penalty", None)
+        options.pop("presence_penalty", None)
+        options.pop("json", None)
+        return {"messages": messages, "stream": stream, **options}
+
+    def parse_response(self, data):
+        return "".join(
+            block.get("text", "")
+            for block in data.get("content", [])
+            if block.get("type") == "text"
+        )
+
+    def parse_event(self, data):
+        if data.get("type") == "content_block_delta":
+            return data["delta"].get("text", "")
+        return ""
+
+    def parse_usage(self, data):
+        if data.get("type") == "message_start":
+            usage = data["message"].get("usage", {})
+            return Usage(prompt_tokens=usage.get("input_tokens") or 0)
+        if data.get("type") == "message_delta":
+            usage = data.get("usage", {})
+            return Usage(completion_tokens=usage.get("output_tokens") or 0)
+        return None
+
+
+class ReplayProvider(OpenAIProvider):
+    """Recorded responses served by :class:`~ask_jenna.replay.ReplayTransport`."""
+
+    base_url = "http://replay.invalid/v1"
+
+    def get_headers(self) -> dict[str, str]:
+        return {}
+
+    def get_payload(self, messages, stream, **options):
+        # Passed on unchanged, as the options are part of the request key
+        return {"messages": messages, "stream": stream, **options}
+
+
+def openai_compatible(url: str) -> type[OpenAIProvider]:
+    # Not every compatible API accepts ``stream_options``
+    return type(
+        "OpenAICompatibleProvider",
+        (OpenAIProvider,),
+        {"base_url": url, "stream_usage": False},
+    )
+
+
+PROVIDERS: dict[str, type[Provider]] = {
+    "openai": OpenAIProvider,
+    "anthropic": AnthropicProvider,
+    "deepseek": openai_compatible("https://api.deepseek.com/v1"),
+    "groq": openai_compatible("https://api.groq.com/openai/v1"),
+    "mistral": openai_compatible("https://api.mistral.ai/v1"),
+    "ollama": openai_compatible("http://localhost:11434/v1"),
+    "openrouter": openai_compatible("https://openrouter.ai/api/v1"),
+    "replay": ReplayProvider,
+}
+
+
+def get_provider(
+    service: str | None = None,
+    api_key: str | None = None,
+    base_url: str | None = None,
+) -> Provider:
+    """Return the provider for ``service``, by default ``ASK_JENNA_SERVICE``."""
+    if service is None:
+        service = config.ASK_JENNA_SERVICE
+        api_key = config.ASK_JENNA_API_KEY
+        base_url = config.ASK_JENNA_BASE_URL
+    try:
+        provider_class = PROVIDERS[service]
+    except KeyError:
+        raise ValueError(f"Unknown LLM service '{service}'")
+    return provider_class(api_key=api_key, base_url=base_url)
+
+
+def get_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        threshold=config.ASK_JENNA_CIRCUIT_BREAKER_THRESHOLD,
+        reset_timeout=config.ASK_JENNA_CIRCUIT_BREAKER_TIMEOUT,
+    )
+
+
+def build_client() -> LLMClient:
+    """Build the client from the ``ASK_JENNA_*`` settings."""
+    backends = [Backend(get_provider(), {}, get_breaker())]
+    transport = None
+    if config.ASK_JENNA_SERVICE == "replay":
+        from .replay import get_transport
+
+        transport = get_transport()
+    elif config.ASK_JENNA_FALLBACK_SERVICE:
+        options = {}
+        if config.ASK_JENNA_FALLBACK_MODEL:
+            options["model"] = config.ASK_JENNA_FALLBACK_MODEL
+        provider = get_provider(
+            config.ASK_JENNA_FALLBACK_SERVICE,
+            api_key=config.ASK_JENNA_FALLBACK_API_KEY,
+            base_url=config.ASK_JENNA_FALLBACK_BASE_URL,
+        )
+        backends.append(Backend(provider, options, get_breaker()))
+    return LLMClient(
+        backends,
+        timeout=config.ASK_JENNA_TIMEOUT,
+        retries=config.ASK_JENNA_RETRIES,
+        backoff=config.ASK_JENNA_RETRY_BACKOFF,
+        max_connections=config.ASK_JENNA_MAX_CONNECTIONS,
+        max_concurrency=config.ASK_JENNA_MAX_CONCURRENCY,
+        hedge_after=config.ASK_JENNA_HEDGE_AFTER,
+        transport=transport,
+    )
+
+
+_client: LLMClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> LLMClient:
+    """Return the process-wide client, sharing its connection pool."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = build_client()
+    return _client
+
+
+def reset_client() -> None:
+    """Drop the client, e.g. after the settings changed."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+
+
+def get_options(**options) -> dict[str, Any]:
+    """Return the sampling options, defaulting to the ``ASK_JENNA_*`` settings."""
+    return {
+        "model": config.ASK_JENNA_MODEL,
+        "max_tokens": config.ASK_JENNA_MAX_TOKENS,
+        "temperature": config.ASK_JENNA_TEMPERATURE,
+        "top_p": config.ASK_JENNA_TOP_P,
+        "frequency_penalty": config.ASK_JENNA_FREQUENCY_PENALTY,
+        "presence_penalty": config.ASK_JENNA_PRESENCE_PENALTY,
+        **options,
+    }
+
+
+def get_messages(prompt: str, content: str | None = None) -> list[dict[str, str]]:
+    if content:
+        prompt = f"Here is the content: {content}\n\n{prompt}"
+    return [{"role": "user", "content": prompt}]
+
+
+def get_fields_messages(
+    fields: dict[str, dict[str, Any]], contents: list[str]
+) -> list[dict[str, str]]:
+    """Build a single request filling several fields at once.
+
+    ``fields`` maps field names to their resolved prompt, ``type``, ``length``
+    and the index of their entry in ``contents``. Content shared by several
+    fields is sent only once.
+    """
+    parts = [
+        f"Content {i}:\n{content}" for i, content in enumerate(contents, 1) if content
+    ]
+    parts.append(
+        "Fill in the fields below. Answer with a single JSON object that has "
+        "one key per field name and the field's value."
+    )
+    for name, field in fields.items():
+        hints = [field.get("type", "text")]
+        if field.get("length"):
+            hints.append(f"at most {field['length']} characters")
+        if field.get("content") is not None and contents[field["content"]]:
+            hints.append(f"based on content {field['content'] + 1}")
+        parts.append(f"{json.dumps(name)} ({', '.join(hints)}): {field['prompt']}")
+    return [{"role": "user", "content": "\n\n".join(parts)}]
+
+
+def parse_fields(text: str) -> dict[str, Any]:
+    """Return the JSON object of a multi-field completion."""
+    text = text.strip()
+    if text.startswith("```"):
+        # Strip a markdown code fence
+        text = text.strip("`").removeprefix("json").strip()
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    return data
+
+
+class Generation:
+    """A completion being streamed.
+
+    Iterates (synchronously or asynchronously, depending on ``chunks``) over
+    the text. Records the latency until the first text and collects the token
+    usage the provider reports.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        chunks: Iterator | AsyncIterator,
+        on_finish: Callable[[str], None] | None = None,
+    ):
+        self.model = model
+        self.chunks = chunks
+        self.on_finish = on_finish
+        self.latency: float | None = None
+        self.usage: Usage | None = None
+        self.text = ""
+        self._started = time.monotonic()
+
+    def _process(self, item: str | Usage) -> str:
+        if isinstance(item, Usage):
+            self.usage = item + self.usage if self.usage else item
+            return ""
+        if self.latency is None:
+            self.latency = time.monotonic() - self._started
+            latency.observe(self.model, self.latency)
+        self.text += item
+        return item
+
+    def _finish(self) -> None:
+        if self.on_finish is not None:
+            self.on_finish(self.text)
+
+    def __iter__(self) -> Iterator[str]:
+        self._started = time.monotonic()
+        for item in self.chunks:
+            if text := self._process(item):
+                yield text
+        self._finish()
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        self._started = time.monotonic()
+        async for item in self.chunks:
+            if text := self._process(item):
+                yield text
+        self._finish()
+
+    def get_usage(self, messages: list[dict[str, str]], text: str) -> Usage:
+        """Return the reported token usage, or an estimate if there is none."""
+        return self.usage or estimate_usage(messages, text)
+
+
+def complete(messages: list[dict[str, str]], **options) -> str:
+    """Return the full completion for ``messages``."""
+    options = get_options(**options)
+    text = get_client().complete(messages, **options)
+    replay.record(messages, options, text)
+    return text
+
+
+async def acomplete(messages: list[dict[str, str]], **options) -> str:
+    """Asynchronous counterpart of :func:`complete`."""
+    options = get_options(**options)
+    text = await get_client().acomplete(messages, **options)
+    replay.record(messages, options, text)
+    return text
+
+
+def stream(messages: list[dict[str, str]], **options) -> Generation:
+    """Yield the completion for ``messages`` as it is generated."""
+    options = get_options(**options)
+    return Generation(
+        options["model"],
+        get_client().stream(messages, **options),
+        on_finish=lambda text: replay.record(messages, options, text),
+    )
+
+
+def astream(messages: list[dict[str, str]], **options) -> Generation:
+    """Asynchronous counterpart of :func:`stream`."""
+    options = get_options(**options)
+    return Generation(
+        options["model"],
+        get_client().astream(messages, **options),
+        on_finish=lambda text: replay.record(messages, options, text),
+    )
@@ -0,0 +1,289 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import httpx
+from asgiref.sync import sync_to_async
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+from django.db import router, transaction
+from django.db.models.signals import post_save
+
+from ask_jenna import llm, routing
+from ask_jenna.client import LLMError
+from ask_jenna.pregenerate import get_worker_request
+from ask_jenna.preview import get_content
+from ask_jenna.prompts import parse_value, prompts, validate
+from ask_jenna.signals import generation_finished
+
+
+class RateLimiter:
+    """Space out requests to at most ``rate`` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate else 0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class Command(BaseCommand):
+    help = "Fill the fields of existing objects with AI generated suggestions"
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Model label, e.g. cms.PageContent")
+        parser.add_argument(
+            "--view", default="change_view", help="Admin view of the prompts"
+        )
+        parser.add_argument(
+            "--fields", nargs="+", help="Fields to fill (default: all with prompts)"
+        )
+        parser.add_argument(
+            "--filter",
+            action="append",
+            default=[],
+            metavar="LOOKUP=VALUE",
+            help="Only fill objects matching the lookup, e.g. language=en",
+        )
+        parser.add_argument(
+            "--overwrite", action="store_true", help="Replace non-empty values"
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=4, help="Generations at a time"
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=0,
+            help="Maximum generations started per second (default: unlimited)",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=50, help="Objects written at a time"
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help="File recording the progress to resume an interrupted run "
+            "or retry failed fields",
+        )
+        parser.add_argument(
+            "--user",
+            help="Username rendering dynamic content that requires a login",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(f"Unknown model {options['model']}") from e
+        opts = model._meta
+        key = f"{opts.app_label}.{opts.model_name}:{options['view']}"
+        field_prompts = prompts.get_fields(
+            opts.app_label, opts.model_name, options["view"]
+        )
+        names = options["fields"] or list(field_prompts)
+        for name in names:
+            if name not in field_prompts:
+                raise CommandError(f"No prompt for {key} {name}")
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                field = None
+            if field is None or not field.concrete or field.primary_key:
+                raise CommandError(f"{name} is not a field of {opts.label}")
+        if not names:
+            raise CommandError(f"No prompts for {key}")
+        field_prompts = {name: field_prompts[name] for name in names}
+
+        queryset = model._default_manager.order_by("pk")
+        for lookup in options["filter"]:
+            name, sep, value = lookup.partition("=")
+            if not sep:
+                raise CommandError(f"Invalid filter {lookup}")
+            queryset = queryset.filter(**{name: value})
+
+        user = None
+        if options["user"]:
+            User = get_user_model()
+            try:
+                user = User._default_manager.get_by_natural_key(options["user"])
+            except User.DoesNotExist as e:
+                raise CommandError(f"Unknown user {options['user']}") from e
+        request = get_worker_request(user)
+
+        checkpoint = options["checkpoint"]
+        state = {"key": key, "fields": names, "last_pk": None}
+        if checkpoint and checkpoint.exists():
+            saved = json.loads(checkpoint.read_text())
+            if (saved.get("key"), saved.get("fields")) != (key, names):
+                raise CommandError(f"{checkpoint} belongs to another run")
+            state = saved
+            if state["last_pk"] is not None:
+                self.stdout.write(
+                    f"Resuming after {opts.verbose_name} {state['last_pk']}"
+                )
+
+        filled, failed = asyncio.run(
+            self.fill(queryset, key, field_prompts, request, state, options)
+        )
+        if checkpoint and checkpoint.exists():
+            if failed:
+                self.stdout.write("Run again to retry the failed fields")
+            else:
+                checkpoint.unlink()
+        self.stdout.write(self.style.SUCCESS(f"{filled} fields filled"))
+
+    async def fill(
+        self, queryset, key, field_prompts, request, state, options
+    ) -> tuple[int, int]:
+        """Fill the objects batch by batch; return the fields filled and failed.
+
+        The checkpoint only advances past objects whose fields were all
+        filled, so resuming a run retries the failed ones.
+        """
+        opts = queryset.model._meta
+        checkpoint = options["checkpoint"]
+        last_pk = state["last_pk"]
+        filled = failed = 0
+        try:
+            while True:
+                objects, jobs, errors = await sync_to_async(self.prepare)(
+                    queryset, last_pk, key, field_prompts, request, options
+                )
+                if not objects:
+                    break
+                results = await self.generate(key, jobs, options)
+
+                changed = {}
+                for (obj, name, field_prompt, _), result in zip(
+                    jobs, results, strict=True
+                ):
+                    try:
+                        if isinstance(result, Exception):
+                            raise result
+                        value = validate(
+                            field_prompt, parse_value(field_prompt, result)
+                        )
+                    except (httpx.HTTPError, LLMError, ValueError) as e:
+                        errors.append((obj, name, e))
+                        continue
+                    setattr(obj, name, value)
+                    changed[obj.pk] = obj
+                    filled += 1
+                for obj, name, error in errors:
+                    self.stderr.write(f"{opts.verbose_name} {obj.pk} {name}: {error}")
+                await sync_to_async(self.save)(
+                    queryset.model, changed.values(), list(field_prompts)
+                )
+
+                last_pk = objects[-1].pk
+                failed_pks = {obj.pk for obj, _, _ in errors}
+                for obj in objects:
+                    if failed or obj.pk in failed_pks:
+                        break
+                    state["last_pk"] = obj.pk
+                failed += len(errors)
+                if checkpoint:
+                    checkpoint.write_text(json.dumps(state, default=str))
+                self.stdout.write(
+                    f"{filled} fields filled, {failed} failed, "
+                    f"up to {opts.verbose_name} {last_pk}"
+                )
+        finally:
+            await llm.get_client().aclose()
+        return filled, failed
+
+    def prepare(self, queryset, last_pk, key, field_prompts, request, options):
+        """Return the next batch of objects, their generations and errors."""
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        objects = list(queryset[: options["batch_size"]])
+        # Prompts are resolved up front as they may query the database
+        jobs, errors = [], []
+        for obj in objects:
+            for name, field_prompt in field_prompts.items():
+                if not options["overwrite"] and getattr(obj, name):
+                    continue
+                try:
+                    resolved = prompts.resolve(key, name, field_prompt, obj)
+                    content = get_content(request, resolved.get("dynamic_content"))
+                except ValueError as e:
+                    errors.append((obj, name, e))
+                    continue
+                messages = llm.get_messages(resolved["prompt"], content)
+                jobs.append((obj, name, field_prompt, messages))
+        return objects, jobs, errors
+
+    def save(self, model, objects, names) -> None:
+        """Write the filled fields of ``objects`` as ``save()`` would.
+
+        ``bulk_update`` neither sets ``auto_now`` stamps nor sends
+        ``post_save``, which the cached scripts and previews, django CMS'
+        page cache and the pregeneration of suggestions depend on.
+        """
+        objects = list(objects)
+        if not objects:
+            return
+        stamps = [
+            field
+            for field in model._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+        for obj in objects:
+            for field in stamps:
+                field.pre_save(obj, add=False)  # Sets the current time
+        update_fields = [*names, *(field.name for field in stamps)]
+        using = router.db_for_write(model)
+        with transaction.atomic(using=using):
+            model._default_manager.bulk_update(objects, update_fields)
+            for obj in objects:
+                post_save.send(
+                    sender=model,
+                    instance=obj,
+                    created=False,
+                    update_fields=frozenset(update_fields),
+                    raw=False,
+                    using=using,
+                )
+            if model._meta.app_label == "cms":
+                from cms.cache import invalidate_cms_page_cache
+
+                transaction.on_commit(invalidate_cms_page_cache, using=using)
+
+    async def generate(self, key, jobs, options) -> list[str | BaseException]:
+        semaphore = asyncio.Semaphore(options["concurrency"])
+        limiter = RateLimiter(options["rate"])
+
+        async def generate_one(obj, name, field_prompt, messages):
+            async with semaphore:
+                await limiter.wait()
+                model = routing.get_model(field_prompt)
+                tags = {"key": key, "field": name, "model": model}
+                started = time.monotonic()
+                try:
+                    text = await llm.acomplete(messages, model=model)
+                except (httpx.HTTPError, LLMError) as e:
+                    stats = llm.get_stats(started, error=str(e))
+                    generation_finished.send(sender=llm.Generation, **tags, **stats)
+                    raise
+                usage = llm.estimate_usage(messages, text)
+                stats = llm.get_stats(started, usage)
+                generation_finished.send(sender=llm.Generation, **tags, **stats)
+                return text
+
+        return await asyncio.gather(
+            *(generate_one(*job) for job in jobs), return_exceptions=True
+        )
@@ -0,0 +1,53 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from ask_jenna.pregenerate import claim, get_worker_request, process
+
+
+class Command(BaseCommand):
+    help = "Generate the suggestions queued when objects are saved"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Username rendering dynamic content that requires a login",
+        )
+        parser.add_argument(
+            "--batch", type=int, default=10, help="Jobs claimed at a time"
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=5.0,
+            help="Seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="Exit once the queue is empty"
+        )
+
+    def handle(self, *args, **options):
+        user = None
+        if options["user"]:
+            User = get_user_model()
+            try:
+                user = User._default_manager.get_by_natural_key(options["user"])
+            except User.DoesNotExist:
+                raise CommandError(f"Unknown user {options['user']}")
+        request = get_worker_request(user)
+
+        done = failed = 0
+        while True:
+            jobs = claim(options["batch"])
+            if not jobs:
+                if options["once"]:
+                    break
+                time.sleep(options["sleep"])
+                continue
+            for job in jobs:
+                if process(job, request):
+                    done += 1
+                else:
+                    failed += 1
+        self.stdout.write(f"{done} suggestions generated, {failed} failed")
@@ -0,0 +1,109 @@
+"""
+In-process aggregation of the :mod:`ask_jenna.signals`.
+
+Counters are kept per process and reset on restart; they are exposed by
+:func:`ask_jenna.views.metrics`.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any
+
+from django.dispatch import receiver
+
+from .signals import generation_finished, prompt_resolved
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.prompts: dict[tuple, dict[str, Any]] = defaultdict(
+                lambda: {"count": 0, "duration": 0.0, "max_duration": 0.0}
+            )
+            self.generations: dict[tuple, dict[str, Any]] = defaultdict(
+                lambda: {
+                    "count": 0,
+                    "errors": 0,
+                    "cache_hits": 0,
+                    "duration": 0.0,
+                    "max_duration": 0.0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                }
+            )
+
+    def record_prompt(self, key: str, field: str, duration: float) -> None:
+        with self._lock:
+            entry = self.prompts[key, field]
+            entry["count"] += 1
+            entry["duration"] += duration
+            entry["max_duration"] = max(entry["max_duration"], duration)
+
+    def record_generation(
+        self,
+        key: str,
+        field: str | None,
+        model: str,
+        duration: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cached: bool = False,
+        error: str | None = None,
+    ) -> None:
+        with self._lock:
+            entry = self.generations[key, field, model]
+            entry["count"] += 1
+            entry["errors"] += bool(error)
+            entry["cache_hits"] += cached
+            entry["duration"] += duration
+            entry["max_duration"] = max(entry["max_duration"], duration)
+            entry["prompt_tokens"] += prompt_tokens
+            entry["completion_tokens"] += completion_tokens
+
+    def as_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """Return all counters, the slowest first."""
+        with self._lock:
+            prompts = [
+                {"key": key, "field": field, **entry}
+                for (key, field), entry in self.prompts.items()
+            ]
+            generations = [
+                {"key": key, "field": field, "model": model, **entry}
+                for (key, field, model), entry in self.generations.items()
+            ]
+        for entry in prompts + generations:
+            entry["avg_duration"] = entry["duration"] / entry["count"]
+        return {
+            "prompts": sorted(prompts, key=lambda e: -e["duration"]),
+            "generations": sorted(generations, key=lambda e: -e["duration"]),
+        }
+
+
+metrics = Metrics()
+
+
+@receiver(prompt_resolved)
+def record_prompt(sender, key, field, duration, **kwargs):
+    metrics.record_prompt(key, field, duration)
+
+
+@receiver(generation_finished)
+def record_generation(
+    sender,
+    key,
+    field,
+    model,
+    duration,
+    prompt_tokens=0,
+    completion_tokens=0,
+    cached=False,
+    error=None,
+    **kwargs,
+):
+    metrics.record_generation(
+        key, field, model, duration, prompt_tokens, completion_tokens, cached, error
+    )
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="PromptOverride",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="Prompt key, e.g. 'cms.pagecontent:change_view'. Patterns like 'cms.*:change_view' are allowed.",
+                        max_length=200,
+                        verbose_name="key",
+                    ),
+                ),
+                (
+                    "field",
+                    models.CharField(
+                        help_text="Name of the form field the prompt fills.",
+                        max_length=100,
+                        verbose_name="field",
+                    ),
+                ),
+                (
+                    "prompt",
+                    models.TextField(
+                        blank=True,
+                        help_text="Django template rendered with the instance. Leave empty to keep the prompt defined in code.",
+                        verbose_name="prompt",
+                    ),
+                ),
+                (
+                    "model",
+                    models.CharField(
+                        blank=True,
+                        help_text="LLM generating the field. Leave empty for the default.",
+                        max_length=100,
+                        verbose_name="model",
+                    ),
+                ),
+                (
+                    "length",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        help_text="Maximum length of the suggestion in characters.",
+                        null=True,
+                        verbose_name="length",
+                    ),
+                ),
+                (
+                    "enabled",
+                    models.BooleanField(
+                        default=True,
+                        help_text="If disabled, the prompt defined in code is used.",
+                        verbose_name="enabled",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "prompt override",
+                "verbose_name_plural": "prompt overrides",
+                "ordering": ["key", "field"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("key", "field"), name="ask_jenna_unique_override"
+                    )
+                ],
+            },
+        ),
+    ]
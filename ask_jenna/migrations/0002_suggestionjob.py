@@ -0,0 +1,95 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ask_jenna", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SuggestionJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "app_label",
+                    models.CharField(max_length=100, verbose_name="app label"),
+                ),
+                (
+                    "model_name",
+                    models.CharField(max_length=100, verbose_name="model name"),
+                ),
+                (
+                    "object_pk",
+                    models.CharField(max_length=255, verbose_name="object id"),
+                ),
+                ("view", models.CharField(max_length=100, verbose_name="view")),
+                ("field", models.CharField(max_length=100, verbose_name="field")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "pending"),
+                            ("running", "running"),
+                            ("done", "done"),
+                            ("failed", "failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="attempts"),
+                ),
+                (
+                    "response_key",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        help_text="Cache key of the model, prompt and content generated from.",
+                        max_length=100,
+                        verbose_name="response key",
+                    ),
+                ),
+                ("result", models.TextField(blank=True, verbose_name="result")),
+                ("error", models.TextField(blank=True, verbose_name="error")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "suggestion job",
+                "verbose_name_plural": "suggestion jobs",
+                "ordering": ["updated_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "updated_at"],
+                        name="ask_jenna_s_status_369e69_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "app_label",
+                            "model_name",
+                            "object_pk",
+                            "view",
+                            "field",
+                        ),
+                        name="ask_jenna_unique_suggestion_job",
+                    )
+                ],
+            },
+        ),
+    ]
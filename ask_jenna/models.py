@@ -0,0 +1,149 @@
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.template import Template, TemplateSyntaxError
+from django.utils.translation import gettext_lazy as _
+
+
+class PromptOverride(models.Model):
+    """Admin field prompt edited in the database, overriding the one in code."""
+
+    key = models.CharField(
+        verbose_name=_("key"),
+        max_length=200,
+        help_text=_(
+            "Prompt key, e.g. 'cms.pagecontent:change_view'. Patterns like "
+            "'cms.*:change_view' are allowed."
+        ),
+    )
+    field = models.CharField(
+        verbose_name=_("field"),
+        max_length=100,
+        help_text=_("Name of the form field the prompt fills."),
+    )
+    prompt = models.TextField(
+        verbose_name=_("prompt"),
+        blank=True,
+        help_text=_(
+            "Django template rendered with the instance. Leave empty to keep "
+            "the prompt defined in code."
+        ),
+    )
+    model = models.CharField(
+        verbose_name=_("model"),
+        max_length=100,
+        blank=True,
+        help_text=_("LLM generating the field. Leave empty for the default."),
+    )
+    length = models.PositiveIntegerField(
+        verbose_name=_("length"),
+        null=True,
+        blank=True,
+        help_text=_("Maximum length of the suggestion in characters."),
+    )
+    enabled = models.BooleanField(
+        verbose_name=_("enabled"),
+        default=True,
+        help_text=_("If disabled, the prompt defined in code is used."),
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("prompt override")
+        verbose_name_plural = _("prompt overrides")
+        ordering = ["key", "field"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["key", "field"], name="ask_jenna_unique_override"
+            )
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.key} {self.field}"
+
+    def clean(self):
+        from .prompts import parse_key
+
+        try:
+            parse_key(self.key)
+        except ImproperlyConfigured as e:
+            raise ValidationError({"key": str(e)}) from e
+        try:
+            Template(self.prompt)
+        except TemplateSyntaxError as e:
+            raise ValidationError({"prompt": str(e)}) from e
+
+    def as_field_prompt(self) -> dict:
+        """Return the spec options this override sets."""
+        field_prompt = {}
+        if self.prompt:
+            field_prompt["prompt"] = self.prompt
+        if self.model:
+            field_prompt["model"] = self.model
+        if self.length:
+            field_prompt["length"] = self.length
+        return field_prompt
+
+
+class SuggestionJob(models.Model):
+    """Suggestion of an object's field generated in the background."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("pending")
+        RUNNING = "running", _("running")
+        DONE = "done", _("done")
+        FAILED = "failed", _("failed")
+
+    app_label = models.CharField(verbose_name=_("app label"), max_length=100)
+    model_name = models.CharField(verbose_name=_("model name"), max_length=100)
+    object_pk = models.CharField(verbose_name=_("object id"), max_length=255)
+    view = models.CharField(verbose_name=_("view"), max_length=100)
+    field = models.CharField(verbose_name=_("field"), max_length=100)
+    status = models.CharField(
+        verbose_name=_("status"),
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveIntegerField(verbose_name=_("attempts"), default=0)
+    response_key = models.CharField(
+        verbose_name=_("response key"),
+        max_length=100,
+        blank=True,
+        db_index=True,
+        help_text=_("Cache key of the model, prompt and content generated from."),
+    )
+    result = models.TextField(verbose_name=_("result"), blank=True)
+    error = models.TextField(verbose_name=_("error"), blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("suggestion job")
+        verbose_name_plural = _("suggestion jobs")
+        ordering = ["updated_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["app_label", "model_name", "object_pk", "view", "field"],
+                name="ask_jenna_unique_suggestion_job",
+            )
+        ]
+        indexes = [models.Index(fields=["status", "updated_at"])]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.key} {self.field} {self.object_pk}"
+
+    @property
+    def key(self) -> str:
+        return f"{self.app_label}.{self.model_name}:{self.view}"
+
+
+@receiver(post_save, sender=PromptOverride)
+@receiver(post_delete, sender=PromptOverride)
+def invalidate_overrides(sender, **kwargs):
+    from .prompts import bump_overrides_version
+
+    # Processes reloading the overrides earlier would cache the old rows
+    transaction.on_commit(bump_overrides_version)
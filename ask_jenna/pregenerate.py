@@ -0,0 +1,206 @@
+"""
+Generation of suggestions in the background.
+
+With ``ASK_JENNA_PREGENERATE`` listing prompt keys, saving an object with
+prompts for one of these views queues a :class:`~ask_jenna.models.SuggestionJob`
+per field. The ``ask_jenna_worker`` management command processes the queue
+and stores each suggestion like a generation from the admin, so pressing the
+button shows it at once. Saving the object again queues the fields again.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+import httpx
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import models, transaction
+from django.db.models import Q
+from django.http import HttpRequest
+from django.test import RequestFactory
+from django.utils import timezone
+
+from . import cache, config, llm, routing
+from .client import LLMError
+from .models import SuggestionJob
+from .prompts import parse_key, prompts
+from .signals import generation_finished
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_views(model: type[models.Model]) -> list[str]:
+    """Return the admin views of ``model`` to generate suggestions for."""
+    opts = model._meta
+    views = []
+    for key in config.ASK_JENNA_PREGENERATE:
+        app_label, model_name, view = parse_key(key)
+        if app_label not in ("*", opts.app_label):
+            continue
+        if model_name not in ("*", opts.model_name):
+            continue
+        if view not in views:
+            views.append(view)
+    return views
+
+
+def enqueue(instance: models.Model, view: str | None = None) -> int:
+    """Queue the suggestions of ``instance``'s fields and return their number."""
+    opts = instance._meta
+    count = 0
+    for name in [view] if view else get_views(type(instance)):
+        for field in prompts.get_fields(opts.app_label, opts.model_name, name):
+            SuggestionJob.objects.update_or_create(
+                app_label=opts.app_label,
+                model_name=opts.model_name,
+                object_pk=str(instance.pk),
+                view=name,
+                field=field,
+                defaults={"status": SuggestionJob.Status.PENDING, "error": ""},
+            )
+            count += 1
+    return count
+
+
+def enqueue_on_save(sender, instance, raw=False, **kwargs):
+    """``post_save`` receiver queueing the suggestions of a saved object.
+
+    The jobs are queued once the transaction commits, so workers do not
+    generate from a state that may still be rolled back.
+    """
+    if not config.ASK_JENNA_PREGENERATE or raw:
+        return
+    if sender._meta.app_label == "ask_jenna":
+        return
+    if get_views(sender):
+        transaction.on_commit(lambda: enqueue(instance))
+
+
+def claim(limit: int = 10, stale_after: int = 600) -> list[SuggestionJob]:
+    """Mark up to ``limit`` pending jobs as running and return them.
+
+    Jobs left running for more than ``stale_after`` seconds, e.g. by a worker
+    that was killed, are claimed again. Rows locked by another worker are
+    skipped where the database supports it.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        queryset = SuggestionJob.objects.filter(
+            Q(status=SuggestionJob.Status.PENDING)
+            | Q(
+                status=SuggestionJob.Status.RUNNING,
+                updated_at__lt=now - timedelta(seconds=stale_after),
+            )
+        )
+        jobs = list(queryset.select_for_update(skip_locked=True)[:limit])
+        for job in jobs:
+            job.status = SuggestionJob.Status.RUNNING
+            job.attempts += 1
+            job.updated_at = now
+        SuggestionJob.objects.bulk_update(jobs, ["status", "attempts", "updated_at"])
+    return jobs
+
+
+def get_worker_request(user=None) -> HttpRequest:
+    """Return a request rendering dynamic content on behalf of ``user``.
+
+    The user is passed on to the pages rendered in-process (see
+    :func:`~ask_jenna.preview.render_url`); no login or session is involved.
+    Without a user, dynamic content pointing to pages that require a login
+    cannot be rendered.
+    """
+    hosts = [host for host in settings.ALLOWED_HOSTS if "*" not in host]
+    request = RequestFactory().get(
+        "/", SERVER_NAME=hosts[0].lstrip(".") if hosts else "localhost"
+    )
+    request.user = AnonymousUser() if user is None else user
+    return request
+
+
+def finish(job: SuggestionJob, **values) -> bool:
+    """Store the outcome of ``job`` unless it was queued again meanwhile."""
+    return bool(
+        SuggestionJob.objects.filter(
+            pk=job.pk, status=SuggestionJob.Status.RUNNING
+        ).update(**values)
+    )
+
+
+def process(job: SuggestionJob, request: HttpRequest) -> bool:
+    """Generate the suggestion of ``job``; return whether it succeeded.
+
+    Jobs whose object or prompt no longer exists are deleted.
+    """
+    from .preview import get_content  # Pulls in the markdown converter
+
+    try:
+        model = apps.get_model(job.app_label, job.model_name)
+        instance = model._default_manager.get(pk=job.object_pk)
+    except (LookupError, models.ObjectDoesNotExist, ValueError):
+        job.delete()
+        return False
+    field_prompt = prompts.get_fields(job.app_label, job.model_name, job.view).get(
+        job.field
+    )
+    if field_prompt is None:
+        job.delete()
+        return False
+
+    try:
+        resolved = prompts.resolve(job.key, job.field, field_prompt, instance)
+        content = get_content(request, resolved.get("dynamic_content"))
+    except ValueError as e:
+        logger.warning("Generating %s %s failed: %s", job.key, job.field, e)
+        finish(job, status=SuggestionJob.Status.FAILED, error=str(e))
+        return False
+    prompt = resolved["prompt"]
+    options = llm.get_options(model=routing.get_model(field_prompt))
+    messages = llm.get_messages(prompt, content)
+    tags = {"key": job.key, "field": job.field, "model": options["model"]}
+    started = time.monotonic()
+    text = cache.get_response(prompt, content, options)
+    cached = text is not None
+    try:
+        if text is None:
+            text = llm.complete(messages, **options)
+    except (httpx.HTTPError, LLMError, ValueError) as e:
+        logger.warning("Generating %s %s failed: %s", job.key, job.field, e)
+        generation_finished.send(
+            sender=llm.Generation, **tags, **llm.get_stats(started, error=str(e))
+        )
+        finish(job, status=SuggestionJob.Status.FAILED, error=str(e))
+        return False
+    usage = None
+    if not cached:
+        cache.set_response(prompt, content, options, text)
+        usage = llm.estimate_usage(messages, text)
+    generation_finished.send(
+        sender=llm.Generation, **tags, **llm.get_stats(started, usage, cached=cached)
+    )
+    finish(
+        job,
+        status=SuggestionJob.Status.DONE,
+        response_key=cache.get_response_key(prompt, content, options),
+        result=text,
+        error="",
+    )
+    return True
+
+
+def get_result(prompt: str, content: str | None, options: dict) -> str | None:
+    """Return a suggestion generated in the background for this request.
+
+    The result of a job queued again is still returned while the model,
+    prompt and content it was generated from have not changed.
+    """
+    return (
+        SuggestionJob.objects.filter(
+            response_key=cache.get_response_key(prompt, content, options)
+        )
+        .values_list("result", flat=True)
+        .first()
+    )
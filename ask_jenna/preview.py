@@ -0,0 +1,181 @@
+"""
+Server-side preview extraction.
+
+Renders an object's preview in-process and condenses it into markdown with
+:class:`cms_mcp.markdown.SemanticIndex`, so the browser only receives the
+compact text it sends to the LLM.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any
+
+from django.core.handlers.base import BaseHandler
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+from django.urls import NoReverseMatch, reverse
+from django.utils.cache import quote_etag
+from django.utils.translation import get_language
+
+from cms_mcp.markdown import SemanticIndex
+
+from .cache import get_cache
+from .config import ASK_JENNA_PREVIEW_TIMEOUT
+
+
+#: Model fields that change whenever an object is modified
+REVISION_FIELDS = ("changed_date", "updated_at", "modified", "modified_at")
+
+
+def get_preview_url(instance: models.Model, language: str | None = None) -> str:
+    """Return the URL rendering a preview of ``instance``.
+
+    Frontend-editable django CMS models use the CMS preview endpoint, all
+    other models their ``get_absolute_url``.
+    """
+    try:
+        from cms.toolbar.utils import get_object_preview_url
+        from cms.utils.helpers import is_editable_model
+    except ImportError:  # pragma: no cover - django CMS is optional here
+        pass
+    else:
+        if is_editable_model(instance.__class__):
+            return get_object_preview_url(instance, language)
+    return instance.get_absolute_url()
+
+
+def get_content_url(instance: models.Model) -> str:
+    """Return the URL of the markdown preview of ``instance``.
+
+    Falls back to the (HTML) preview URL if the ``ask_jenna`` URLs are not
+    installed.
+    """
+    opts = instance._meta
+    try:
+        return reverse(
+            "ask_jenna:preview_content",
+            kwargs={
+                "app_label": opts.app_label,
+                "model_name": opts.model_name,
+                "pk": instance.pk,
+            },
+        )
+    except NoReverseMatch:
+        return get_preview_url(instance)
+
+
+def get_revision(instance: models.Model) -> str:
+    """Return a stamp that changes whenever the rendered object changes.
+
+    Combines the object's modification date with django CMS' page cache
+    version, which is bumped when plugins inside its placeholders change.
+    """
+    stamp = []
+    for name in REVISION_FIELDS:
+        value = getattr(instance, name, None)
+        if value is not None:
+            stamp.append(str(value))
+            break
+    try:
+        from cms.cache import _get_cache_version
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        if instance._meta.app_label == "cms":
+            stamp.append(str(_get_cache_version()))
+    return ":".join(stamp)
+
+
+def get_preview_etag(instance: models.Model, language: str) -> str | None:
+    """Return the ETag of an object's preview, or None if it is not versioned."""
+    revision = get_revision(instance)
+    if not revision:
+        return None
+    opts = instance._meta
+    stamp = f"{opts.app_label}.{opts.model_name}:{instance.pk}:{language}:{revision}"
+    return quote_etag(hashlib.sha256(stamp.encode()).hexdigest()[:32])
+
+
+@lru_cache(maxsize=None)
+def get_handler() -> BaseHandler:
+    handler = BaseHandler()
+    handler.load_middleware()
+    return handler
+
+
+def render_url(request: HttpRequest, url: str) -> HttpResponse:
+    """Render ``url`` in-process on behalf of the user of ``request``.
+
+    The sub-request runs through the full middleware stack with the
+    original request's cookies and user, so authentication and the toolbar
+    behave as if the browser had requested the page.
+    """
+    subrequest = RequestFactory().get(
+        url,
+        HTTP_HOST=request.get_host(),
+        HTTP_COOKIE=request.META.get("HTTP_COOKIE", ""),
+        HTTP_ACCEPT_LANGUAGE=request.META.get("HTTP_ACCEPT_LANGUAGE", ""),
+        secure=request.is_secure(),
+    )
+    if hasattr(request, "user"):
+        # AuthenticationMiddleware uses the user cached on the request instead
+        # of loading it from the session, which workers do not save
+        subrequest._cached_user = subrequest._acached_user = request.user
+    response = get_handler().get_response(subrequest)
+    if response.status_code != 200:
+        raise ValueError(f"Rendering {url} failed with status {response.status_code}")
+    return response
+
+
+def get_text(response: HttpResponse) -> str:
+    if response.streaming:
+        content = b"".join(response.streaming_content)
+    else:
+        content = response.content
+    return content.decode(response.charset or "utf-8")
+
+
+def get_content(request: HttpRequest, value: Any) -> str | None:
+    """Turn a resolved ``dynamic_content`` value into text for the LLM.
+
+    Local URLs (e.g. from :func:`get_content_url`) are rendered in-process
+    and reduced to markdown, other values are passed on as text or JSON.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        if value.startswith("/") and not value.startswith("//"):
+            response = render_url(request, value)
+            if response.get("Content-Type", "").startswith("text/markdown"):
+                return get_text(response)
+            return SemanticIndex(get_text(response)).to_markdown()
+        return value
+    return json.dumps(value, cls=DjangoJSONEncoder)
+
+
+def get_preview_markdown(
+    request: HttpRequest, instance: models.Model, language: str | None = None
+) -> tuple[str, str]:
+    """Return the preview of ``instance`` as markdown together with its ETag.
+
+    Versioned objects are cached by their ETag, i.e. by object, language
+    and revision.
+    """
+    language = getattr(instance, "language", None) or language or get_language()
+    etag = get_preview_etag(instance, language)
+    cache_key = f"ask_jenna:preview:{etag}"
+    if etag:
+        markdown = get_cache().get(cache_key)
+        if markdown is not None:
+            return markdown, etag
+
+    html = get_text(render_url(request, get_preview_url(instance, language)))
+    markdown = SemanticIndex(html).to_markdown()
+    if etag:
+        get_cache().set(cache_key, markdown, ASK_JENNA_PREVIEW_TIMEOUT)
+    else:
+        etag = quote_etag(hashlib.sha256(markdown.encode()).hexdigest()[:32])
+    return markdown, etag
@@ -1,70 +1,445 @@
 from importlib import import_module
-import logging
+import hashlib
+import inspect
+import json
+import threading
+import time
+import uuid
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from asgiref.sync import async_to_sync, sync_to_async
 
 from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.template import Context, Template
+from django.utils.module_loading import module_has_submodule
+from django.utils.translation import get_language
 
+from .cache import get_cache
+from .config import ASK_JENNA_DYNAMIC_CONTENT_TIMEOUT
+from .signals import prompt_resolved
 
-logger = logging.getLogger(__name__)
 
+_unset = object()
 
-class Prompts:
-    def __init__(self):
-        self.prompts = {}
 
-    def register(self, prompt):
-        self.prompts.update(prompt)
+def freeze(field_prompt: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only copy of a field prompt spec."""
+    return MappingProxyType(dict(field_prompt))
 
-    def get(
-        self, view, opts: models.options.Options, instance: models.Model | None = None
+
+def parse_key(key: str) -> tuple[str, str, str]:
+    """Split a ``"{app_label}.{model_name}:{view}"`` key into its parts.
+
+    The model may be a pattern: ``"{app_label}.*"`` matches all models of an
+    app, ``"*"`` all models.
+    """
+    model, _, view = key.partition(":")
+    if model == "*":
+        model = "*.*"
+    app_label, _, model_name = model.partition(".")
+    if (
+        not (app_label and model_name and view)
+        or "*" in view
+        or any("*" in part and part != "*" for part in (app_label, model_name))
+        or (app_label == "*" and model_name != "*")
     ):
-        key = f"{opts.app_label}.{opts.model_name}:{view}"
-        print(f"Fetching prompt for key: {key}")
-        prompt = self.prompts.get(key, {})
-        for field, field_prompt in prompt.items():
-            if callable(field_prompt.get("dynamic_content")):
-                field_prompt["dynamic_content"] = field_prompt["dynamic_content"](
-                    instance
+        raise ImproperlyConfigured(
+            f"Invalid prompt key {key!r}, expected '<app_label>.<model_name>:<view>'"
+        )
+    return app_label, model_name.lower(), view
+
+
+def validate(field_prompt: Mapping[str, Any], value: Any) -> Any:
+    """Check a generated value against the field's ``type`` and ``length``.
+
+    Text fields (the default) need a string of at most ``length`` characters,
+    ``number`` and ``boolean`` fields a JSON number or boolean. Raises
+    :exc:`ValueError` if the value does not fit.
+    """
+    kind = field_prompt.get("type", "text")
+    if kind == "number":
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            raise ValueError("Expected a number")
+    elif kind == "boolean":
+        if not isinstance(value, bool):
+            raise ValueError("Expected a boolean")
+    else:
+        if not isinstance(value, str):
+            raise ValueError("Expected a string")
+        value = value.strip()
+        length = field_prompt.get("length")
+        if length and len(value) > length:
+            raise ValueError(f"Longer than {length} characters")
+    return value
+
+
+def parse_value(field_prompt: Mapping[str, Any], text: str) -> Any:
+    """Decode a generated suggestion the way the admin does.
+
+    JSON is decoded and unwrapped from objects with a single key and lists
+    with a single item; other text is taken as it is. Text fields keep JSON
+    numbers and booleans as text.
+    """
+    try:
+        value = json.loads(text)
+    except ValueError:
+        return text
+    while isinstance(value, dict | list) and len(value) == 1:
+        value = next(iter(value.values())) if isinstance(value, dict) else value[0]
+    if field_prompt.get("type", "text") == "text" and not isinstance(
+        value, str | dict | list
+    ):
+        return text
+    return value
+
+
+OVERRIDES_VERSION_KEY = "ask_jenna:prompt_overrides:version"
+
+
+def get_overrides_version() -> str:
+    """Return the token identifying the current state of the prompt overrides."""
+    cache = get_cache()
+    version = cache.get(OVERRIDES_VERSION_KEY)
+    if version is None:
+        # Unknown after a cache flush: make every process reload
+        version = uuid.uuid4().hex
+        if not cache.add(OVERRIDES_VERSION_KEY, version, None):
+            version = cache.get(OVERRIDES_VERSION_KEY, version)
+    return version
+
+
+def bump_overrides_version() -> None:
+    get_cache().set(OVERRIDES_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+class Prompts:
+    """Registry of admin prompts.
+
+    Registered specs are frozen: resolving a prompt for a request never writes
+    back into the registry, so one registry can serve concurrent requests.
+
+    Keys may be patterns (``"cms.*:change_view"``, ``"*:add_view"``). On the
+    first lookup after a registration all keys are compiled into a flat table
+    indexed by ``(app_label, model_name, view)``. For each model the field specs of
+    ``*``, ``{app_label}.*``, the model's parents and the model itself are
+    merged in this order, field by field, so more specific keys override (or,
+    with ``None``, remove) single fields or single options of a field.
+
+    With ``autodiscover=True`` the ``PROMPTS`` of all installed apps'
+    ``ask_jenna`` modules are registered on first use of the registry.
+    Explicitly registered keys take precedence over discovered ones.
+
+    With ``overrides=True`` enabled :class:`~ask_jenna.models.PromptOverride`
+    objects are merged over the registered specs. They are kept in memory and
+    only reloaded when the version token in the cache changed.
+    """
+
+    def __init__(self, autodiscover: bool = False, overrides: bool = False):
+        self.prompts: dict[tuple[str, str, str], Mapping[str, Mapping[str, Any]]] = {}
+        self._patterns: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._registered: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._stale = False  # Registrations not compiled yet
+        self._overrides: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._overrides_version = None if overrides else _unset
+        self._templates: dict[str, Template] = {}
+        self._discovered = not autodiscover
+        self._lock = threading.RLock()
+        #: Incremented whenever the registered prompts change
+        self.version = 0
+
+    def autodiscover(self) -> None:
+        if self._discovered:
+            return
+        with self._lock:
+            if self._discovered:
+                return
+            for app_config in apps.get_app_configs():
+                if module_has_submodule(app_config.module, "ask_jenna"):
+                    module = import_module(f"{app_config.name}.ask_jenna")
+                    self._add(self._patterns, getattr(module, "PROMPTS", {}))
+            self._stale = True
+            self._discovered = True
+
+    def _update(self) -> None:
+        """Discover the apps' prompts and compile pending registrations."""
+        self.autodiscover()
+        if self._stale:
+            with self._lock:
+                if self._stale:
+                    self._compile()
+
+    def _add(self, patterns, prompt):
+        for key, fields in prompt.items():
+            patterns[parse_key(key)] = dict(fields)
+
+    def _get_chain(
+        self, app_label: str, model_name: str, view: str
+    ) -> list[tuple[str, str, str]]:
+        """Return the keys applying to a model, least specific first."""
+        chain = [("*", "*", view), (app_label, "*", view)]
+        try:
+            opts = apps.get_model(app_label, model_name)._meta
+        except LookupError:
+            pass
+        else:
+            chain += [
+                (parent._meta.app_label, parent._meta.model_name, view)
+                for parent in reversed(opts.get_parent_list())
+            ]
+        chain.append((app_label, model_name, view))
+        return chain
+
+    def refresh(self) -> None:
+        """Reload the prompt overrides if they changed since the last check.
+
+        Costs a single cache read; the database is only queried after an
+        override was edited.
+        """
+        if self._overrides_version is _unset:
+            return
+        version = get_overrides_version()
+        if version == self._overrides_version:
+            return
+        from .models import PromptOverride
+
+        with self._lock:
+            if version == self._overrides_version:
+                return
+            overrides = {}
+            for override in PromptOverride.objects.filter(enabled=True):
+                overrides.setdefault(parse_key(override.key), {})[override.field] = (
+                    override.as_field_prompt()
                 )
-            field_prompt["prompt"] = Template(field_prompt["prompt"]).render(
-                Context(
+            self._overrides = overrides
+            self._compile()
+            self._overrides_version = version
+
+    def _get_patterns(self) -> dict[tuple[str, str, str], dict[str, Any]]:
+        patterns = {
+            key: dict(fields)
+            for key, fields in {**self._patterns, **self._registered}.items()
+        }
+        for key, fields in self._overrides.items():
+            for field, field_prompt in fields.items():
+                specs = patterns.setdefault(key, {})
+                specs[field] = {**(specs.get(field) or {}), **field_prompt}
+        return patterns
+
+    def _compile(self):
+        patterns = self._get_patterns()
+        views = {view for *_, view in patterns}
+        targets = {key for key in patterns if "*" not in key}
+        targets.update(
+            (model._meta.app_label, model._meta.model_name, view)
+            for model in apps.get_models()
+            for view in views
+        )
+        table = {}
+        for target in targets:
+            fields = {}
+            for key in self._get_chain(*target):
+                for field, field_prompt in patterns.get(key, {}).items():
+                    if field_prompt is None:
+                        fields.pop(field, None)
+                    else:
+                        fields[field] = {**fields.get(field, {}), **field_prompt}
+            if fields:
+                for field_prompt in fields.values():
+                    self._get_template(field_prompt.get("prompt", ""))
+                table[target] = MappingProxyType(
                     {
-                        "instance": instance,
-                        **field_prompt,
+                        field: freeze(field_prompt)
+                        for field, field_prompt in fields.items()
                     }
                 )
+        # Swap the table in one step; concurrent lookups see the old or new one
+        self.prompts = table
+        self.version += 1
+        self._stale = False
+
+    def _get_template(self, source: str) -> Template:
+        if source not in self._templates:
+            self._templates[source] = Template(source)
+        return self._templates[source]
+
+    def register(self, prompt):
+        # Only recorded, so apps may register before the app registry is ready
+        with self._lock:
+            self._add(self._registered, prompt)
+            self._stale = True
+
+    def unregister(self, key: str):
+        with self._lock:
+            self._registered.pop(parse_key(key), None)
+            self._patterns.pop(parse_key(key), None)
+            self._stale = True
+
+    def resolve(
+        self,
+        key: str,
+        field: str,
+        field_prompt: Mapping[str, Any],
+        instance: models.Model | None = None,
+        lazy: bool = False,
+        dynamic_content: Any = _unset,
+    ) -> dict[str, Any]:
+        """Resolve a single field prompt into a new, per-request dict.
+
+        With ``lazy=True`` a callable ``dynamic_content`` is not evaluated. The
+        field is marked as ``deferred`` instead; :func:`ask_jenna.views.generate`
+        resolves it on the server once a suggestion is requested.
+        """
+        started = time.monotonic()
+        resolved = dict(field_prompt)
+        if dynamic_content is not _unset:
+            resolved["dynamic_content"] = dynamic_content
+        elif callable(resolved.get("dynamic_content")):
+            if lazy:
+                resolved["dynamic_content"] = None
+                resolved["deferred"] = True
+            else:
+                resolved["dynamic_content"] = self.get_dynamic_content(
+                    key, field, instance
+                )
+        resolved["prompt"] = self._get_template(resolved.get("prompt", "")).render(
+            Context(
+                {
+                    "instance": instance,
+                    **resolved,
+                }
             )
-        return prompt
+        )
+        prompt_resolved.send(
+            sender=self.__class__,
+            key=key,
+            field=field,
+            duration=time.monotonic() - started,
+            deferred=resolved.get("deferred", False),
+        )
+        return resolved
+
+    def _cache_key(self, key: str, field: str, instance: models.Model | None) -> str:
+        """Return the cache key of a field's dynamic content for an object
+        version, like the cached script blocks, and the active language."""
+        from .preview import get_revision
+
+        pk = getattr(instance, "pk", None)
+        revision = get_revision(instance) if pk is not None else ""
+        stamp = hashlib.sha256(f"{pk}:{revision}".encode()).hexdigest()[:32]
+        return f"ask_jenna:dynamic_content:{key}:{field}:{stamp}:{get_language()}"
+
+    def _get_timeout(self, field_prompt: Mapping[str, Any]) -> int:
+        return field_prompt.get(
+            "dynamic_content_timeout", ASK_JENNA_DYNAMIC_CONTENT_TIMEOUT
+        )
+
+    def get_dynamic_content(
+        self, key: str, field: str, instance: models.Model | None = None
+    ) -> Any:
+        """Evaluate the ``dynamic_content`` callable of a field.
+
+        Synchronous counterpart of :meth:`aget_dynamic_content`.
+        """
+        self._update()
+        field_prompt = self.prompts[parse_key(key)][field]
+        func = field_prompt.get("dynamic_content")
+        if not callable(func):
+            return func
 
-    def all(self):
-        return self.prompts
+        timeout = self._get_timeout(field_prompt)
+        cache_key = self._cache_key(key, field, instance)
+        if timeout:
+            value = get_cache().get(cache_key, _unset)
+            if value is not _unset:
+                return value
+
+        if inspect.iscoroutinefunction(func):
+            value = async_to_sync(func)(instance)
+        else:
+            value = func(instance)
+
+        if timeout:
+            get_cache().set(cache_key, value, timeout)
+        return value
+
+    async def aget_dynamic_content(
+        self, key: str, field: str, instance: models.Model | None = None
+    ) -> Any:
+        """Evaluate the ``dynamic_content`` callable of a field.
+
+        Both plain and async callables are supported. If the field spec (or
+        ``ASK_JENNA_DYNAMIC_CONTENT_TIMEOUT``) sets a positive
+        ``dynamic_content_timeout``, the result is cached per prompt field,
+        object version and language for that many seconds.
+        """
+        self._update()
+        field_prompt = self.prompts[parse_key(key)][field]
+        func = field_prompt.get("dynamic_content")
+        if not callable(func):
+            return func
+
+        timeout = self._get_timeout(field_prompt)
+        cache_key = self._cache_key(key, field, instance)
+        if timeout:
+            value = await get_cache().aget(cache_key, _unset)
+            if value is not _unset:
+                return value
+
+        if inspect.iscoroutinefunction(func):
+            value = await func(instance)
+        else:
+            value = await sync_to_async(func)(instance)
+            if inspect.isawaitable(value):
+                value = await value
+
+        if timeout:
+            await get_cache().aset(cache_key, value, timeout)
+        return value
+
+    def get_version(self) -> int:
+        """Return the version of the registered prompts, reloading overrides."""
+        self._update()
+        self.refresh()
+        return self.version
+
+    def get_fields(
+        self, app_label: str, model_name: str, view: str
+    ) -> Mapping[str, Mapping[str, Any]]:
+        """Return the field prompt specs of a model's admin view."""
+        self._update()
+        self.refresh()
+        return self.prompts.get((app_label, model_name, view), {})
+
+    def get(
+        self,
+        view,
+        opts: models.options.Options,
+        instance: models.Model | None = None,
+        lazy: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        key = f"{opts.app_label}.{opts.model_name}:{view}"
+        prompt = self.get_fields(opts.app_label, opts.model_name, view)
+        return {
+            field: self.resolve(key, field, field_prompt, instance, lazy=lazy)
+            for field, field_prompt in prompt.items()
+        }
+
+    def all(self) -> Mapping[str, Mapping[str, Mapping[str, Any]]]:
+        self._update()
+        self.refresh()
+        return MappingProxyType(
+            {
+                f"{app_label}.{model_name}:{view}": fields
+                for (app_label, model_name, view), fields in self.prompts.items()
+            }
+        )
 
     def __bool__(self):
+        self._update()
         return bool(self.prompts)
 
 
-prompts = Prompts()
-
-if not prompts:
-    for app_config in apps.get_app_configs():
-        # Attempt to import the app's module.
-        try:
-            module = import_module("{}.{}".format(app_config.name, "ask_jenna"))
-            for name, prompt in module.__dict__.items():
-                if isinstance(prompt, dict):
-                    # Register the prompt
-                    prompts.register(prompt)
-        except (ImportError, AttributeError):
-            # Handle import errors or attribute errors gracefully
-            # This is useful for apps that may not have the ask_jenna module
-            # or if the module does not contain the expected attributes.
-            pass
-        # Catch any other exceptions that might occur during import
-        except Exception as e:
-            logger.exception(
-                f"Error importing prompts from {app_config.name}.ask_jenna",
-                exc_info=e,
-                stack_info=True,
-                stacklevel=2,
-            )
+prompts = Prompts(autodiscover=True, overrides=True)
@@ -0,0 +1,206 @@
+"""
+Replay of recorded LLM responses.
+
+With ``ASK_JENNA_SERVICE = "replay"`` no provider is called. Requests are
+answered from the JSON file ``ASK_JENNA_REPLAY_FILE`` mapping a hash of the
+messages and sampling options (see :func:`get_request_key`) to the text of
+the response; a ``"*"`` entry answers all other requests. The time until the
+first text and the rate text is streamed with are simulated, so load tests
+and benchmarks of concurrency, caching and streaming run offline and
+reproducibly.
+
+Recordings are made by running with a real provider and
+``ASK_JENNA_REPLAY_RECORD = True``.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from . import config, llm
+
+
+def get_request_key(messages: list[dict[str, str]], options: dict[str, Any]) -> str:
+    """Return the hash identifying a request's response in the recordings."""
+    data = json.dumps(
+        {"messages": messages, **options}, sort_keys=True, cls=DjangoJSONEncoder
+    )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class Recordings:
+    """Response texts by request key, stored in a JSON file."""
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        self._data: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def data(self) -> dict[str, str]:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    if self.path.exists():
+                        self._data = json.loads(self.path.read_text())
+                    else:
+                        self._data = {}
+        return self._data
+
+    def get(self, key: str) -> str | None:
+        return self.data.get(key, self.data.get("*"))
+
+    def record(self, key: str, text: str) -> None:
+        data = self.data
+        with self._lock:
+            data[key] = text
+            # Replace the file at once, so readers never see half of it
+            tmp = self.path.with_name(f"{self.path.name}.tmp")
+            tmp.write_text(json.dumps(data, indent=2, sort_keys=True))
+            tmp.replace(self.path)
+
+
+def split_tokens(text: str) -> list[str]:
+    """Split ``text`` into the words it is streamed in."""
+    return re.findall(r"\s*\S+|\s+", text)
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Answer chat completions of :class:`~ask_jenna.llm.ReplayProvider`.
+
+    Responses follow the OpenAI format. ``latency`` is the time in seconds
+    until the first text, ``token_rate`` the tokens per second text is
+    generated with (``0`` for no delay).
+    """
+
+    def __init__(
+        self, recordings: Recordings, latency: float = 0, token_rate: float = 0
+    ):
+        self.recordings = recordings
+        self.latency = latency
+        self.token_rate = token_rate
+
+    def get_delay(self, text: str) -> float:
+        return llm.count_tokens(text) / self.token_rate if self.token_rate else 0
+
+    def get_reply(self, request: httpx.Request) -> tuple[bool, str | None, dict]:
+        payload = json.loads(request.content)
+        stream = payload.pop("stream", False)
+        messages = payload.pop("messages")
+        text = self.recordings.get(get_request_key(messages, payload))
+        usage = {
+            "prompt_tokens": sum(llm.count_tokens(m["content"]) for m in messages),
+            "completion_tokens": llm.count_tokens(text or ""),
+        }
+        return stream, text, usage
+
+    def get_missing_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            404,
+            json={"error": {"message": "No recorded response for the request"}},
+            request=request,
+        )
+
+    def get_response(self, text: str, usage: dict) -> httpx.Response:
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": text}}], "usage": usage}
+        )
+
+    def get_events(self, text: str, usage: dict) -> Iterator[tuple[float, bytes]]:
+        """Yield the events of a stream with the delay before each."""
+        delay = self.latency
+        for token in split_tokens(text):
+            chunk = {"choices": [{"delta": {"content": token}}]}
+            yield delay, f"data: {json.dumps(chunk)}\n\n".encode()
+            delay = self.get_delay(token)
+        chunk = {"choices": [], "usage": usage}
+        yield delay, f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        stream, text, usage = self.get_reply(request)
+        if text is None:
+            return self.get_missing_response(request)
+        if not stream:
+            time.sleep(self.latency + self.get_delay(text))
+            return self.get_response(text, usage)
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            stream=EventStream(self.get_events(text, usage)),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stream, text, usage = self.get_reply(request)
+        if text is None:
+            return self.get_missing_response(request)
+        if not stream:
+            await asyncio.sleep(self.latency + self.get_delay(text))
+            return self.get_response(text, usage)
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            stream=AsyncEventStream(self.get_events(text, usage)),
+        )
+
+
+class EventStream(httpx.SyncByteStream):
+    def __init__(self, events: Iterator[tuple[float, bytes]]):
+        self.events = events
+
+    def __iter__(self) -> Iterator[bytes]:
+        for delay, event in self.events:
+            if delay:
+                time.sleep(delay)
+            yield event
+
+
+class AsyncEventStream(httpx.AsyncByteStream):
+    def __init__(self, events: Iterator[tuple[float, bytes]]):
+        self.events = events
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for delay, event in self.events:
+            if delay:
+                await asyncio.sleep(delay)
+            yield event
+
+
+_recordings: Recordings | None = None
+_recordings_lock = threading.Lock()
+
+
+def get_recordings() -> Recordings:
+    """Return the recordings of ``ASK_JENNA_REPLAY_FILE`` to record to."""
+    global _recordings
+    with _recordings_lock:
+        if _recordings is None or _recordings.path != Path(
+            config.ASK_JENNA_REPLAY_FILE
+        ):
+            _recordings = Recordings(config.ASK_JENNA_REPLAY_FILE)
+        return _recordings
+
+
+def get_transport() -> ReplayTransport:
+    """Return a transport replaying the current ``ASK_JENNA_REPLAY_FILE``."""
+    return ReplayTransport(
+        Recordings(config.ASK_JENNA_REPLAY_FILE),
+        latency=config.ASK_JENNA_REPLAY_LATENCY,
+        token_rate=config.ASK_JENNA_REPLAY_TOKEN_RATE,
+    )
+
+
+def record(messages: list[dict[str, str]], options: dict[str, Any], text: str) -> None:
+    """Record a provider's response if ``ASK_JENNA_REPLAY_RECORD`` is set."""
+    if config.ASK_JENNA_REPLAY_RECORD and config.ASK_JENNA_SERVICE != "replay" and text:
+        get_recordings().record(get_request_key(messages, options), text)
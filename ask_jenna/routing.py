@@ -0,0 +1,108 @@
+"""
+Choice of the model generating a field.
+
+A field prompt may name its ``model``. Otherwise the first rule of
+``ASK_JENNA_ROUTES`` matching the field's ``type`` and ``length`` decides,
+e.g. sending short fields to a small, fast model::
+
+    ASK_JENNA_ROUTES = [
+        {"max_length": 80, "model": "gpt-4o-mini"},
+        {"model": "gpt-4o", "max_latency": 5, "fallback_model": "gpt-4o-mini"},
+    ]
+
+With ``max_latency`` (in seconds) and ``fallback_model`` a rule switches to
+the fallback model while the observed latency of its model is too high.
+Every ``ASK_JENNA_LATENCY_PROBE_INTERVAL`` seconds one request is still sent
+to the slow model to measure its latency again.
+"""
+
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from . import config
+
+
+class LatencyTracker:
+    """Exponentially weighted moving average of each model's latency.
+
+    Latency is the time until a streamed completion's first text arrives.
+    """
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self.latencies: dict[str, float] = {}
+        self.measured_at: dict[str, float] = {}  # Or probed at
+        self._lock = threading.Lock()
+
+    def observe(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self.measured_at[model] = time.monotonic()
+            previous = self.latencies.get(model)
+            if previous is None:
+                self.latencies[model] = seconds
+            else:
+                self.latencies[model] = previous + self.alpha * (seconds - previous)
+
+    def get(self, model: str) -> float | None:
+        return self.latencies.get(model)
+
+    def probe(self, model: str, interval: float) -> bool:
+        """Return whether to measure ``model`` again, once per ``interval``."""
+        with self._lock:
+            now = time.monotonic()
+            if not interval or now - self.measured_at.get(model, now) < interval:
+                return False
+            self.measured_at[model] = now
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self.latencies.clear()
+            self.measured_at.clear()
+
+
+latency = LatencyTracker()
+
+
+def matches(rule: Mapping[str, Any], field_prompt: Mapping[str, Any]) -> bool:
+    if "type" in rule and rule["type"] != field_prompt.get("type", "text"):
+        return False
+    if "max_length" in rule:
+        length = field_prompt.get("length")
+        return bool(length) and length <= rule["max_length"]
+    return True
+
+
+def get_rule(field_prompt: Mapping[str, Any]) -> Mapping[str, Any]:
+    if field_prompt.get("model"):
+        return field_prompt
+    for rule in config.ASK_JENNA_ROUTES:
+        if matches(rule, field_prompt):
+            return rule
+    return {}
+
+
+def get_model(field_prompt: Mapping[str, Any]) -> str:
+    """Return the model generating a field."""
+    rule = get_rule(field_prompt)
+    model = rule.get("model") or config.ASK_JENNA_MODEL
+    fallback, max_latency = rule.get("fallback_model"), rule.get("max_latency")
+    if fallback and max_latency and (latency.get(model) or 0) > max_latency:
+        if not latency.probe(model, config.ASK_JENNA_LATENCY_PROBE_INTERVAL):
+            return fallback
+    return model
+
+
+def get_fields_model(field_prompts: Iterable[Mapping[str, Any]]) -> str:
+    """Return the model generating several fields in one request.
+
+    The request is routed like a single field as long as all fields together.
+    """
+    field_prompts = list(field_prompts)
+    models = {field_prompt.get("model") for field_prompt in field_prompts}
+    if len(models) == 1 and None not in models:
+        return get_model(field_prompts[0])
+    lengths = [field_prompt.get("length") for field_prompt in field_prompts]
+    return get_model({"length": sum(lengths) if all(lengths) else None})
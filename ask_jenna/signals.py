@@ -0,0 +1,22 @@
+"""
+Signals sent while prompts are resolved and suggestions generated.
+
+``prompt_resolved``
+    Sent by :meth:`ask_jenna.prompts.Prompts.resolve` with ``key``, ``field``,
+    ``duration`` (seconds) and ``deferred``.
+
+``generation_finished``
+    Sent once a suggestion was generated, served from the cache or failed,
+    with ``key``, ``field`` (``None`` when filling all fields), ``model``,
+    ``duration`` and ``latency`` (seconds until the first text, if streamed),
+    ``prompt_tokens``, ``completion_tokens``, ``cached`` and ``error`` (the
+    error message or ``None``). Token counts are the provider's where it
+    reports them and estimated otherwise. Also sent for the suggestions of
+    the ``ask_jenna_worker`` and ``ask_jenna_generate`` commands.
+"""
+
+from django.dispatch import Signal
+
+
+prompt_resolved = Signal()
+generation_finished = Signal()
@@ -1,37 +1,120 @@
+import hashlib
+
 from django import template
 from django.db import models
 from django.template.defaultfilters import json_script
+from django.urls import NoReverseMatch, reverse
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 
+from ask_jenna import config
+from ask_jenna.cache import get_cache
 from ask_jenna.prompts import prompts
 
 register = template.Library()
 
 
+def get_url(
+    name: str,
+    view: str,
+    opts: models.options.Options,
+    field: str | None,
+    instance: models.Model | None,
+) -> str | None:
+    kwargs = {
+        "app_label": opts.app_label,
+        "model_name": opts.model_name,
+        "view": view,
+    }
+    if field is not None:
+        kwargs["field"] = field
+    if instance is not None and instance.pk is not None:
+        kwargs["pk"] = instance.pk
+    try:
+        return reverse(f"ask_jenna:{name}", kwargs=kwargs)
+    except NoReverseMatch:
+        return None
+
+
+def get_scripts(
+    view: str, opts: models.options.Options, instance: models.Model | None
+) -> dict:
+    """Resolve the prompts for a change form, deferring dynamic content.
+
+    Dynamic content of saved objects is not evaluated: the endpoint
+    generating a suggestion resolves it on the server. If the ``ask_jenna``
+    URLs are not installed (or the object is not saved yet) it is resolved
+    right away. Each field gets the URLs generating its suggestion and
+    filling all fields at once.
+    """
+    lazy = instance is not None and instance.pk is not None
+    scripts = prompts.get(view, opts, instance, lazy=lazy)
+    generate_all = get_url("generate_all", view, opts, None, instance)
+    for field, field_prompt in scripts.items():
+        url = get_url("generate", view, opts, field, instance)
+        if url is None and field_prompt.get("deferred"):
+            return prompts.get(view, opts, instance)
+        field_prompt["generate"] = url
+        field_prompt["generate_all"] = generate_all
+    return scripts
+
+
+def get_scripts_cache_key(
+    view: str, opts: models.options.Options, instance: models.Model | None
+) -> str | None:
+    """Return the cache key of an object version's script block.
+
+    Returns None for unsaved objects and objects without a modification
+    stamp, whose script block is not cached.
+    """
+    from ask_jenna.preview import get_revision
+
+    if instance is None or instance.pk is None:
+        return None
+    revision = get_revision(instance)
+    if not revision:
+        return None
+    stamp = hashlib.sha256(f"{instance.pk}:{revision}".encode()).hexdigest()[:32]
+    return (
+        f"ask_jenna:scripts:{prompts.get_version()}:{opts.app_label}.{opts.model_name}:"
+        f"{view}:{stamp}:{get_language()}"
+    )
+
+
 @register.simple_tag
 def ask_jenna_scripts(
     view: str, opts: models.options.Options, instance: models.Model | None
 ) -> str:
-    if view and opts:
-        # Replace this with actual logic as needed
-        return json_script(prompts.get(view, opts, instance), "ask_jenna_scripts")
-    return ""
+    """Render the resolved prompts of a change form as a JSON script block.
+
+    The block is cached per object version (and language), so reloading an
+    unchanged object neither resolves nor renders its prompts again.
+    """
+    if not (view and opts):
+        return ""
+    cache_key = None
+    if config.ASK_JENNA_SCRIPTS_TIMEOUT:
+        cache_key = get_scripts_cache_key(view, opts, instance)
+    if cache_key is not None:
+        html = get_cache().get(cache_key)
+        if html is not None:
+            return mark_safe(html)
+    html = json_script(get_scripts(view, opts, instance), "ask_jenna_scripts")
+    if cache_key is not None:
+        get_cache().set(cache_key, str(html), config.ASK_JENNA_SCRIPTS_TIMEOUT)
+    return html
 
 
 @register.simple_tag
 def ask_jenna_config() -> str:
-    from ask_jenna.config import ASK_JENNA_API_KEY, ASK_JENNA_MODEL, ASK_JENNA_SERVICE
+    from ask_jenna.config import ASK_JENNA_MODEL, ASK_JENNA_SERVICE
 
+    # The API key stays on the server, see ask_jenna.views.generate
     return json_script(
         {
             "service": ASK_JENNA_SERVICE,  # LLM service provider
-            "apiKey": ASK_JENNA_API_KEY,  # apiKey
             "model": ASK_JENNA_MODEL,  # Specific model
-            "max_tokens": 1000,  # Maximum response length
-            "temperature": 0.7,  # "Creativity" (0-2)
-            "stream": False,  # Enable streaming
-            "extended": False,  # Extended responses with metadata
-            "messages": [],  # message history
-            "json": True,  # Return JSON responses
+            "stream": True,  # Suggestions are streamed as server-sent events
         },
         "ask_jenna_settings",
     )
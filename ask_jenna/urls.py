@@ -0,0 +1,35 @@
+from django.urls import path
+
+from . import views
+
+
+app_name = "ask_jenna"
+
+urlpatterns = [
+    path(
+        "preview/<str:app_label>/<str:model_name>/<str:pk>/",
+        views.preview_content,
+        name="preview_content",
+    ),
+    path(
+        "generate/<str:app_label>/<str:model_name>/<str:view>/<str:field>/",
+        views.generate,
+        name="generate",
+    ),
+    path(
+        "generate/<str:app_label>/<str:model_name>/<str:view>/<str:field>/<str:pk>/",
+        views.generate,
+        name="generate",
+    ),
+    path(
+        "generate-all/<str:app_label>/<str:model_name>/<str:view>/",
+        views.generate_all,
+        name="generate_all",
+    ),
+    path(
+        "generate-all/<str:app_label>/<str:model_name>/<str:view>/<str:pk>/",
+        views.generate_all,
+        name="generate_all",
+    ),
+    path("metrics/", views.metrics, name="metrics"),
+]
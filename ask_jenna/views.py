@@ -0,0 +1,307 @@
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+
+import httpx
+
+from django.apps import apps
+from django.contrib.auth import get_permission_codename
+from django.core.exceptions import PermissionDenied
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.translation import get_language
+from django.views.decorators.http import require_GET, require_POST
+
+from . import cache, config, llm, routing
+from .client import LLMError
+from .metrics import metrics as metrics_registry
+from .pregenerate import get_result as get_pregenerated
+from .preview import get_content, get_preview_etag, get_preview_markdown
+from .prompts import prompts, validate
+from .signals import generation_finished
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_model_for_user(
+    request, app_label: str, model_name: str, action: str = "change"
+) -> type[models.Model]:
+    """Return the model if the requesting staff user has the permission."""
+    user = request.user
+    if not (user.is_active and user.is_staff):
+        raise PermissionDenied
+    try:
+        model = apps.get_model(app_label, model_name)
+    except LookupError as e:
+        raise Http404(f"Unknown model {app_label}.{model_name}") from e
+    opts = model._meta
+    codename = get_permission_codename(action, opts)
+    if not user.has_perm(f"{opts.app_label}.{codename}"):
+        raise PermissionDenied
+    return model
+
+
+def get_object_for_user(request, app_label: str, model_name: str, pk: str):
+    """Return the object if the requesting staff user may change it."""
+    model = get_model_for_user(request, app_label, model_name)
+    opts = model._meta
+    try:
+        return model._default_manager.get(pk=pk)
+    except (model.DoesNotExist, ValueError) as e:
+        raise Http404(f"No {opts.verbose_name} with pk {pk}") from e
+
+
+@require_GET
+def preview_content(request, app_label: str, model_name: str, pk: str):
+    """Return the rendered object as compact markdown.
+
+    Responses carry an ETag derived from the object's revision, so repeated
+    requests for an unchanged object are answered with 304 Not Modified
+    without rendering it again.
+    """
+    instance = get_object_for_user(request, app_label, model_name, pk)
+    language = (
+        getattr(instance, "language", None)
+        or request.GET.get("language")
+        or get_language()
+    )
+    etag = get_preview_etag(instance, language)
+    if etag:
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            return response
+
+    markdown, etag = get_preview_markdown(request, instance, language)
+    response = HttpResponse(markdown, content_type="text/markdown; charset=utf-8")
+    response.headers["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def stream_events(
+    chunks: Iterator[str], on_done: Callable[[str, str | None], None] | None = None
+) -> Iterator[str]:
+    text = ""
+    try:
+        for chunk in chunks:
+            text += chunk
+            yield sse("delta", {"text": chunk})
+    except (httpx.HTTPError, LLMError, ValueError) as e:
+        logger.warning("Generation failed: %s", e)
+        if on_done is not None:
+            on_done(text, str(e))
+        yield sse("error", {"error": str(e)})
+        return
+    if on_done is not None:
+        on_done(text, None)
+    yield sse("done", {"text": text})
+
+
+async def astream_events(
+    chunks: AsyncIterator[str],
+    on_done: Callable[[str, str | None], Awaitable[None]] | None = None,
+) -> AsyncIterator[str]:
+    text = ""
+    try:
+        async for chunk in chunks:
+            text += chunk
+            yield sse("delta", {"text": chunk})
+    except (httpx.HTTPError, LLMError, ValueError) as e:
+        logger.warning("Generation failed: %s", e)
+        if on_done is not None:
+            await on_done(text, str(e))
+        yield sse("error", {"error": str(e)})
+        return
+    if on_done is not None:
+        await on_done(text, None)
+    yield sse("done", {"text": text})
+
+
+@require_POST
+def generate(
+    request,
+    app_label: str,
+    model_name: str,
+    view: str,
+    field: str,
+    pk: str | None = None,
+):
+    """Generate a field's suggestion and stream it as server-sent events.
+
+    The prompt and its dynamic content are resolved on the server which also
+    holds the API key. Events are ``delta`` (a piece of text), ``done`` (the
+    full text) and ``error``.
+
+    Suggestions are cached by model, sampling parameters, prompt and content;
+    a cached or pregenerated suggestion is returned at once unless
+    ``?regenerate=1`` is given.
+    """
+    started = time.monotonic()
+    if pk is None:
+        get_model_for_user(request, app_label, model_name, "add")
+        instance = None
+    else:
+        instance = get_object_for_user(request, app_label, model_name, pk)
+    key = f"{app_label}.{model_name}:{view}"
+    field_prompt = prompts.get_fields(app_label, model_name, view).get(field)
+    if field_prompt is None:
+        raise Http404(f"No prompt for {key} {field}")
+
+    resolved = prompts.resolve(key, field, field_prompt, instance)
+    content = get_content(request, resolved["dynamic_content"])
+    prompt = resolved["prompt"]
+    options = llm.get_options(model=routing.get_model(field_prompt))
+    tags = {"key": key, "field": field, "model": options["model"]}
+    if not request.GET.get("regenerate"):
+        text = cache.get_response(prompt, content, options)
+        if text is None and config.ASK_JENNA_PREGENERATE:
+            text = get_pregenerated(prompt, content, options)
+        if text is not None:
+            generation_finished.send(
+                sender=llm.Generation, **tags, **llm.get_stats(started, cached=True)
+            )
+            response = HttpResponse(
+                sse("delta", {"text": text}) + sse("done", {"text": text}),
+                content_type="text/event-stream",
+            )
+            response["Cache-Control"] = "no-cache"
+            return response
+
+    messages = llm.get_messages(prompt, content)
+
+    def get_generation_stats(generation, text, error):
+        usage = generation.get_usage(messages, text)
+        return llm.get_stats(started, usage, generation.latency, error=error)
+
+    if isinstance(request, ASGIRequest):
+        generation = llm.astream(messages, **options)
+
+        async def on_done(text, error):
+            if error is None:
+                await cache.aset_response(prompt, content, options, text)
+            await generation_finished.asend(
+                sender=llm.Generation,
+                **tags,
+                **get_generation_stats(generation, text, error),
+            )
+
+        events = astream_events(generation, on_done)
+    else:
+        generation = llm.stream(messages, **options)
+
+        def on_done(text, error):
+            if error is None:
+                cache.set_response(prompt, content, options, text)
+            generation_finished.send(
+                sender=llm.Generation,
+                **tags,
+                **get_generation_stats(generation, text, error),
+            )
+
+        events = stream_events(generation, on_done)
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@require_POST
+def generate_all(
+    request,
+    app_label: str,
+    model_name: str,
+    view: str,
+    pk: str | None = None,
+):
+    """Fill several fields of a change form with a single LLM call.
+
+    The fields (all of the view's prompts unless ``fields`` is posted) are
+    merged into one request asking for a JSON object keyed by field name.
+    Dynamic content shared by several fields is rendered and sent once.
+    Returns ``{"fields": {...}, "errors": {...}}`` where ``errors`` lists the
+    fields whose value does not match their ``type`` or ``length``.
+    """
+    started = time.monotonic()
+    if pk is None:
+        get_model_for_user(request, app_label, model_name, "add")
+        instance = None
+    else:
+        instance = get_object_for_user(request, app_label, model_name, pk)
+    key = f"{app_label}.{model_name}:{view}"
+    field_prompts = prompts.get_fields(app_label, model_name, view)
+    names = request.POST.getlist("fields") or list(field_prompts)
+    if not names or any(name not in field_prompts for name in names):
+        raise Http404(f"No prompts for {key} {', '.join(names)}")
+
+    fields = {}
+    contents: list[str] = []
+    indexes: dict[str, int] = {}
+    for name in names:
+        resolved = prompts.resolve(key, name, field_prompts[name], instance)
+        dynamic_content = resolved.get("dynamic_content")
+        value = json.dumps(dynamic_content, sort_keys=True, cls=DjangoJSONEncoder)
+        if value not in indexes:
+            indexes[value] = len(contents)
+            contents.append(get_content(request, dynamic_content))
+        fields[name] = {
+            "prompt": resolved["prompt"],
+            "type": resolved.get("type", "text"),
+            "length": resolved.get("length"),
+            "content": indexes[value],
+        }
+
+    prompt = json.dumps(fields, sort_keys=True)
+    content = "\n".join(content or "" for content in contents)
+    options = llm.get_options(
+        model=routing.get_fields_model(field_prompts[name] for name in names),
+        json=True,
+    )
+    tags = {"key": key, "field": None, "model": options["model"]}
+    messages = llm.get_fields_messages(fields, contents)
+    text = None
+    if not request.GET.get("regenerate"):
+        text = cache.get_response(prompt, content, options)
+    cached = text is not None
+    try:
+        if text is None:
+            text = llm.complete(messages, **options)
+        data = llm.parse_fields(text)
+    except (httpx.HTTPError, LLMError, ValueError) as e:
+        logger.warning("Generation failed: %s", e)
+        usage = llm.estimate_usage(messages, text or "")
+        generation_finished.send(
+            sender=llm.Generation, **tags, **llm.get_stats(started, usage, error=str(e))
+        )
+        return JsonResponse({"error": str(e)}, status=502)
+    usage = None
+    if not cached:
+        cache.set_response(prompt, content, options, text)
+        usage = llm.estimate_usage(messages, text)
+    generation_finished.send(
+        sender=llm.Generation, **tags, **llm.get_stats(started, usage, cached=cached)
+    )
+
+    values, errors = {}, {}
+    for name in names:
+        try:
+            values[name] = validate(field_prompts[name], data.get(name))
+        except ValueError as e:
+            errors[name] = str(e)
+    return JsonResponse({"fields": values, "errors": errors})
+
+
+@require_GET
+def metrics(request):
+    """Return the generation and prompt resolution counters of this process."""
+    if not (request.user.is_active and request.user.is_staff):
+        raise PermissionDenied
+    return JsonResponse(metrics_registry.as_dict())
@@ -2,15 +2,25 @@ from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 from django import forms
 
+from .auth import token_cache
 from .models import MCPToken, MCPResource, MCPPrompt
 
 
 @admin.register(MCPToken)
 class MCPTokenAdmin(admin.ModelAdmin):
-    list_display = ("key", "user", "expires_at", "created_at", "revoked", "is_active")
+    list_display = (
+        "key",
+        "user",
+        "expires_at",
+        "created_at",
+        "last_used_at",
+        "request_count",
+        "revoked",
+        "is_active",
+    )
     list_filter = ("revoked", "expires_at", "created_at")
     search_fields = ("key", "user__username", "user__email")
-    readonly_fields = ("key", "created_at")
+    readonly_fields = ("key", "created_at", "last_used_at", "request_count")
     autocomplete_fields = ("user",)
     actions = ("revoke_tokens",)
     fieldsets = (
@@ -22,6 +32,8 @@ class MCPTokenAdmin(admin.ModelAdmin):
                     "user",
                     "expires_at",
                     "created_at",
+                    "last_used_at",
+                    "request_count",
                 ),
             },
         ),
@@ -50,10 +62,10 @@ class MCPTokenAdmin(admin.ModelAdmin):
         return obj.is_active
 
     @admin.action(description="Revoke selected tokens")
-    def revoke_tokens(
-        self, request, queryset
-    ):  # pragma: no cover - trivial bulk update
+    def revoke_tokens(self, request, queryset):
+        keys = list(queryset.values_list("key", flat=True))
         queryset.update(revoked=True)
+        token_cache.invalidate(keys=keys)  # update() sends no post_save
 
 
 @admin.register(MCPResource)
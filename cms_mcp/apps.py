@@ -1,7 +1,56 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
 
 
 class CmsMcpConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "cms_mcp"
     verbose_name = "django CMS MCP Server"
+
+    def ready(self):
+        from . import catalog, subscriptions
+        from .auth import invalidate_token, invalidate_user
+        from .models import MCPPrompt, MCPResource, MCPToken
+        from .permissions import invalidate_home_page
+        from .tool_cache import get_content_label, invalidate
+
+        # Drop cached credentials once a token or its user changes
+        for signal in (post_save, post_delete):
+            signal.connect(
+                invalidate_token, sender=MCPToken, dispatch_uid="cms_mcp_auth_token"
+            )
+            signal.connect(
+                invalidate_user,
+                sender=get_user_model(),
+                dispatch_uid="cms_mcp_auth_user",
+            )
+
+        # Reload prompts and resources once they change
+        for model in (MCPPrompt, MCPResource):
+            uid = f"cms_mcp_catalog_{model._meta.label_lower}"
+            post_save.connect(catalog.invalidate, sender=model, dispatch_uid=uid)
+            post_delete.connect(catalog.invalidate, sender=model, dispatch_uid=uid)
+
+        # Notify the sessions subscribed to a changed resource
+        for signal in (post_save, post_delete):
+            signal.connect(
+                subscriptions.notify,
+                sender=MCPResource,
+                dispatch_uid="cms_mcp_subscriptions",
+            )
+
+        # Look the home page up again once a page changes
+        if apps.is_installed("cms"):
+            Page = apps.get_model("cms", "Page")
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    invalidate_home_page, sender=Page, dispatch_uid="cms_mcp_home_page"
+                )
+
+        # Invalidate the cached results of read-only tools
+        for model in apps.get_models():
+            if get_content_label(model) is not None:
+                uid = f"cms_mcp_tool_cache_{model._meta.label_lower}"
+                post_save.connect(invalidate, sender=model, dispatch_uid=uid)
+                post_delete.connect(invalidate, sender=model, dispatch_uid=uid)
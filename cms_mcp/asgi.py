@@ -8,6 +8,7 @@ streamable HTTP transport, session management, and all protocol support.
 import logging
 from mcp.server.transport_security import TransportSecuritySettings
 
+from .auth import BearerAuthMiddleware
 from .mcp_handlers import server
 
 logger = logging.getLogger(__name__)
@@ -21,8 +22,10 @@ def get_mcp_application():
     - StreamableHTTP protocol support (POST/GET/DELETE)
     - JSON-RPC message handling
     - Session management with MCP session IDs
+    - Notifications of sessions subscribed to resources
     - SSE streaming for server-initiated messages
     - Transport security (DNS rebinding protection for localhost)
+    - Bearer authentication against ``MCPToken``
     - Debug logging enabled for development
 
     Usage:
@@ -53,7 +56,7 @@ def get_mcp_application():
     mcp_app = server.streamable_http_app(
         streamable_http_path="/mcp/",  # Path where MCP protocol is served
         json_response=True,  # Use SSE streaming (True for JSON POST/response only)
-        stateless_http=True,  # Stateful sessions (True for stateless init)
+        stateless_http=False,  # Stateful sessions, needed for subscriptions
         event_store=None,  # Optional: EventStore for event resumability
         retry_interval=None,  # Optional: SSE retry interval in ms
         transport_security=transport_security,
@@ -71,10 +74,10 @@ def get_mcp_application():
     logger.info("  Transport Security: DNS rebinding protection enabled")
     logger.info("  Sessions: Stateful")
 
-    return mcp_app
+    return BearerAuthMiddleware(mcp_app)
 
 
-mcp_app = get_mcp_application()
+mcp_app = app = get_mcp_application()
 
 
 def rounte_mcp(func):
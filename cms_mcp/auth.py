@@ -1,44 +1,319 @@
 """
 Authentication and authorization for Django CMS MCP Server.
 
-Provides decorators and middleware for securing MCP endpoints.
+Requests carry an :class:`~cms_mcp.models.MCPToken` key in an
+``Authorization: Bearer`` header. Verified tokens and their users are kept
+in an in-process cache for ``MCP_AUTH_CACHE_TTL`` seconds, unknown or
+invalid keys in a smaller one of their own for ``MCP_AUTH_NEGATIVE_TTL``
+seconds, so the JSON-RPC messages of a session do not each cost a database
+query. Entries are only used as long as the generation of the tokens (see
+:mod:`cms_mcp.tool_cache`) is unchanged; checking costs one cache read.
+Saving, revoking or deleting a token, or changing its user, drops the cached
+entries of this process at once and starts a new generation once the
+transaction commits, so all other processes stop using them as well.
 """
 
 import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
 from functools import wraps
+from typing import Any
 
+from django.conf import settings
+from django.db import transaction
 from django.http import HttpResponse
+from django.utils import timezone
+
+from . import limits
+from .executor import db_read
+from .tool_cache import aget_generations, bump_generation, get_generations
+from .usage import usage
+
+MCP_AUTH_CACHE_TTL = getattr(settings, "MCP_AUTH_CACHE_TTL", 60)
+MCP_AUTH_NEGATIVE_TTL = getattr(settings, "MCP_AUTH_NEGATIVE_TTL", 10)
+MCP_AUTH_CACHE_SIZE = getattr(settings, "MCP_AUTH_CACHE_SIZE", 1024)
+MCP_AUTH_NEGATIVE_CACHE_SIZE = getattr(settings, "MCP_AUTH_NEGATIVE_CACHE_SIZE", 256)
+
+#: Label of the generation shared by all processes
+GENERATION_LABEL = "cms_mcp.mcptoken"
+
+#: User the current MCP request is authenticated as
+user: ContextVar[Any] = ContextVar("user", default=None)
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """A verified token and its user."""
+
+    token_id: int
+    key: str
+    user: Any
+    expires_at: datetime | None
+
+    @property
+    def principal(self) -> str:
+        return f"token:{self.token_id}"
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and timezone.now() >= self.expires_at
+
+
+_missing = object()
+
+
+class TokenCache:
+    """Credentials by token key with a TTL, read in a shared generation.
+
+    Keys that failed are kept as ``None`` apart from the credentials, so a
+    flood of invalid keys does not evict the valid ones.
+    """
+
+    def __init__(
+        self,
+        ttl: float = MCP_AUTH_CACHE_TTL,
+        negative_ttl: float = MCP_AUTH_NEGATIVE_TTL,
+        size: int = MCP_AUTH_CACHE_SIZE,
+        negative_size: int = MCP_AUTH_NEGATIVE_CACHE_SIZE,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.size = size
+        self.negative_size = negative_size
+        # Incremented by each invalidation, so lookups started before it
+        # do not cache what they read
+        self.generation = 0
+        self._entries: OrderedDict[str, tuple[float, str, Credentials]] = OrderedDict()
+        self._misses: OrderedDict[str, tuple[float, str, None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, shared: str) -> Credentials | None | object:
+        """Return the credentials of ``key`` cached in generation ``shared``,
+        or ``_missing``."""
+        with self._lock:
+            for entries in (self._entries, self._misses):
+                entry = entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] <= time.monotonic() or entry[1] != shared:
+                    del entries[key]
+                    return _missing
+                entries.move_to_end(key)
+                return entry[2]
+            return _missing
+
+    def set(
+        self,
+        key: str,
+        credentials: Credentials | None,
+        generation: int,
+        shared: str,
+    ) -> None:
+        if credentials is not None:
+            entries, ttl, size = self._entries, self.ttl, self.size
+        else:
+            entries, ttl, size = self._misses, self.negative_ttl, self.negative_size
+        with self._lock:
+            if generation != self.generation or ttl <= 0:
+                return
+            entries[key] = (time.monotonic() + ttl, shared, credentials)
+            entries.move_to_end(key)
+            while len(entries) > size:
+                entries.popitem(last=False)
+
+    def invalidate(self, keys=(), user_id=None) -> None:
+        """Drop the entries of ``keys`` and of the tokens of ``user_id``."""
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+                self._misses.pop(key, None)
+            if user_id is not None:
+                for key, (_, _, credentials) in list(self._entries.items()):
+                    if credentials.user.pk == user_id:
+                        del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._misses.clear()
+
+
+token_cache = TokenCache()
+
+
+def get_key(authorization: str | None) -> str | None:
+    """Return the token of an ``Authorization: Bearer <token>`` header."""
+    scheme, _, key = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not key.strip():
+        return None
+    return key.strip()
+
+
+def get_credentials(key: str) -> Credentials | None:
+    """Look ``key`` up in the database."""
+    from .models import MCPToken
+
+    token = MCPToken.objects.select_related("user").filter(key=key).first()
+    if token is None or not token.is_active or not token.user.is_active:
+        return None
+    return Credentials(token.pk, token.key, token.user, token.expires_at)
+
+
+def check(credentials: Credentials | None) -> Credentials | None:
+    # Tokens may expire while they are cached
+    if credentials is None or credentials.is_expired:
+        return None
+    return credentials
+
+
+def authenticate(key: str | None) -> Credentials | None:
+    """Return the credentials of a valid token ``key``, or ``None``."""
+    if not key:
+        return None
+    shared = get_generations([GENERATION_LABEL])[GENERATION_LABEL]
+    credentials = token_cache.get(key, shared)
+    if credentials is _missing:
+        generation = token_cache.generation
+        credentials = get_credentials(key)
+        token_cache.set(key, credentials, generation, shared)
+    return check(credentials)
+
+
+async def aauthenticate(key: str | None) -> Credentials | None:
+    """Async :func:`authenticate`; looks keys up in the database thread pool."""
+    if not key:
+        return None
+    shared = (await aget_generations([GENERATION_LABEL]))[GENERATION_LABEL]
+    credentials = token_cache.get(key, shared)
+    if credentials is _missing:
+        generation = token_cache.generation
+        credentials = await db_read(get_credentials)(key)
+        token_cache.set(key, credentials, generation, shared)
+    return check(credentials)
+
+
+def bump_shared_generation() -> None:
+    bump_generation(GENERATION_LABEL)
+
+
+def invalidate_token(sender, instance, **kwargs):
+    """``post_save`` and ``post_delete`` receiver of ``MCPToken``."""
+    token_cache.invalidate(keys=[instance.key])
+    transaction.on_commit(bump_shared_generation)
+
+
+def invalidate_user(sender, instance, update_fields=None, **kwargs):
+    """``post_save`` and ``post_delete`` receiver of the user model."""
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return  # Logging in changes nothing the tokens depend on
+    token_cache.invalidate(user_id=instance.pk)
+    transaction.on_commit(bump_shared_generation)
+
+
+def get_user():
+    """Return the user the current MCP request is authenticated as."""
+    return user.get()
+
+
+def use_request_credentials() -> None:
+    """Authenticate the current handler as the request its message came with.
+
+    With stateful sessions, handlers run in the session's task, which keeps
+    the context of the request that started the session.
+    """
+    from .mcp_server import server
+
+    try:
+        request = server.request_context.request
+    except LookupError:
+        return
+    credentials = getattr(request, "scope", {}).get("auth")
+    if isinstance(credentials, Credentials):
+        user.set(credentials.user)
+        limits.principal.set(credentials.principal)
+
+
+class BearerAuthMiddleware:
+    """ASGI middleware rejecting HTTP requests without a valid token.
+
+    The token's user is available as ``scope["user"]`` and
+    :func:`get_user`, and the token is the principal tool calls are limited
+    by (see :mod:`cms_mcp.limits`).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        headers = dict(scope.get("headers") or [])
+        authorization = headers.get(b"authorization", b"").decode("latin-1")
+        credentials = await aauthenticate(get_key(authorization))
+        if credentials is None:
+            return await self.unauthorized(send)
+        usage.record(credentials.token_id)
+        scope = {**scope, "user": credentials.user, "auth": credentials}
+        user_token = user.set(credentials.user)
+        principal_token = limits.principal.set(credentials.principal)
+        try:
+            return await self.app(scope, receive, send)
+        finally:
+            limits.principal.reset(principal_token)
+            user.reset(user_token)
+
+    async def unauthorized(self, send):
+        body = json.dumps(
+            {"error": "invalid_token", "error_description": "Invalid MCP token."}
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 401,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"www-authenticate", b'Bearer error="invalid_token"'),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
 
 
 def mcp_auth_required(view_func):
     """
-    Decorator for MCP endpoints that requires authentication.
+    Decorator for Django MCP endpoints that requires a valid token.
 
-    Can be extended to support API key authentication, JWT tokens, etc.
-    For now, it checks for a simple API key in the headers or allows
-    authenticated Django users.
+    Sets ``request.user`` to the token's user.
     """
 
     if inspect.iscoroutinefunction(view_func):
 
         @wraps(view_func)
         async def async_wrapper(request, *args, **kwargs):
-            api_key = request.headers.get("X-MCP-API-Key")
-            if api_key or True:
-                # TODO: Validate API key against stored keys
-                # For now, accept any non-empty key (development only)
-                return await view_func(request, *args, **kwargs)
-            return HttpResponse(status=401)
+            credentials = await aauthenticate(
+                get_key(request.headers.get("Authorization"))
+            )
+            if credentials is None:
+                return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+            request.user = credentials.user
+            return await view_func(request, *args, **kwargs)
 
         return async_wrapper
 
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        api_key = request.headers.get("X-MCP-API-Key")
-        if api_key or True:
-            # TODO: Validate API key against stored keys
-            # For now, accept any non-empty key (development only)
-            return view_func(request, *args, **kwargs)
-        return HttpResponse(status=401)
+        credentials = authenticate(get_key(request.headers.get("Authorization")))
+        if credentials is None:
+            return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+        request.user = credentials.user
+        return view_func(request, *args, **kwargs)
 
     return wrapper
@@ -0,0 +1,106 @@
+"""
+Prompts and resources of the MCP server, kept in memory.
+
+Clients poll ``list_prompts`` and ``list_resources`` constantly, while the
+rows rarely change. The enabled prompts and resources are loaded at once,
+with the size and a hash of their content precomputed, and served from
+memory as long as the generation of their model (see
+:mod:`cms_mcp.tool_cache`) is unchanged. Saving or deleting a prompt or
+resource starts a new generation once the transaction commits, and each
+process reloads the rows on its next request; checking costs one cache read.
+"""
+
+import hashlib
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from django.db import transaction
+
+from .executor import db_read
+from .models import MCPPrompt, MCPResource
+from .tool_cache import aget_generations, bump_generation
+
+
+@dataclass(frozen=True)
+class Entry:
+    """An enabled prompt or resource."""
+
+    key: str  # The prompt's name or resource's URI
+    name: str
+    description: str
+    content: str
+    mime_type: str | None
+    size: int  # Of the UTF-8 encoded content, in bytes
+    hash: str  # SHA-256 of the UTF-8 encoded content
+
+    @classmethod
+    def create(cls, key, name, description, content, mime_type=None) -> "Entry":
+        data = (content or "").encode()
+        return cls(
+            key=key,
+            name=name,
+            description=description,
+            content=content or "",
+            mime_type=mime_type,
+            size=len(data),
+            hash=hashlib.sha256(data).hexdigest(),
+        )
+
+
+@dataclass(frozen=True)
+class Catalog:
+    generation: str
+    entries: Mapping[str, Entry]
+
+
+class CatalogCache:
+    """Entries of ``model`` loaded by ``load``, reloaded once the model changes."""
+
+    def __init__(self, model, load: Callable[[], list[Entry]]):
+        self.label = model._meta.label_lower
+        self.load = load
+        self._catalog: Catalog | None = None
+        self._lock = threading.Lock()
+
+    async def aget(self) -> Catalog:
+        generation = (await aget_generations([self.label]))[self.label]
+        catalog = self._catalog
+        if catalog is None or catalog.generation != generation:
+            entries = await db_read(self.load)()
+            catalog = Catalog(
+                generation=generation,
+                entries=MappingProxyType({entry.key: entry for entry in entries}),
+            )
+            with self._lock:
+                self._catalog = catalog
+        return catalog
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalog = None
+
+
+def load_prompts() -> list[Entry]:
+    return [
+        Entry.create(row.name, row.name, row.description, row.content)
+        for row in MCPPrompt.objects.filter(enabled=True).order_by("name")
+    ]
+
+
+def load_resources() -> list[Entry]:
+    return [
+        Entry.create(row.uri, row.name, row.description, row.content, row.mime_type)
+        for row in MCPResource.objects.filter(enabled=True).order_by("uri")
+    ]
+
+
+prompts = CatalogCache(MCPPrompt, load_prompts)
+resources = CatalogCache(MCPResource, load_resources)
+
+
+def invalidate(sender, **kwargs):
+    """``post_save`` and ``post_delete`` receiver of prompts and resources."""
+    label = sender._meta.label_lower
+    transaction.on_commit(lambda: bump_generation(label))
@@ -2,3 +2,5 @@ NO_MATCH = -32000
 INVALID_TARGET = -32001
 AMBIGUOUS_TARGET = -32002
 INVALID_DATA = -32003
+BUSY = -32004
+TIMEOUT = -32005
@@ -0,0 +1,43 @@
+"""
+Database reads off the event loop, in parallel.
+
+``sync_to_async(thread_sensitive=True)`` (which Django's async ORM API uses
+as well) runs the sync code of all MCP sessions one after the other on a
+single thread. Reads that need neither the request's thread nor a
+transaction run in a bounded pool of ``MCP_DB_THREADS`` threads instead.
+Each thread keeps its own database connection, which is closed like at the
+end of a request once it is too old or unusable.
+"""
+
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.db import close_old_connections
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+MCP_DB_THREADS = getattr(settings, "MCP_DB_THREADS", 8)
+
+executor = ThreadPoolExecutor(
+    max_workers=MCP_DB_THREADS, thread_name_prefix="cms-mcp-db"
+)
+
+
+def db_read(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """Run the sync function ``func`` in the database thread pool."""
+
+    @wraps(func)
+    def run(*args: P.args, **kwargs: P.kwargs) -> R:
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(run, thread_sensitive=False, executor=executor)
@@ -0,0 +1,142 @@
+"""
+Concurrency limits of tool calls.
+
+Each :class:`~cms_mcp.registry.MCPTool` belongs to a concurrency class with
+at most ``max_in_flight`` calls running at a time. Further calls wait in a
+queue per principal (the token or user calling), and a freed slot goes to
+the principals in turn, so one client's burst does not starve the others.
+Once ``MCP_TOOL_MAX_QUEUED`` calls of a class wait, calls are rejected with
+a ``BUSY`` error telling the client when to retry. Calls not finished after
+the tool's ``timeout`` fail with a ``TIMEOUT`` error; they keep their slot
+until the handler (possibly running on a thread) returns.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from typing import Any
+
+from mcp import MCPError
+
+from django.conf import settings
+
+from . import errors
+
+MCP_TOOL_MAX_QUEUED = getattr(settings, "MCP_TOOL_MAX_QUEUED", 32)
+
+#: Token or user the current MCP request is made by
+principal: ContextVar[str] = ContextVar("principal", default="anonymous")
+
+
+class Limiter:
+    """In-flight calls of a concurrency class, queued fairly per principal."""
+
+    def __init__(self, max_in_flight: int, max_queued: int = MCP_TOOL_MAX_QUEUED):
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.in_flight = 0
+        self.queued = 0
+        self.queues: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self.duration = 1.0  # Moving average of the calls' duration
+
+    def get_retry_after(self) -> int:
+        """Return the seconds until a slot is likely free."""
+        waves = (self.queued + 1) / self.max_in_flight
+        return max(1, math.ceil(waves * self.duration))
+
+    async def acquire(self, principal: str) -> None:
+        if self.in_flight < self.max_in_flight and not self.queued:
+            self.in_flight += 1
+            return
+        if self.queued >= self.max_queued:
+            raise MCPError(
+                code=errors.BUSY,
+                message="Server busy, retry later.",
+                data={"retry_after": self.get_retry_after()},
+            )
+        future = asyncio.get_running_loop().create_future()
+        self.queues.setdefault(principal, deque()).append(future)
+        self.queued += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # The slot was handed over meanwhile
+            else:
+                queue = self.queues.get(principal)
+                if queue is not None and future in queue:
+                    queue.remove(future)
+                    self.queued -= 1
+                    if not queue:
+                        del self.queues[principal]
+            raise
+
+    def release(self) -> None:
+        """Hand the slot to the next principal in turn, or free it."""
+        while self.queues:
+            principal, queue = next(iter(self.queues.items()))
+            future = queue.popleft()
+            self.queued -= 1
+            if queue:
+                self.queues.move_to_end(principal)
+            else:
+                del self.queues[principal]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def observe(self, seconds: float) -> None:
+        self.duration += 0.3 * (seconds - self.duration)
+
+
+limiters: dict[str, Limiter] = {}
+
+
+def get_limiter(tool) -> Limiter:
+    """Return the limiter of the tool's concurrency class.
+
+    All tools of a class have the same ``max_in_flight`` (see
+    :func:`~cms_mcp.registry.check_concurrency_classes`); should it change
+    when the tools are rebuilt, the class's limiter follows.
+    """
+    limiter = limiters.get(tool.concurrency_class)
+    if limiter is None:
+        limiter = limiters[tool.concurrency_class] = Limiter(tool.max_in_flight)
+    limiter.max_in_flight = tool.max_in_flight
+    return limiter
+
+
+async def call(tool, name: str, input_data: dict) -> Any:
+    """Call ``tool`` within the limits of its concurrency class."""
+    limiter = get_limiter(tool)
+    await limiter.acquire(principal.get())
+    started = time.monotonic()
+
+    def finish(task=None):
+        if task is not None and not task.cancelled():
+            task.exception()  # Retrieved, as nobody awaits the task any more
+        limiter.observe(time.monotonic() - started)
+        limiter.release()
+
+    task = asyncio.ensure_future(tool.call(name, input_data))
+    try:
+        result = await asyncio.wait_for(asyncio.shield(task), tool.timeout)
+    except asyncio.TimeoutError as e:  # Not TimeoutError before Python 3.11
+        task.add_done_callback(finish)
+        raise MCPError(
+            code=errors.TIMEOUT,
+            message=f"Tool '{name}' did not finish within {tool.timeout} seconds.",
+            data={"tool": name, "timeout": tool.timeout},
+        ) from e
+    except BaseException:
+        if task.done():
+            finish()
+        else:
+            # Cancelled from outside: the slot is freed once the call returns
+            task.add_done_callback(finish)
+        raise
+    finish()
+    return result
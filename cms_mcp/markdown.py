@@ -38,6 +38,7 @@ class SemanticIndex:
         "form",
         "template",
     ]
+    _ignore_ids: list[str] = ["cms", "cms-top", "djDebug"]
 
     def __init__(self, html: str):
         self._html: str = html
@@ -53,9 +54,7 @@ class SemanticIndex:
             self._node_count += 1
             if node.name in self._tags:
                 self._add_to_index(node)
-            if node.name not in self._ignore and not (
-                node.name == "div" and node.get("id") == "cms"
-            ):
+            if node.name not in self._ignore and node.get("id") not in self._ignore_ids:
                 for child in node.children:
                     if child.name:
                         _process_node(child)
@@ -1,7 +1,9 @@
+import os
 import sys
 import requests
 
-DJANGO_MCP_URL = "http://localhost:8000/mcp/"
+DJANGO_MCP_URL = os.environ.get("DJANGO_MCP_URL", "http://localhost:8000/mcp/")
+MCP_API_TOKEN = os.environ.get("MCP_API_TOKEN", "")
 
 
 def main():
@@ -17,6 +19,7 @@ def main():
                 headers={
                     "Content-Type": "application/json",
                     "Accept": "application/json,text/event-stream",
+                    "Authorization": f"Bearer {MCP_API_TOKEN}",
                 },
                 timeout=30,
             )
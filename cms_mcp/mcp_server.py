@@ -13,5 +13,18 @@ content, configuration, project requirements, structure guidelines and style gui
 """,
 )
 
-server = Server(name=server_name, instructions=instructions)
+
+class CMSServer(Server):
+    def get_capabilities(self, *args, **kwargs):
+        # The lowlevel server never advertises subscriptions to resources,
+        # so clients would not send resources/subscribe
+        capabilities = super().get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources = capabilities.resources.model_copy(
+                update={"subscribe": True}
+            )
+        return capabilities
+
+
+server = CMSServer(name=server_name, instructions=instructions)
 print("Started MCP  server")
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms_mcp", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mcptoken",
+            name="last_used_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="When the token was last used, updated every few seconds.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="mcptoken",
+            name="request_count",
+            field=models.PositiveBigIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of MCP requests made with the token.",
+            ),
+        ),
+    ]
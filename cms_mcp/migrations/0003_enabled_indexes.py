@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms_mcp", "0002_mcptoken_usage"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="mcpprompt",
+            index=models.Index(
+                fields=["enabled", "name"], name="cms_mcp_mcp_enabled_25bf81_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mcpresource",
+            index=models.Index(
+                fields=["enabled", "uri"], name="cms_mcp_mcp_enabled_e7ee31_idx"
+            ),
+        ),
+    ]
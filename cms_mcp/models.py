@@ -67,6 +67,17 @@ class MCPToken(models.Model):
             "When the token expires and becomes invalid. Leave empty for no expiration."
         ),
     )
+    last_used_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("When the token was last used, updated every few seconds."),
+    )
+    request_count = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        help_text=_("Number of MCP requests made with the token."),
+    )
 
     class Meta:
         verbose_name = "MCP token"
@@ -78,11 +89,11 @@ class MCPToken(models.Model):
 
     @property
     def is_expired(self) -> bool:
-        return timezone.now() >= self.expires_at
+        return self.expires_at is not None and timezone.now() >= self.expires_at
 
     @property
     def is_active(self) -> bool:
-        return not self.is_expired
+        return not self.revoked and not self.is_expired
 
 
 class MCPResource(models.Model):
@@ -138,6 +149,7 @@ class MCPResource(models.Model):
         verbose_name = "MCP resource"
         verbose_name_plural = "MCP resources"
         ordering = ["uri"]
+        indexes = [models.Index(fields=["enabled", "uri"])]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.uri}"
@@ -174,6 +186,7 @@ class MCPPrompt(models.Model):
         verbose_name = _("MCP prompt")
         verbose_name_plural = _("MCP prompts")
         ordering = ["name"]
+        indexes = [models.Index(fields=["enabled", "name"])]
 
     def __str__(self) -> str:  # pragma: no cover
         return self.name
@@ -0,0 +1,99 @@
+"""
+Permissions of users to call the MCP tools.
+
+Which tools a user may call is resolved at once for all tools and kept as a
+snapshot, the names of the permitted tools, in the cache ``MCP_TOOL_CACHE``
+for ``MCP_PERMISSION_CACHE_TIMEOUT`` seconds. The snapshot is keyed by the
+user, django CMS's permission cache version (increased whenever page
+permissions change) and the registered tools, so listing tools and checking
+calls do not run django CMS's permission queries each time. The home page
+the create wizards start from is cached alongside until a page changes.
+"""
+
+import hashlib
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from django.db import transaction
+
+from .executor import db_read
+from .registry import Snapshot
+from .tool_cache import get_cache
+
+MCP_PERMISSION_CACHE_TIMEOUT = getattr(settings, "MCP_PERMISSION_CACHE_TIMEOUT", 60)
+
+HOME_PAGE_KEY = "cms_mcp:home_page"
+
+
+async def aget_permission_version() -> int:
+    """Return the version of django CMS's permission cache."""
+    if not apps.is_installed("cms"):
+        return 0
+    from cms.cache.permissions import get_cache_permission_version_key
+
+    try:
+        return int(await default_cache.aget(get_cache_permission_version_key()))
+    except (TypeError, ValueError):
+        return 1
+
+
+def get_snapshot_key(user, version: int, snapshot: Snapshot) -> str:
+    tools = hashlib.sha256(repr(snapshot.fingerprint).encode()).hexdigest()[:16]
+    return f"cms_mcp:permissions:{user.pk}:{version}:{tools}"
+
+
+def can_view_structure(user) -> bool:
+    """Whether ``user`` may list the placeholders and plugins of the pages."""
+    return user.is_active and user.is_staff and user.has_perm("cms.view_page")
+
+
+def get_permitted(user, snapshot: Snapshot) -> frozenset[str]:
+    """Return the names of the tools ``user`` may call."""
+    return frozenset(
+        name
+        for name, tool in snapshot.tools.items()
+        if tool.permission is None or (user is not None and tool.permission(user))
+    )
+
+
+async def aget_permitted(user: Any, snapshot: Snapshot) -> frozenset[str]:
+    """Return the names of the tools ``user`` may call, from the cache if possible."""
+    if user is None:
+        return get_permitted(None, snapshot)  # Checks no permissions
+    if not MCP_PERMISSION_CACHE_TIMEOUT:
+        return await db_read(get_permitted)(user, snapshot)
+    key = get_snapshot_key(user, await aget_permission_version(), snapshot)
+    cache = get_cache()
+    permitted = await cache.aget(key)
+    if permitted is None:
+        permitted = await db_read(get_permitted)(user, snapshot)
+        await cache.aset(key, permitted, MCP_PERMISSION_CACHE_TIMEOUT)
+    return permitted
+
+
+def load_home_page():
+    from cms.models import Page
+
+    return Page.objects.filter(is_home=True).first()
+
+
+_missing = object()
+
+
+def get_home_page():
+    """Return the home page (or ``None``), from the cache if possible."""
+    if not MCP_PERMISSION_CACHE_TIMEOUT:
+        return load_home_page()
+    cache = get_cache()
+    page = cache.get(HOME_PAGE_KEY, _missing)
+    if page is _missing:
+        page = load_home_page()
+        cache.set(HOME_PAGE_KEY, page, MCP_PERMISSION_CACHE_TIMEOUT)
+    return page
+
+
+def invalidate_home_page(sender, **kwargs):
+    """``post_save`` and ``post_delete`` receiver of ``Page``."""
+    transaction.on_commit(lambda: get_cache().delete(HOME_PAGE_KEY))
@@ -1,5 +1,3 @@
-from asgiref.sync import sync_to_async
-
 from mcp.types import (
     GetPromptResult,
     Prompt,
@@ -7,35 +5,27 @@ from mcp.types import (
     TextContent,
 )
 
+from . import catalog
 from .mcp_server import server
-from .models import MCPPrompt
-
-
-@sync_to_async(thread_sensitive=True)
-def _load_prompts() -> list[MCPPrompt]:
-    return list(MCPPrompt.objects.filter(enabled=True).only("name", "description"))
 
 
 @server.list_prompts()
 async def list_prompts() -> list[Prompt]:
-    rows = await _load_prompts()
+    entries = (await catalog.prompts.aget()).entries
     return [
         Prompt(
-            name=row.name,
-            description=row.description,
+            name=entry.name,
+            description=entry.description,
         )
-        for row in rows
+        for entry in entries.values()
     ]
 
 
-@sync_to_async(thread_sensitive=True)
-def _load_prompt(name: str) -> MCPPrompt:
-    return MCPPrompt.objects.filter(name=name, enabled=True).first()
-
-
 @server.get_prompt()
 async def get_prompt(name: str) -> GetPromptResult:
-    prompt = await _load_prompt(name)
+    prompt = (await catalog.prompts.aget()).entries.get(name)
+    if prompt is None:
+        raise ValueError("Prompt not available")
     return GetPromptResult(
         description=prompt.description,
         messages=[
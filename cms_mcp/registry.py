@@ -0,0 +1,123 @@
+"""
+Registry of the MCP tools.
+
+The tools are collected once from the ``register_tools(tools)`` functions of
+the tool modules and kept as a frozen snapshot: a read-only mapping by name and
+the precomputed list of :class:`~mcp.Tool` objects ``list_tools`` returns.
+Reading the snapshot does not leave the event loop. It is only rebuilt when
+the registered wizards or plugins change.
+"""
+
+import threading
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from importlib import import_module
+from types import MappingProxyType
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from mcp import Tool
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+
+
+@dataclass
+class MCPTool:
+    tool: Tool
+    call: Callable[[str, dict[str, Any]], Any]
+    related: Any
+    #: Tools of a class share its limit of ``max_in_flight`` calls at a time
+    concurrency_class: str = "default"
+    max_in_flight: int = 4
+    #: Seconds after which a call fails
+    timeout: float = 30
+    #: Results only depend on the arguments and content and are cached
+    read_only: bool = False
+    #: Labels of the models a read-only tool reads (default: all content)
+    depends_on: tuple[str, ...] = ()
+    #: Whether a user may call the tool (default: every user)
+    permission: Callable[[Any], bool] | None = None
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    tools: Mapping[str, MCPTool]
+    tool_list: list[Tool]
+    fingerprint: Hashable
+
+
+def check_concurrency_classes(tools: Mapping[str, MCPTool]) -> None:
+    """Raise unless the tools of each concurrency class agree on its limit."""
+    limits: dict[str, tuple[str, int]] = {}
+    for name, tool in tools.items():
+        first, limit = limits.setdefault(
+            tool.concurrency_class, (name, tool.max_in_flight)
+        )
+        if tool.max_in_flight != limit:
+            raise ImproperlyConfigured(
+                f"Tools {first} and {name} of the concurrency class "
+                f"'{tool.concurrency_class}' differ in max_in_flight"
+            )
+
+
+def get_fingerprint() -> Hashable:
+    """Return what the tools are built from: the registered wizards and plugins."""
+    if not apps.is_installed("cms"):
+        return ()
+    from cms.plugin_pool import plugin_pool
+
+    wizards = apps.get_app_config("cms").cms_extension.wizards
+    return tuple(wizards), tuple(plugin_pool.plugins)
+
+
+class ToolRegistry:
+    """Tools of ``modules``, rebuilt when ``get_fingerprint()`` changes."""
+
+    def __init__(
+        self,
+        modules: Iterable[str],
+        get_fingerprint: Callable[[], Hashable] = get_fingerprint,
+    ):
+        self.modules = list(modules)
+        self.get_fingerprint = get_fingerprint
+        self._snapshot: Snapshot | None = None
+        self._lock = threading.Lock()
+
+    def build(self) -> Snapshot:
+        """Collect the tools unless an up-to-date snapshot exists."""
+        with self._lock:
+            fingerprint = self.get_fingerprint()
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.fingerprint == fingerprint:
+                return snapshot
+            tools: dict[str, MCPTool] = {}
+            for module in self.modules:
+                register_tools = getattr(import_module(module), "register_tools", None)
+                if callable(register_tools):
+                    register_tools(tools)
+            check_concurrency_classes(tools)
+            self._snapshot = Snapshot(
+                tools=MappingProxyType(tools),
+                tool_list=[tool.tool for tool in tools.values()],
+                fingerprint=fingerprint,
+            )
+            return self._snapshot
+
+    def get_snapshot(self) -> Snapshot | None:
+        """Return the snapshot if it is current, without building it."""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.fingerprint == self.get_fingerprint():
+            return snapshot
+        return None
+
+    async def aget_snapshot(self) -> Snapshot:
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            # Registering tools may import modules and query the database
+            snapshot = await sync_to_async(self.build, thread_sensitive=True)()
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
@@ -1,43 +1,40 @@
-from asgiref.sync import sync_to_async
-
 from mcp.types import (
     Resource,
 )
 
+from .. import catalog
 from ..mcp_server import server
-from ..models import MCPResource
-
-
-@sync_to_async(thread_sensitive=True)
-def _load_resources() -> list[MCPResource]:
-    return list(
-        MCPResource.objects.filter(enabled=True).only("name", "description", "uri")
-    )
+from ..subscriptions import subscriptions
 
 
 @server.list_resources()
 async def list_resources() -> list[Resource]:
-    rows = await _load_resources()
+    entries = (await catalog.resources.aget()).entries
     return [
         Resource(
-            uri=row.uri,
-            name=row.name,
-            description=row.description,
+            uri=entry.key,
+            name=entry.name,
+            description=entry.description,
+            mime_type=entry.mime_type,
+            size=entry.size,
         )
-        for row in rows
+        for entry in entries.values()
     ]
 
 
-@sync_to_async(thread_sensitive=True)
-def _load_resource(uri: str) -> MCPResource:
-    return MCPResource.objects.filter(uri=uri, enabled=True).only("content").first()
-
-
 @server.read_resource()
 async def read_resource(uri: str) -> Resource:
-    print(f"===> Getting resource {uri}")
-    resource = await _load_resource(uri)
+    resource = (await catalog.resources.aget()).entries.get(str(uri))
     if resource is None:
         raise ValueError("Resource not available")
-    print(resource.content)
     return resource.content
+
+
+@server.subscribe_resource()
+async def subscribe_resource(uri) -> None:
+    await subscriptions.subscribe(str(uri), server.request_context.session)
+
+
+@server.unsubscribe_resource()
+async def unsubscribe_resource(uri) -> None:
+    subscriptions.unsubscribe(str(uri), server.request_context.session)
@@ -0,0 +1,122 @@
+"""
+Subscriptions of MCP sessions to resource changes.
+
+Sessions subscribe to resource URIs with ``resources/subscribe``. Once the
+content of a subscribed resource changes (its hash in the
+:mod:`~cms_mcp.catalog` differs), its sessions get a
+``notifications/resources/updated`` message. Saving or deleting an
+``MCPResource`` triggers a check right after the transaction commits;
+changes made by other processes are found by checking every
+``MCP_SUBSCRIPTION_POLL_INTERVAL`` seconds, which costs one cache read as
+long as no resource changed.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import weakref
+
+from django.conf import settings
+from django.db import transaction
+
+from . import catalog
+
+logger = logging.getLogger(__name__)
+
+MCP_SUBSCRIPTION_POLL_INTERVAL = getattr(settings, "MCP_SUBSCRIPTION_POLL_INTERVAL", 10)
+
+
+class Subscriptions:
+    """Sessions by subscribed URI, served on a single event loop."""
+
+    def __init__(self, interval: float = MCP_SUBSCRIPTION_POLL_INTERVAL):
+        self.interval = interval
+        self.sessions: dict[str, weakref.WeakSet] = {}
+        self.hashes: dict[str, str | None] = {}  # Last notified content
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._poller: asyncio.Task | None = None
+        self._checks: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    async def subscribe(self, uri: str, session) -> None:
+        entry = (await catalog.resources.aget()).entries.get(uri)
+        with self._lock:
+            self.loop = asyncio.get_running_loop()
+            self.sessions.setdefault(uri, weakref.WeakSet()).add(session)
+            self.hashes.setdefault(uri, entry.hash if entry else None)
+        if self.interval and (self._poller is None or self._poller.done()):
+            self._poller = self.loop.create_task(self.poll())
+
+    def unsubscribe(self, uri: str, session) -> None:
+        with self._lock:
+            sessions = self.sessions.get(uri)
+            if sessions is not None:
+                sessions.discard(session)
+                if not sessions:
+                    del self.sessions[uri]
+                    del self.hashes[uri]
+
+    async def check(self) -> None:
+        """Notify the sessions of the resources changed since the last check."""
+        entries = (await catalog.resources.aget()).entries
+        changed = []
+        with self._lock:
+            for uri, sessions in list(self.sessions.items()):
+                if not sessions:  # All sessions closed
+                    del self.sessions[uri]
+                    del self.hashes[uri]
+                    continue
+                entry = entries.get(uri)
+                content_hash = entry.hash if entry else None
+                if content_hash != self.hashes[uri]:
+                    self.hashes[uri] = content_hash
+                    changed.append((uri, list(sessions)))
+        for uri, sessions in changed:
+            for session in sessions:
+                try:
+                    await session.send_resource_updated(uri)
+                except Exception:
+                    logger.warning("Notifying a session of %s failed", uri)
+                    self.unsubscribe(uri, session)
+
+    async def safe_check(self) -> None:
+        try:
+            await self.check()
+        except Exception:
+            logger.exception("Checking subscribed resources failed")
+
+    async def poll(self) -> None:
+        while self.sessions:
+            await asyncio.sleep(self.interval)
+            await self.safe_check()
+
+    def changed(self) -> None:
+        """Check the subscribed resources; callable from any thread."""
+        loop = self.loop
+        if not self.sessions or loop is None or loop.is_closed():
+            return
+        # Not in the caller's context: it may be the thread of a
+        # sync_to_async call, which asgiref would consider in use
+        loop.call_soon_threadsafe(self.start_check, context=contextvars.Context())
+
+    def start_check(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.safe_check())
+        self._checks.add(task)  # Keep a reference until it is done
+        task.add_done_callback(self._checks.discard)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.sessions.clear()
+            self.hashes.clear()
+            if self._poller is not None and not self._poller.get_loop().is_closed():
+                self._poller.cancel()
+            self._poller = None
+
+
+subscriptions = Subscriptions()
+
+
+def notify(sender, **kwargs):
+    """``post_save`` and ``post_delete`` receiver of ``MCPResource``."""
+    transaction.on_commit(subscriptions.changed)
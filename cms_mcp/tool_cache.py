@@ -0,0 +1,133 @@
+"""
+Results of read-only tools.
+
+Tools marked ``read_only`` in the registry are answered from the cache
+alias ``MCP_TOOL_CACHE``, keyed by tool name, normalized arguments, the
+caller's permission scope (the user, its flags and django CMS's permission
+version) and the generations of the models the tool reads
+(``depends_on``, by default all content models). Saving or deleting a
+``Page``, ``PageContent``, ``Placeholder`` or plugin starts a new generation
+of its model, so only the results that may have changed are recomputed.
+"""
+
+import hashlib
+import json
+import uuid
+from collections.abc import Iterable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from . import limits
+
+MCP_TOOL_CACHE = getattr(settings, "MCP_TOOL_CACHE", "default")
+MCP_TOOL_CACHE_TIMEOUT = getattr(settings, "MCP_TOOL_CACHE_TIMEOUT", 300)
+
+#: Models whose changes invalidate tool results
+CONTENT_MODELS = ("cms.page", "cms.pagecontent", "cms.placeholder", "cms.cmsplugin")
+
+
+def get_cache():
+    return caches[MCP_TOOL_CACHE]
+
+
+def get_generation_key(label: str) -> str:
+    return f"cms_mcp:generation:{label}"
+
+
+async def aget_generations(labels: Iterable[str]) -> dict[str, str]:
+    """Return the current generation of each model."""
+    cache = get_cache()
+    keys = {get_generation_key(label): label for label in labels}
+    generations = await cache.aget_many(keys)
+    for key in keys:
+        if key not in generations:
+            # Unknown after a cache flush: start a new generation
+            await cache.aadd(key, uuid.uuid4().hex, None)
+            generations[key] = await cache.aget(key)
+    return {label: generations[key] for key, label in keys.items()}
+
+
+def get_generations(labels: Iterable[str]) -> dict[str, str]:
+    """Synchronous :func:`aget_generations`."""
+    cache = get_cache()
+    keys = {get_generation_key(label): label for label in labels}
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, uuid.uuid4().hex, None)
+            generations[key] = cache.get(key)
+    return {label: generations[key] for key, label in keys.items()}
+
+
+def bump_generation(label: str) -> None:
+    get_cache().set(get_generation_key(label), uuid.uuid4().hex, None)
+
+
+async def aget_scope(user: Any) -> str:
+    """Return the permission scope results are shared within."""
+    from .permissions import aget_permission_version
+
+    if user is None:
+        return "anonymous"
+    flags = "".join(
+        str(int(getattr(user, flag)))
+        for flag in ("is_active", "is_staff", "is_superuser")
+    )
+    return f"user:{user.pk}:{flags}:{await aget_permission_version()}"
+
+
+def get_result_key(
+    name: str, input_data: dict, scope: str, generations: dict[str, str]
+) -> str:
+    data = json.dumps(
+        {
+            "arguments": input_data,
+            "scope": scope,
+            "generations": generations,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        cls=DjangoJSONEncoder,
+    )
+    return f"cms_mcp:tool:{name}:{hashlib.sha256(data.encode()).hexdigest()}"
+
+
+_missing = object()
+
+
+async def call(tool, name: str, input_data: dict, user: Any = None) -> Any:
+    """Call ``tool`` for ``user``, answering read-only tools from the cache if possible."""
+    if not (tool.read_only and MCP_TOOL_CACHE_TIMEOUT):
+        return await limits.call(tool, name, input_data)
+    generations = await aget_generations(tool.depends_on or CONTENT_MODELS)
+    key = get_result_key(name, input_data, await aget_scope(user), generations)
+    cache = get_cache()
+    result = await cache.aget(key, _missing)
+    if result is _missing:
+        result = await limits.call(tool, name, input_data)
+        await cache.aset(key, result, MCP_TOOL_CACHE_TIMEOUT)
+    return result
+
+
+def get_content_label(model) -> str | None:
+    """Return the content model ``model`` is, or inherits from."""
+    for base in [model, *model._meta.get_parent_list()]:
+        if base._meta.label_lower in CONTENT_MODELS:
+            return base._meta.label_lower
+    return None
+
+
+def invalidate(sender, **kwargs):
+    """``post_save`` and ``post_delete`` receiver of the content models.
+
+    Plugins are saved as their own models, subclasses of ``CMSPlugin``. The
+    generation changes once the transaction commits, so other processes do
+    not cache results read before.
+    """
+    label = get_content_label(sender)
+    if label is not None:
+        transaction.on_commit(lambda: bump_generation(label))
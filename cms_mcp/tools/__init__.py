@@ -4,44 +4,47 @@ CMS MCP Tools package.
 This package contains tool handlers for various Django CMS operations.
 """
 
-from mcp import Tool
+import logging
+
+from mcp import MCPError, Tool
 from . import create, plugins, placeholder, pool
 
 __all__ = ["create", "plugins", "placeholder"]
 
 
+from .. import auth, errors, tool_cache
 from ..mcp_server import server
 
-print("Register tools")
+
+logger = logging.getLogger(__name__)
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
-    try:
-        tools = await pool.get_tools()
-        mcp_tools = [tool.tool for tool in tools.values()]
-        print("TOOLS ==> ", mcp_tools)
-    except Exception:
-        from traceback import print_exc
-
-        print_exc()
-        raise
-    return mcp_tools
+    auth.use_request_credentials()
+    return await pool.list_tools(auth.get_user())
 
 
 @server.call_tool()
 async def call_tool(name: str, input_data: dict) -> dict:
+    auth.use_request_credentials()
+    user = auth.get_user()
+    tool, permitted = await pool.get_tool(name, user)
+    if not tool:
+        raise ValueError(f"Tool '{name}' not found")
+    if not permitted:
+        raise MCPError(
+            code=errors.INVALID_TARGET,
+            message=f"Insufficient permission for {name}.",
+            data={
+                "tool": name,
+                "error": "User does not have permission to use this tool.",
+            },
+        )
     try:
-        tool_obj = await pool.get_tools()
-        tool = tool_obj.get(name)
-        print(f"{name} ==> {tool}")
-        if not tool:
-            raise ValueError(f"Tool '{name}' not found")
-        result = await tool.call(name, input_data)
-        print("RESULT ==> ", result)
+        return await tool_cache.call(tool, name, input_data, user)
+    except MCPError:
+        raise
     except Exception:
-        from traceback import print_exc
-
-        print_exc()
+        logger.exception("Tool %s failed", name)
         raise
-    return result
@@ -9,22 +9,21 @@ from typing import Any
 from asgiref.sync import sync_to_async
 from mcp import MCPError, Tool
 
-from django.contrib.auth.models import User
 from django.forms import forms
 from django.test import RequestFactory
 from django.urls import reverse
 from django.utils.encoding import force_str
 
-from cms.models import Page
 from cms.utils.admin import get_site_from_request
 from cms.utils.permissions import set_current_user
 from cms.wizards.forms import WizardStep2BaseForm
 from cms.wizards.wizard_base import get_entries
 
-from .pool import tools, MCPTool
+from .pool import MCPTool, registry
 
-from .. import errors
+from .. import auth, errors
 from ..helpers import convert_markdown_fields, form_to_json_schema
+from ..permissions import get_home_page
 
 
 def get_schema(form: type[forms.Form]) -> dict[str, Any]:
@@ -42,40 +41,22 @@ def get_schema(form: type[forms.Form]) -> dict[str, Any]:
 
 @sync_to_async(thread_sensitive=True)
 def call_create_wizard(name: str, input_data: dict) -> dict:
-    if name not in tools:
+    tool = registry.build().tools.get(name)
+    if tool is None:
         raise ValueError(f"Tool '{name}' not found")
 
-    tool = tools[name]
-
     url = reverse("cms_wizard_create")
     request = RequestFactory().post(url, data=input_data)
-    # TODO: Authentication!!
-    request.user = User.objects.filter(is_superuser=True).first()
+    request.user = auth.get_user()  # Permitted to use the wizard, see call_tool()
     request.site = get_site_from_request(request)
     set_current_user(request.user)  # a django CMS hack - not sure if anybody uses it
     wizard = tool.related
-    print("===> PERMISSIONS")
-    print(request.user.username)
-    print(wizard.user_has_add_permission(request.user))
-    if not wizard.user_has_add_permission(request.user):
-        raise MCPError(
-            code=errors.INVALID_TARGET,
-            message=f"Insufficient permission for {name}.",
-            data={
-                "tool": name,
-                "user": request.user.username,
-                "error": "User does not have permission to add this content.",
-            },
-        )
 
     form_cls = type("CreateForm", (WizardStep2BaseForm, wizard.form), {})
-    print("FORM CLASS ==> ", form_cls)
     language = input_data.pop("wizard_language", "en")
     form = form_cls(
         data=convert_markdown_fields(input_data),
-        wizard_page=Page.objects.filter(
-            is_home=True
-        ).first(),  # TODO: Replace by none, once permission issue is fixed
+        wizard_page=get_home_page(),  # TODO: Replace by none, once permission issue is fixed
         wizard_site=request.site,
         wizard_language=language,
         wizard_request=request,
@@ -103,11 +84,8 @@ def call_create_wizard(name: str, input_data: dict) -> dict:
     }
 
 
-def register_tools():
-    print("Registering create tools")
+def register_tools(tools: dict[str, MCPTool]):
     for wizard in get_entries():
-        print(f"Registering wizard: {wizard}")
-
         title = force_str(wizard.get_title())
         name = "create_" + title.lower().replace(" ", "_")
         description = force_str(wizard.get_description())
@@ -122,5 +100,9 @@ def register_tools():
             ),
             call=call_create_wizard,
             related=wizard,
+            concurrency_class="write",
+            max_in_flight=2,
+            timeout=60,
+            permission=wizard.user_has_add_permission,
         )
         tools[name] = tool
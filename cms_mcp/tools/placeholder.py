@@ -6,6 +6,12 @@ Provides functionality for listing and managing CMS placeholders.
 
 from typing import Any
 
+from mcp import Tool
+
+from ..executor import db_read
+from ..permissions import can_view_structure
+from ..registry import MCPTool
+
 
 def handle_tool(tool_name: str, params: dict[str, Any], request) -> dict[str, Any]:
     """
@@ -30,7 +36,7 @@ def list_placeholders(params: dict[str, Any], request) -> dict[str, Any]:
     List placeholders for a page or all placeholders.
 
     Args:
-        params: Optional page_id filter
+        params: Optional page_id filter and the language of its content
         request: Django request object
 
     Returns:
@@ -46,7 +52,7 @@ def list_placeholders(params: dict[str, Any], request) -> dict[str, Any]:
         if page_id:
             # Get placeholders for a specific page
             page = Page.objects.get(pk=page_id)
-            placeholders = page.get_placeholders()
+            placeholders = page.get_placeholders(params.get("language", "en"))
         else:
             # Get all placeholders
             placeholders = Placeholder.objects.all()
@@ -75,3 +81,38 @@ def list_placeholders(params: dict[str, Any], request) -> dict[str, Any]:
         return {"error": "Django CMS not installed", "placeholders": [], "count": 0}
     except Exception as e:
         raise Exception(f"Error listing placeholders: {str(e)}")
+
+
+async def call_list_placeholders(name: str, input_data: dict) -> dict[str, Any]:
+    return await db_read(list_placeholders)(input_data, None)
+
+
+def register_tools(tools: dict[str, MCPTool]):
+    tools["cms_placeholder_list"] = MCPTool(
+        tool=Tool(
+            name="cms_placeholder_list",
+            title="List placeholders",
+            description="List the placeholders of a page or of all pages with "
+            "their number of plugins.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "page_id": {
+                        "type": "integer",
+                        "description": "Only list the placeholders of this page.",
+                    },
+                    "language": {
+                        "type": "string",
+                        "description": "2-letter code of the language of the page's "
+                        "content, for example 'en' for English.",
+                    },
+                },
+            },
+        ),
+        call=call_list_placeholders,
+        related=None,
+        concurrency_class="read",
+        max_in_flight=8,
+        read_only=True,
+        permission=can_view_structure,
+    )
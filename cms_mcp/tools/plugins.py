@@ -6,6 +6,12 @@ Provides functionality for listing, creating, and managing CMS plugins.
 
 from typing import Any
 
+from mcp import Tool
+
+from ..executor import db_read
+from ..permissions import can_view_structure
+from ..registry import MCPTool
+
 
 def handle_tool(tool_name: str, params: dict[str, Any], request) -> dict[str, Any]:
     """
@@ -130,3 +136,33 @@ def get_all_plugins(request) -> dict[str, Any]:
         All plugins data
     """
     return list_plugins({}, request)
+
+
+async def call_list_plugins(name: str, input_data: dict) -> dict[str, Any]:
+    return await db_read(list_plugins)(input_data, None)
+
+
+def register_tools(tools: dict[str, MCPTool]):
+    tools["cms_plugins_list"] = MCPTool(
+        tool=Tool(
+            name="cms_plugins_list",
+            title="List plugins",
+            description="List the plugins of a placeholder or of all placeholders.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "placeholder_id": {
+                        "type": "integer",
+                        "description": "Only list the plugins of this placeholder.",
+                    }
+                },
+            },
+        ),
+        call=call_list_plugins,
+        related=None,
+        concurrency_class="read",
+        max_in_flight=8,
+        read_only=True,
+        depends_on=("cms.cmsplugin",),
+        permission=can_view_structure,
+    )
@@ -1,31 +1,43 @@
-from typing import Any, Callable
+"""Tools of the MCP server."""
+
+from collections.abc import Mapping
+from typing import Any
 
 from mcp import Tool
-from asgiref.sync import sync_to_async
-from dataclasses import dataclass
 
+from ..permissions import aget_permitted
+from ..registry import MCPTool, ToolRegistry
+
+__all__ = ["MCPTool", "get_tools", "list_tools", "registry"]
+
+
+registry = ToolRegistry(
+    f"cms_mcp.tools.{module}" for module in ("create", "plugins", "placeholder")
+)
 
-@dataclass
-class MCPTool:
-    tool: Tool
-    call: Callable[[str, dict[str, Any]], Any]
-    related: Any
 
+async def get_tools() -> Mapping[str, MCPTool]:
+    """Return the tools by name."""
+    return (await registry.aget_snapshot()).tools
 
-tools: dict[str, MCPTool] = {}
 
+async def get_tool(name: str, user: Any) -> tuple[MCPTool | None, bool]:
+    """Return the tool ``name`` and whether ``user`` may call it."""
+    snapshot = await registry.aget_snapshot()
+    tool = snapshot.tools.get(name)
+    if tool is None:
+        return None, False
+    return tool, name in await aget_permitted(user, snapshot)
 
-@sync_to_async(thread_sensitive=True)
-def get_tools() -> dict[str, MCPTool]:
-    if not tools:
-        from . import __all__
 
-        for module in __all__:
-            mod = __import__(f"cms_mcp.tools.{module}", fromlist=[module])
-            # Execute register_tools() in the module if it exists
-            if hasattr(mod, "register_tools") and callable(
-                getattr(mod, "register_tools")
-            ):
-                mod.register_tools()
+async def list_tools(user: Any) -> list[Tool]:
+    """Return the ``Tool`` list of the tools ``user`` may call.
 
-    return tools
+    Callers must not change it: for users permitted to call all tools, it is
+    the precomputed list.
+    """
+    snapshot = await registry.aget_snapshot()
+    permitted = await aget_permitted(user, snapshot)
+    if len(permitted) == len(snapshot.tools):
+        return snapshot.tool_list
+    return [tool.tool for name, tool in snapshot.tools.items() if name in permitted]
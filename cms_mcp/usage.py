@@ -0,0 +1,89 @@
+"""
+Usage of MCP tokens.
+
+Each authenticated request is counted in memory; every
+``MCP_USAGE_FLUSH_INTERVAL`` seconds, and when the process exits, the counts
+and last use of all tokens used meanwhile are written with a single
+``UPDATE`` rather than one write per request.
+"""
+
+import atexit
+import logging
+import threading
+from datetime import datetime
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+MCP_USAGE_FLUSH_INTERVAL = getattr(settings, "MCP_USAGE_FLUSH_INTERVAL", 30)
+
+
+class UsageBuffer:
+    """Requests and last use by token id, not yet written to the database."""
+
+    def __init__(self, interval: float = MCP_USAGE_FLUSH_INTERVAL):
+        self.interval = interval
+        self.counts: dict[int, int] = {}
+        self.last_used: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def record(self, token_id: int) -> None:
+        with self._lock:
+            self.counts[token_id] = self.counts.get(token_id, 0) + 1
+            self.last_used[token_id] = timezone.now()
+            if self._thread is None and self.interval:
+                self.start()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self.run, name="cms-mcp-usage", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            close_old_connections()
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.flush()
+
+    def flush(self) -> int:
+        """Write the buffered usage and return the number of tokens updated."""
+        with self._lock:
+            counts, self.counts = self.counts, {}
+            last_used, self.last_used = self.last_used, {}
+        if not counts:
+            return 0
+
+        from .models import MCPToken
+
+        try:
+            return MCPToken.objects.filter(pk__in=counts).update(
+                request_count=F("request_count")
+                + Case(*(When(pk=pk, then=Value(n)) for pk, n in counts.items())),
+                last_used_at=Case(
+                    *(When(pk=pk, then=Value(when)) for pk, when in last_used.items())
+                ),
+            )
+        except Exception:
+            logger.exception("Writing the usage of MCP tokens failed")
+            with self._lock:  # Try again with the next flush
+                for pk, n in counts.items():
+                    self.counts[pk] = self.counts.get(pk, 0) + n
+                    self.last_used.setdefault(pk, last_used[pk])
+            return 0
+
+
+usage = UsageBuffer()
@@ -8,11 +8,11 @@ document.addEventListener('DOMContentLoaded', () => {
     const jenna_scripts = JSON.parse(document.getElementById('ask_jenna_scripts').textContent);
 
     const llm = new AskJenna(jenna_config, jenna_scripts);
+    const elements = [];
     for (let field of Object.keys(jenna_scripts)) {
-        console.log(field);
         const el = document.querySelector(`input[name="${field}"]:not([disabled]),textarea[name="${field}"]:not([disabled])`);
         if (el) {
-            console.log("adding listener");
+            elements.push(el);
             const div = el.closest('div');
             if (div) {
                 div.classList.add('ask-jenna-field');
@@ -21,14 +21,28 @@ document.addEventListener('DOMContentLoaded', () => {
                 const btn = document.createElement('button');
                 btn.innerHTML = '<svg><use xlink:href="#icon-ask-jenna"></use></svg>';
                 btn.type = 'button';
+                btn.title = 'Shift-click to regenerate';
                 wrapper.appendChild(el);
                 wrapper.appendChild(btn);
                 div.appendChild(wrapper);
                 btn.addEventListener('click', (ev) => {
-                    llm.fill_input(el);
+                    llm.fill_input(el, ev.shiftKey);
                 });
             }
         }
     }
+    const first = elements[0]?.closest('fieldset');
+    if (elements.length > 1 && first && jenna_scripts[elements[0].name].generate_all) {
+        // One request for all fields sends the shared content only once
+        const btn = document.createElement('button');
+        btn.type = 'button';
+        btn.classList.add('button', 'ask-jenna-fill-all');
+        btn.textContent = 'Fill all';
+        btn.title = 'Shift-click to regenerate';
+        btn.addEventListener('click', (ev) => {
+            llm.fill_all(elements, ev.shiftKey);
+        });
+        first.parentNode.insertBefore(btn, first);
+    }
     }
 )
\ No newline at end of file
@@ -1,12 +1,10 @@
-import LLM from '@themaximalist/llm.js'
-
 class AskJenna {
     constructor(options, prompts) {
         this.options = options;
         this.prompts = prompts;
     }
 
-    fill_input(el) {
+    fill_input(el, regenerate = false) {
         if (!this.prompts[el.name]) {
             return;
         }
@@ -14,15 +12,16 @@ class AskJenna {
         const previousValue = el.value;
         el.value = '';  // Clear the input field
         el.disabled = true;  // Disable the input field to prevent changes while processing
-        this.extendedLLM(el.name).then((result) => {
-            console.log(result);
+        this.generate(el.name, (text) => {
+            el.value = text;  // Show the suggestion while it is being generated
+        }, regenerate).then((result) => {
             // Allow undo: save previous value to the undo stack before overwriting
             if (typeof el.setRangeText === 'function') {
                 // Use setRangeText to trigger undo stack in most browsers
                 el.focus();
                 el.setRangeText(previousValue, 0, el.value.length, 'end');
             }
-            el.value = this.deconstructJson(result);
+            el.value = this.deconstructJson(this.parseJson(result));
             el.disabled = status;
         }).catch(err => {
             el.value = previousValue;  // Restore previous value on error
@@ -31,6 +30,70 @@ class AskJenna {
         });
     }
 
+    fill_all(elements, regenerate = false) {
+        // Fill all fields with a single request. Fields whose suggestion does
+        // not fit their type or length are generated one by one instead.
+        const fields = elements.filter((el) => this.prompts[el.name]);
+        if (!fields.length) {
+            return;
+        }
+        const states = fields.map((el) => el.disabled);
+        fields.forEach((el) => el.disabled = true);
+        this.generateAll(fields.map((el) => el.name), regenerate).then((result) => {
+            fields.forEach((el, i) => {
+                el.disabled = states[i];
+                if (el.name in result.fields) {
+                    this.setValue(el, result.fields[el.name]);
+                } else {
+                    this.fill_input(el, regenerate);
+                }
+            });
+        }).catch(err => {
+            fields.forEach((el, i) => el.disabled = states[i]);
+            console.error(err);
+        });
+    }
+
+    setValue(el, value) {
+        if (typeof el.setRangeText === 'function') {
+            // Use setRangeText to keep the change on the undo stack
+            el.focus();
+            el.setRangeText(String(value), 0, el.value.length, 'end');
+        } else {
+            el.value = value;
+        }
+    }
+
+    async generateAll(names, regenerate = false) {
+        const url = new URL(this.prompts[names[0]].generate_all, window.location.href);
+        if (regenerate) {
+            url.searchParams.set('regenerate', '1');
+        }
+        const body = new URLSearchParams();
+        names.forEach((name) => body.append('fields', name));
+        const response = await fetch(url, {
+            method: 'POST',
+            credentials: 'same-origin',
+            headers: {
+                'Accept': 'application/json',
+                'X-CSRFToken': this.csrfToken(),
+            },
+            body: body,
+        });
+        if (!response.ok) {
+            throw new Error(`Generation failed: ${response.status}`);
+        }
+        return response.json();
+    }
+
+    parseJson(text) {
+        try {
+            return JSON.parse(text);
+        } catch (e) {
+            return text.trim();
+        }
+    }
+
     deconstructJson(json) {
         if (typeof json == 'string') {
             return json;
@@ -45,115 +108,68 @@ class AskJenna {
         return json;
     }
 
-    async extendedLLM(name) {
-        if (this.prompts[name]?.dynamic_content) {
-            const response = await fetch(this.prompts[name].dynamic_content);
-            const div = document.createElement('div');
-            div.innerHTML = await response.text();
-            const nodeToRemove = div.querySelectorAll('div#cms-top, #djDebug');
-            for(const node of nodeToRemove) {
-                node.remove();
-            }
-            div.querySelectorAll('meta, style, script, template, nav').forEach(node => node.remove());
-            const content = this.htmlToMDContent(div);
-            console.log(`Here is HTML content: ${content}\n\n${this.prompts[name].prompt}`);
-            return LLM(`Here is HTML content: ${content}\n\n${this.prompts[name].prompt}`, this.options);
-        }
-        console.log(this.prompts[name].prompt);
-        return LLM(this.prompts[name].prompt, this.options);
+    csrfToken() {
+        return document.querySelector('input[name="csrfmiddlewaretoken"]')?.value ||
+            document.cookie.match(/(?:^|;\s*)csrftoken=([^;]+)/)?.[1] || '';
     }
 
-    htmlToMDContent (element) {
-        function traverse(node) {
-            if (node.nodeType === Node.TEXT_NODE) {
-            return node.textContent;
+    parseEvent(raw) {
+        const event = { event: 'message', data: '' };
+        for (const line of raw.split('\n')) {
+            if (line.startsWith('event:')) {
+                event.event = line.slice(6).trim();
+            } else if (line.startsWith('data:')) {
+                event.data += line.slice(5).trim();
             }
-            if (node.nodeType !== Node.ELEMENT_NODE) {
-            return '';
-            }
-            let md = '';
-            switch (node.tagName.toLowerCase()) {
-            case 'h1':
-                md += '# ' + Array.from(node.childNodes).map(traverse).join('').trim() + '\n\n';
-                break;
-            case 'h2':
-                md += '## ' + Array.from(node.childNodes).map(traverse).join('').trim() + '\n\n';
-                break;
-            case 'h3':
-                md += '### ' + Array.from(node.childNodes).map(traverse).join('').trim() + '\n\n';
-                break;
-            case 'h4':
-                md += '#### ' + Array.from(node.childNodes).map(traverse).join('').trim() + '\n\n';
-                break;
-            case 'h5':
-                md += '##### ' + Array.from(node.childNodes).map(traverse).join('').trim() + '\n\n';
-                break;
-            case 'h6':
-                md += '###### ' + Array.from(node.childNodes).map(traverse).join('').trim() + '\n\n';
-                break;
-            case 'strong':
-            case 'b':
-                md += '**' + Array.from(node.childNodes).map(traverse).join('') + '**';
-                break;
-            case 'em':
-            case 'i':
-                md += '*' + Array.from(node.childNodes).map(traverse).join('') + '*';
-                break;
-            case 'code':
-                md += '`' + Array.from(node.childNodes).map(traverse).join('') + '`';
-                break;
-            case 'pre':
-                md += '```\n' + Array.from(node.childNodes).map(traverse).join('') + '\n```\n\n';
-                break;
-            case 'ul':
-                md += Array.from(node.children).map(li => '- ' + traverse(li).trim()).join('\n') + '\n\n';
-                break;
-            case 'ol':
-                md += Array.from(node.children).map((li, i) => `${i + 1}. ${traverse(li).trim()}`).join('\n') + '\n\n';
-                break;
-            case 'li':
-                md += Array.from(node.childNodes).map(traverse).join('');
-                break;
-            case 'a':
-                const href = node.getAttribute('href') || '';
-                md += `[${Array.from(node.childNodes).map(traverse).join('')}](${href})`;
-                break;
-            case 'img':
-                const alt = node.getAttribute('alt') || '';
-                const src = node.getAttribute('src') || '';
-                md += `![${alt}](${src})`;
-                break;
-            case 'blockquote':
-                md += '> ' + Array.from(node.childNodes).map(traverse).join('').replace(/\n/g, '\n> ') + '\n\n';
-                break;
-            case 'br':
-                md += '  \n';
-                break;
-            case 'p':
-                md += Array.from(node.childNodes).map(traverse).join('').trim() + '\n\n';
-                break;
-            default:
-                md += Array.from(node.childNodes).map(traverse).join('');
-            }
-            return md;
         }
-        return traverse(element).replace(/\n{3,}/g, '\n\n').trim();
+        event.data = event.data ? JSON.parse(event.data) : {};
+        return event;
     }
 
-    async ask(question) {
-        try {
-            const response = await this.llm.chat({
-                messages: [
-                    { role: "system", content: "You are Jenna, a helpful assistant." },
-                    { role: "user", content: question }
-                ]
-            });
-            return response.choices[0].message.content;
-        } catch (error) {
-            console.error("Error asking Jenna:", error);
-            throw new Error("Failed to get a response from Jenna.");
+    async generate(name, onDelta, regenerate = false) {
+        // The server resolves the prompt, calls the LLM and streams the
+        // suggestion back as server-sent events. Unless regenerating, an
+        // unchanged prompt and content is answered from the server's cache.
+        const url = new URL(this.prompts[name].generate, window.location.href);
+        if (regenerate) {
+            url.searchParams.set('regenerate', '1');
+        }
+        const response = await fetch(url, {
+            method: 'POST',
+            credentials: 'same-origin',
+            headers: {
+                'Accept': 'text/event-stream',
+                'X-CSRFToken': this.csrfToken(),
+            },
+        });
+        if (!response.ok) {
+            throw new Error(`Generation failed: ${response.status}`);
+        }
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        let text = '';
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) {
+                break;
+            }
+            buffer += value;
+            const events = buffer.split('\n\n');
+            buffer = events.pop();
+            for (const raw of events) {
+                const event = this.parseEvent(raw);
+                if (event.event === 'delta') {
+                    text += event.data.text;
+                    onDelta(text);
+                } else if (event.event === 'done') {
+                    text = event.data.text;
+                } else if (event.event === 'error') {
+                    throw new Error(event.data.error);
+                }
+            }
         }
+        return text;
     }
 }
 
-export { AskJenna };
\ No newline at end of file
+export { AskJenna };
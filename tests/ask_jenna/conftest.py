@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+
+from ask_jenna import config, llm, routing
+from ask_jenna.metrics import metrics
+from ask_jenna.prompts import prompts
+from ask_jenna.signals import generation_finished
+
+
+class FakeProvider(ThreadingHTTPServer):
+    """Local OpenAI-compatible chat completion server."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeProviderHandler)
+        self.requests: list[dict] = []
+        self.reply = "Hello from the fake provider"
+        self.failures = 0  # Answer that many requests with 503
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        return f"http://{host}:{port}/v1"
+
+
+class FakeProviderHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(
+            {"path": self.path, "headers": dict(self.headers), "body": body}
+        )
+        time.sleep(self.server.delay)
+        if self.server.failures:
+            self.server.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        words = self.server.reply.split(" ")
+        if body.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for i, word in enumerate(words):
+                delta = word if i == 0 else f" {word}"
+                chunk = {"choices": [{"delta": {"content": delta}}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+            if body.get("stream_options", {}).get("include_usage"):
+                usage = {"prompt_tokens": 12, "completion_tokens": len(words)}
+                chunk = {"choices": [], "usage": usage}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+        else:
+            data = json.dumps(
+                {"choices": [{"message": {"content": self.server.reply}}]}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    caches[config.ASK_JENNA_CACHE].clear()
+    yield
+    caches[config.ASK_JENNA_CACHE].clear()
+
+
+@pytest.fixture
+def make_fake_provider():
+    servers = []
+
+    def make():
+        server = FakeProvider()
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def fake_provider(monkeypatch, make_fake_provider):
+    server = make_fake_provider()
+    monkeypatch.setattr(config, "ASK_JENNA_SERVICE", "openai")
+    monkeypatch.setattr(config, "ASK_JENNA_API_KEY", "sk-test")
+    monkeypatch.setattr(config, "ASK_JENNA_BASE_URL", server.url)
+    monkeypatch.setattr(config, "ASK_JENNA_RETRY_BACKOFF", 0)
+    llm.reset_client()
+    routing.latency.clear()
+    yield server
+    llm.reset_client()
+    routing.latency.clear()
+
+
+@pytest.fixture
+def finished():
+    calls = []
+
+    def receiver(sender, **kwargs):
+        calls.append(kwargs)
+
+    generation_finished.connect(receiver)
+    metrics.clear()
+    yield calls
+    generation_finished.disconnect(receiver)
+    metrics.clear()
+
+
+USER_KEY = "auth.user:change_view"
+
+
+@pytest.fixture
+def user_prompts():
+    prompts.register(
+        {
+            USER_KEY: {
+                "first_name": {
+                    "prompt": "Suggest a first name for {{ instance.username }}",
+                    "dynamic_content": lambda user: {"email": user.email},
+                },
+            }
+        }
+    )
+    yield
+    prompts.unregister(USER_KEY)
+
+
+@pytest.fixture
+def staff(db):
+    return User.objects.create_superuser("staff", "staff@example.com", "pw")
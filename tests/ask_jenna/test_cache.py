@@ -0,0 +1,77 @@
+import pytest
+
+from django.contrib.auth.models import User
+
+from ask_jenna import cache, config, llm
+from ask_jenna.templatetags.ask_jenna import get_scripts
+
+from .test_llm import parse_events
+
+
+@pytest.fixture
+def url(user_prompts, staff, client):
+    client.force_login(staff)
+    return get_scripts("change_view", User._meta, staff)["first_name"]["generate"]
+
+
+def test_response_key_depends_on_model_prompt_and_content():
+    options = llm.get_options()
+    key = cache.get_response_key("Prompt", "Content", options)
+
+    assert key == cache.get_response_key("Prompt", "Content", llm.get_options())
+    assert key != cache.get_response_key("Other", "Content", options)
+    assert key != cache.get_response_key("Prompt", "Other", options)
+    assert key != cache.get_response_key("Prompt", "Content", {**options, "model": "x"})
+    assert key != cache.get_response_key(
+        "Prompt", "Content", {**options, "temperature": 0}
+    )
+
+
+def test_generate_answers_repeated_requests_from_cache(fake_provider, url, client):
+    first = parse_events(client.post(url))
+    response = client.post(url)
+
+    assert not response.streaming
+    events = [
+        (raw.split("\n")[0], raw) for raw in response.content.decode().split("\n\n")
+    ]
+    assert events[0][0] == "event: delta"
+    assert first[-1] == ("done", {"text": "Hello from the fake provider"})
+    assert '"text": "Hello from the fake provider"' in events[1][1]
+    assert len(fake_provider.requests) == 1
+
+
+def test_generate_regenerate_bypasses_cache(fake_provider, url, client):
+    parse_events(client.post(url))
+    fake_provider.reply = "Something new"
+
+    events = parse_events(client.post(f"{url}?regenerate=1"))
+
+    assert events[-1] == ("done", {"text": "Something new"})
+    assert len(fake_provider.requests) == 2
+    # The fresh suggestion replaces the cached one
+    assert b"Something new" in client.post(url).content
+
+
+def test_errors_and_large_responses_are_not_cached(
+    fake_provider, url, client, monkeypatch
+):
+    fake_provider.failures = 10
+    assert parse_events(client.post(url))[0][0] == "error"
+    fake_provider.failures = 0
+    failed = len(fake_provider.requests)
+    monkeypatch.setattr(config, "ASK_JENNA_RESPONSE_CACHE_MAX_SIZE", 10)
+
+    parse_events(client.post(url))
+    parse_events(client.post(url))
+
+    assert len(fake_provider.requests) == failed + 2
+
+
+def test_cache_can_be_disabled(fake_provider, url, client, monkeypatch):
+    monkeypatch.setattr(config, "ASK_JENNA_RESPONSE_CACHE_TIMEOUT", 0)
+
+    parse_events(client.post(url))
+    parse_events(client.post(url))
+
+    assert len(fake_provider.requests) == 2
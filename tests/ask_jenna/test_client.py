@@ -0,0 +1,195 @@
+import time
+
+import httpx
+import pytest
+
+from ask_jenna import config, llm
+from ask_jenna.client import Backend, CircuitBreaker, CircuitOpenError, LLMClient
+from ask_jenna.llm import OpenAIProvider
+
+
+MESSAGES = llm.get_messages("Hi")
+
+
+def make_client(*servers, threshold=5, **kwargs):
+    backends = [
+        Backend(
+            OpenAIProvider(api_key="sk-test", base_url=server.url),
+            {"model": f"model-{i}"},
+            CircuitBreaker(threshold=threshold, reset_timeout=60),
+        )
+        for i, server in enumerate(servers)
+    ]
+    kwargs.setdefault("backoff", 0)
+    return LLMClient(backends, **kwargs)
+
+
+def test_retries_transient_errors(make_fake_provider):
+    server = make_fake_provider()
+    server.failures = 2
+    client = make_client(server, retries=2)
+
+    assert client.complete(MESSAGES) == "Hello from the fake provider"
+    assert len(server.requests) == 3
+
+
+def test_gives_up_after_retries(make_fake_provider):
+    server = make_fake_provider()
+    server.failures = 3
+    client = make_client(server, retries=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.complete(MESSAGES)
+    assert len(server.requests) == 2
+
+
+def test_circuit_breaker_stops_calling_failing_provider(make_fake_provider):
+    server = make_fake_provider()
+    server.failures = 10
+    client = make_client(server, threshold=2, retries=0)
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.complete(MESSAGES)
+    with pytest.raises(CircuitOpenError):
+        client.complete(MESSAGES)
+    assert len(server.requests) == 2
+
+
+def test_circuit_breaker_half_opens_after_timeout():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()  # Only a single trial request
+    breaker.record_success()
+    assert breaker.allow()
+
+
+def test_retries_count_as_a_single_failure(make_fake_provider):
+    server = make_fake_provider()
+    server.failures = 10
+    client = make_client(server, threshold=2, retries=2)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.complete(MESSAGES)
+    assert client.backends[0].breaker.failures == 1
+    assert not client.backends[0].breaker.is_open
+
+
+def test_half_open_fallback_is_asked_only_when_tried(make_fake_provider):
+    primary, secondary = make_fake_provider(), make_fake_provider()
+    secondary.reply = "Fallback"
+    client = make_client(primary, secondary, threshold=1, retries=0)
+    fallback = client.backends[1].breaker
+    fallback.record_failure()
+    fallback.opened_at -= fallback.reset_timeout  # Half-open
+
+    client.complete(MESSAGES)
+    primary.failures = 10
+
+    assert client.complete(MESSAGES) == "Fallback"
+    assert not fallback.is_open
+
+
+def test_fails_over_to_second_provider(make_fake_provider):
+    primary, secondary = make_fake_provider(), make_fake_provider()
+    primary.failures = 10
+    secondary.reply = "Fallback"
+    client = make_client(primary, secondary, retries=1)
+
+    assert client.complete(MESSAGES) == "Fallback"
+    assert len(primary.requests) == 2
+    assert secondary.requests[0]["body"]["model"] == "model-1"
+
+
+def test_hedges_slow_requests(make_fake_provider):
+    primary, secondary = make_fake_provider(), make_fake_provider()
+    primary.delay = 1
+    secondary.reply = "Hedged"
+    client = make_client(primary, secondary, hedge_after=0.05)
+
+    start = time.monotonic()
+    assert client.complete(MESSAGES) == "Hedged"
+    assert time.monotonic() - start < 0.9
+
+
+def test_hedges_at_once_when_the_primary_fails(make_fake_provider):
+    primary, secondary = make_fake_provider(), make_fake_provider()
+    primary.failures = 10
+    secondary.reply = "Hedged"
+    client = make_client(primary, secondary, retries=0, hedge_after=5)
+
+    start = time.monotonic()
+    assert client.complete(MESSAGES) == "Hedged"
+    assert time.monotonic() - start < 4
+
+
+def test_hedged_losers_keep_their_slot_but_not_the_breaker(make_fake_provider):
+    primary, secondary = make_fake_provider(), make_fake_provider()
+    primary.delay = 0.3
+    primary.failures = 10
+    secondary.reply = "Hedged"
+    client = make_client(
+        primary, secondary, threshold=1, retries=2, hedge_after=0.05, max_concurrency=2
+    )
+
+    assert client.complete(MESSAGES) == "Hedged"
+    assert client._semaphore.acquire(blocking=False)
+    assert not client._semaphore.acquire(blocking=False)  # The primary still runs
+
+    assert client._semaphore.acquire(timeout=2)
+    assert len(primary.requests) == 1  # Not retried
+    assert client.backends[0].breaker.failures == 0
+
+
+def test_stream_retries_before_first_token(make_fake_provider):
+    server = make_fake_provider()
+    server.failures = 1
+    client = make_client(server, retries=1)
+
+    chunks = [chunk for chunk in client.stream(MESSAGES) if isinstance(chunk, str)]
+
+    assert "".join(chunks) == "Hello from the fake provider"
+
+
+@pytest.mark.asyncio
+async def test_async_api_fails_over(make_fake_provider):
+    primary, secondary = make_fake_provider(), make_fake_provider()
+    primary.failures = 10
+    secondary.reply = "Async fallback"
+    client = make_client(primary, secondary, retries=0)
+
+    assert await client.acomplete(MESSAGES) == "Async fallback"
+    chunks = [
+        chunk async for chunk in client.astream(MESSAGES) if isinstance(chunk, str)
+    ]
+    assert "".join(chunks) == "Async fallback"
+
+
+@pytest.mark.asyncio
+async def test_async_hedges_at_once_when_the_primary_fails(make_fake_provider):
+    primary, secondary = make_fake_provider(), make_fake_provider()
+    primary.failures = 10
+    secondary.reply = "Hedged"
+    client = make_client(primary, secondary, retries=0, hedge_after=5)
+
+    start = time.monotonic()
+    assert await client.acomplete(MESSAGES) == "Hedged"
+    assert time.monotonic() - start < 4
+
+
+def test_client_is_built_from_settings(fake_provider, make_fake_provider, monkeypatch):
+    secondary = make_fake_provider()
+    monkeypatch.setattr(config, "ASK_JENNA_FALLBACK_SERVICE", "openai")
+    monkeypatch.setattr(config, "ASK_JENNA_FALLBACK_BASE_URL", secondary.url)
+    monkeypatch.setattr(config, "ASK_JENNA_FALLBACK_MODEL", "small")
+    monkeypatch.setattr(config, "ASK_JENNA_RETRIES", 0)
+    llm.reset_client()
+    fake_provider.failures = 1
+
+    assert llm.get_client() is llm.get_client()
+    assert llm.complete(MESSAGES) == "Hello from the fake provider"
+    assert secondary.requests[0]["body"]["model"] == "small"
@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from django.apps import apps
+from django.core.exceptions import AppRegistryNotReady, ImproperlyConfigured
+
+from ask_jenna.prompts import Prompts, parse_key, prompts
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import ``module`` in a fresh interpreter and return the cumulative
+    import time in microseconds of every module loaded on the way."""
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings"}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import django; django.setup(); import {module}",
+        ],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_template_tags_import_without_discovery(record_property):
+    times = import_times("ask_jenna.templatetags.ask_jenna")
+
+    record_property("import_time_us", times["ask_jenna.templatetags.ask_jenna"])
+    assert "ask_jenna.prompts" in times
+    # No app's prompt module (and nothing it pulls in) is imported yet
+    assert "ask_jenna.ask_jenna" not in times
+    assert "cms_mcp.markdown" not in times
+
+
+def test_discovery_registers_exported_prompts_only():
+    registry = Prompts(autodiscover=True)
+    assert not registry._discovered
+
+    fields = registry.get_fields("cms", "pagecontent", "change_view")
+
+    assert registry._discovered
+    assert set(fields) == {"title", "page_title", "menu_title", "meta_description"}
+    assert list(registry.all()) == ["cms.pagecontent:change_view"]
+
+
+def test_registered_prompts_override_discovered_ones():
+    registry = Prompts(autodiscover=True)
+    registry.register({"cms.pagecontent:change_view": {"title": {"prompt": "Title"}}})
+
+    assert list(registry.get_fields("cms", "pagecontent", "change_view")) == ["title"]
+
+
+def test_register_does_not_need_the_app_registry(monkeypatch):
+    def not_ready(*args, **kwargs):
+        raise AppRegistryNotReady("Apps aren't loaded yet.")
+
+    registry = Prompts(autodiscover=True)
+    with monkeypatch.context() as patch:
+        patch.setattr(apps, "get_app_configs", not_ready)
+        patch.setattr(apps, "get_models", not_ready)
+        registry.register({"cms.pagecontent:change_view": {"title": {"prompt": "T"}}})
+
+    assert not registry._discovered
+    fields = registry.get_fields("cms", "pagecontent", "change_view")
+    assert registry._discovered
+    assert list(fields) == ["title"]
+
+
+def test_parse_key():
+    assert parse_key("cms.PageContent:change_view") == (
+        "cms",
+        "pagecontent",
+        "change_view",
+    )
+    assert parse_key("cms.*:change_view") == ("cms", "*", "change_view")
+    assert parse_key("*:add_view") == ("*", "*", "add_view")
+    with pytest.raises(ImproperlyConfigured):
+        parse_key("change_view")
+
+
+@pytest.mark.django_db
+def test_module_registry_discovers_lazily():
+    assert prompts.get_fields("cms", "pagecontent", "change_view")
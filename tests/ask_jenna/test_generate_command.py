@@ -0,0 +1,204 @@
+import asyncio
+import json
+import time
+from io import StringIO
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.db.models.signals import post_save
+
+from ask_jenna.management.commands.ask_jenna_generate import Command, RateLimiter
+from ask_jenna.prompts import prompts
+from ask_jenna.templatetags.ask_jenna import ask_jenna_scripts
+from cms_mcp.models import MCPPrompt
+
+# The command reads and writes objects in a thread of its event loop
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def users(db):
+    return [
+        User.objects.create(username=f"user{i}", first_name="Kept" if i == 2 else "")
+        for i in range(5)
+    ]
+
+
+def generate(*args, **options):
+    stdout, stderr = StringIO(), StringIO()
+    call_command("ask_jenna_generate", "auth.User", *args, stdout=stdout, stderr=stderr)
+    return stdout.getvalue(), stderr.getvalue()
+
+
+def test_fills_empty_fields_in_batches(fake_provider, user_prompts, users):
+    fake_provider.reply = "Jenna"
+
+    stdout, _ = generate("--batch-size=2", "--concurrency=3")
+
+    names = list(User.objects.order_by("pk").values_list("first_name", flat=True))
+    assert names == ["Jenna", "Jenna", "Kept", "Jenna", "Jenna"]
+    assert len(fake_provider.requests) == 4
+    assert "4 fields filled, 0 failed, up to user" in stdout
+    message = fake_provider.requests[0]["body"]["messages"][0]["content"]
+    assert message.endswith("Suggest a first name for user0")
+
+
+def test_overwrite_and_filter(fake_provider, user_prompts, users):
+    fake_provider.reply = "Jenna"
+
+    generate("--overwrite", "--filter=username=user2")
+
+    assert User.objects.get(username="user2").first_name == "Jenna"
+    assert User.objects.filter(first_name="").count() == 4
+
+
+def test_json_values_are_decoded(fake_provider, user_prompts, users):
+    fake_provider.reply = '{"first_name": "Jenna"}'
+
+    generate()
+
+    assert User.objects.filter(first_name="Jenna").count() == 4
+
+
+def test_invalid_values_are_not_written(fake_provider, users):
+    prompts.register(
+        {"auth.user:add_view": {"last_name": {"prompt": "A name", "length": 3}}}
+    )
+    fake_provider.reply = "Longname"
+    try:
+        _, stderr = generate("--view=add_view")
+    finally:
+        prompts.unregister("auth.user:add_view")
+
+    assert not User.objects.exclude(last_name="").exists()
+    assert stderr.count("Longer than 3 characters") == 5
+
+
+def test_checkpoint_resumes_interrupted_run(
+    fake_provider, user_prompts, users, tmp_path
+):
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text(
+        json.dumps(
+            {
+                "key": "auth.user:change_view",
+                "fields": ["first_name"],
+                "last_pk": users[2].pk,
+            }
+        )
+    )
+
+    stdout, _ = generate(f"--checkpoint={checkpoint}")
+
+    assert f"Resuming after user {users[2].pk}" in stdout
+    assert len(fake_provider.requests) == 2
+    assert not checkpoint.exists()
+
+
+def test_failures_are_reported(fake_provider, user_prompts, users):
+    fake_provider.failures = 100
+
+    stdout, stderr = generate("--batch-size=2")
+
+    assert "0 fields filled, 4 failed" in stdout
+    assert stderr.count("first_name: Server error") == 4
+
+
+def test_generations_are_reported(fake_provider, user_prompts, users, finished):
+    fake_provider.failures = 1
+    generate("--concurrency=1")
+
+    assert [call["field"] for call in finished] == ["first_name"] * 4
+    assert finished[0]["key"] == "auth.user:change_view"
+    assert finished[0]["completion_tokens"] > 0
+    assert not any(call["error"] for call in finished)
+
+
+def test_checkpoint_stops_at_failed_objects(
+    fake_provider, user_prompts, users, tmp_path
+):
+    checkpoint = tmp_path / "checkpoint.json"
+    fake_provider.failures = 3  # The first object's request and its retries
+
+    stdout, _ = generate(
+        "--batch-size=2", "--concurrency=1", f"--checkpoint={checkpoint}"
+    )
+
+    assert "3 fields filled, 1 failed" in stdout
+    assert json.loads(checkpoint.read_text())["last_pk"] is None
+    stdout, _ = generate("--batch-size=2", f"--checkpoint={checkpoint}")
+    assert "1 fields filled, 0 failed" in stdout
+    assert len(fake_provider.requests) == 7
+    assert not checkpoint.exists()
+
+
+def test_interrupted_run_keeps_checkpoint(
+    fake_provider, user_prompts, users, tmp_path, monkeypatch
+):
+    checkpoint = tmp_path / "checkpoint.json"
+    original = Command.generate
+    calls = []
+
+    async def interrupt(self, key, jobs, options):
+        calls.append(len(jobs))
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        return await original(self, key, jobs, options)
+
+    monkeypatch.setattr(Command, "generate", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        generate("--batch-size=2", f"--checkpoint={checkpoint}")
+
+    assert json.loads(checkpoint.read_text())["last_pk"] == users[1].pk
+    monkeypatch.setattr(Command, "generate", original)
+    generate("--batch-size=2", f"--checkpoint={checkpoint}")
+    assert len(fake_provider.requests) == 4
+    assert not User.objects.filter(first_name="").exists()
+
+
+@pytest.fixture
+def mcp_prompts():
+    key = "cms_mcp.mcpprompt:change_view"
+    prompts.register(
+        {key: {"description": {"prompt": "Improve '{{ instance.description }}'"}}}
+    )
+    yield
+    prompts.unregister(key)
+
+
+def test_filled_objects_are_saved_like_edits(fake_provider, mcp_prompts):
+    prompt = MCPPrompt.objects.create(name="greeting", content="Hello")
+    assert "Improve ''" in ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+    saved = []
+
+    def receiver(sender, instance, **kwargs):
+        saved.append(instance.pk)
+
+    fake_provider.reply = "Jenna"
+    post_save.connect(receiver, sender=MCPPrompt)
+    try:
+        call_command("ask_jenna_generate", "cms_mcp.MCPPrompt", stdout=StringIO())
+    finally:
+        post_save.disconnect(receiver, sender=MCPPrompt)
+
+    prompt = MCPPrompt.objects.get(pk=prompt.pk)
+    scripts = ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+    assert "Improve 'Jenna'" in scripts  # Not the cached block
+    assert saved == [prompt.pk]
+
+
+def test_rejects_unknown_fields(user_prompts, users):
+    with pytest.raises(CommandError):
+        generate("--fields", "last_name")
+
+
+def test_rate_limiter_spaces_requests():
+    async def run():
+        limiter = RateLimiter(20)
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.wait() for _ in range(5)))
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.19
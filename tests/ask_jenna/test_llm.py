@@ -0,0 +1,175 @@
+import json
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth.models import User
+
+from ask_jenna import cache, llm
+from ask_jenna.prompts import prompts
+from ask_jenna.templatetags.ask_jenna import ask_jenna_config, get_scripts
+
+
+def parse_events(response) -> list[tuple[str, dict]]:
+    if response.streaming:
+        content = b"".join(response.streaming_content).decode()
+    else:  # Cached
+        content = response.content.decode()
+    events = []
+    for raw in content.strip().split("\n\n"):
+        event, data = raw.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data[6:])))
+    return events
+
+
+def test_stream_yields_deltas(fake_provider):
+    chunks = list(llm.stream(llm.get_messages("Hi")))
+
+    assert "".join(chunks) == "Hello from the fake provider"
+    assert len(chunks) == 5
+    request = fake_provider.requests[0]
+    assert request["path"] == "/v1/chat/completions"
+    assert request["headers"]["Authorization"] == "Bearer sk-test"
+    assert request["body"]["stream"] is True
+
+
+def test_complete_returns_text(fake_provider):
+    assert llm.complete(llm.get_messages("Hi")) == "Hello from the fake provider"
+
+
+def test_generate_streams_server_sent_events(
+    fake_provider, user_prompts, staff, client
+):
+    client.force_login(staff)
+    url = get_scripts("change_view", User._meta, staff)["first_name"]["generate"]
+
+    response = client.post(url)
+
+    assert response["Content-Type"] == "text/event-stream"
+    events = parse_events(response)
+    assert [event for event, _ in events] == ["delta"] * 5 + ["done"]
+    assert events[-1][1] == {"text": "Hello from the fake provider"}
+    message = fake_provider.requests[0]["body"]["messages"][0]["content"]
+    assert '{"email": "staff@example.com"}' in message
+    assert message.endswith("Suggest a first name for staff")
+
+
+def test_generate_reports_provider_errors(fake_provider, user_prompts, staff, client):
+    fake_provider.failures = 10
+    client.force_login(staff)
+    url = get_scripts("change_view", User._meta, staff)["first_name"]["generate"]
+
+    events = parse_events(client.post(url))
+
+    assert events[0][0] == "error"
+
+
+def test_generate_requires_post_and_staff(user_prompts, staff, client):
+    url = get_scripts("change_view", User._meta, staff)["first_name"]["generate"]
+
+    assert client.post(url).status_code == 403
+    client.force_login(staff)
+    assert client.get(url).status_code == 405
+
+
+def test_config_does_not_expose_api_key(fake_provider):
+    assert "sk-test" not in ask_jenna_config()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_generate_streams_asynchronously_under_asgi(
+    fake_provider, user_prompts, async_client
+):
+    staff = await User.objects.acreate(
+        username="astaff", is_staff=True, is_superuser=True
+    )
+    await async_client.aforce_login(staff)
+    scripts = await sync_to_async(get_scripts)("change_view", User._meta, staff)
+    url = scripts["first_name"]["generate"]
+
+    response = await async_client.post(url)
+
+    assert response.is_async
+    content = b"".join([chunk async for chunk in response.streaming_content])
+    assert b'"text": "Hello from the fake provider"' in content
+
+
+@pytest.fixture
+def form_prompts():
+    def content(user):
+        return {"email": user.email}
+
+    prompts.register(
+        {
+            "auth.user:add_view": {
+                "first_name": {"prompt": "A first name", "dynamic_content": content},
+                "last_name": {
+                    "prompt": "A last name",
+                    "length": 5,
+                    "dynamic_content": content,
+                },
+                "is_active": {"prompt": "Active?", "type": "boolean"},
+            }
+        }
+    )
+    yield
+    prompts.unregister("auth.user:add_view")
+
+
+def test_generate_all_fills_fields_with_one_request(
+    fake_provider, form_prompts, staff, client
+):
+    fake_provider.reply = json.dumps(
+        {"first_name": " Jenna ", "last_name": "Longname", "is_active": True}
+    )
+    client.force_login(staff)
+    url = get_scripts("add_view", User._meta, staff)["first_name"]["generate_all"]
+
+    response = client.post(url)
+
+    assert response.json() == {
+        "fields": {"first_name": "Jenna", "is_active": True},
+        "errors": {"last_name": "Longer than 5 characters"},
+    }
+    assert len(fake_provider.requests) == 1
+    body = fake_provider.requests[0]["body"]
+    assert body["response_format"] == {"type": "json_object"}
+    message = body["messages"][0]["content"]
+    assert message.count("staff@example.com") == 1
+    assert '"last_name" (text, at most 5 characters, based on content 1)' in message
+    assert '"is_active" (boolean): Active?' in message
+
+
+def test_generate_all_caches_only_fresh_responses(
+    fake_provider, form_prompts, staff, client, monkeypatch
+):
+    fake_provider.reply = json.dumps({"first_name": "Jenna"})
+    client.force_login(staff)
+    url = get_scripts("add_view", User._meta, staff)["first_name"]["generate_all"]
+    stored = []
+    set_response = cache.set_response
+    monkeypatch.setattr(
+        cache, "set_response", lambda *args: stored.append(set_response(*args))
+    )
+
+    first = client.post(url).json()
+
+    assert client.post(url).json() == first
+    assert len(fake_provider.requests) == 1
+    assert len(stored) == 1
+
+
+def test_generate_all_selected_fields_and_errors(
+    fake_provider, form_prompts, staff, client
+):
+    fake_provider.reply = "no json"
+    client.force_login(staff)
+    url = get_scripts("add_view", User._meta, staff)["first_name"]["generate_all"]
+
+    response = client.post(url, {"fields": ["first_name"]})
+
+    assert response.status_code == 502
+    message = fake_provider.requests[0]["body"]["messages"][0]["content"]
+    assert "last_name" not in message
+    assert client.post(url, {"fields": ["password"]}).status_code == 404
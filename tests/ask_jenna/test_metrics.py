@@ -0,0 +1,76 @@
+import pytest
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from ask_jenna.signals import prompt_resolved
+from ask_jenna.templatetags.ask_jenna import get_scripts
+
+from .test_llm import parse_events
+
+
+@pytest.fixture
+def url(user_prompts, staff, client):
+    client.force_login(staff)
+    return get_scripts("change_view", User._meta, staff)["first_name"]["generate"]
+
+
+def test_generation_reports_timing_and_tokens(fake_provider, finished, url, client):
+    parse_events(client.post(url))
+
+    (call,) = finished
+    assert call["key"] == "auth.user:change_view"
+    assert call["field"] == "first_name"
+    assert call["prompt_tokens"] == 12
+    assert call["completion_tokens"] == 5
+    assert call["duration"] >= call["latency"] > 0
+    assert call["cached"] is False
+    assert call["error"] is None
+
+
+def test_cache_hits_and_errors_are_reported(fake_provider, finished, url, client):
+    parse_events(client.post(url))
+    parse_events(client.post(url))
+    fake_provider.failures = 10
+    parse_events(client.post(f"{url}?regenerate=1"))
+
+    assert [call["cached"] for call in finished] == [False, True, False]
+    assert finished[1]["prompt_tokens"] == 0
+    assert "503" in finished[2]["error"]
+
+
+def test_prompt_resolution_is_reported(user_prompts, staff):
+    calls = []
+
+    def receiver(sender, **kwargs):
+        calls.append(kwargs)
+
+    prompt_resolved.connect(receiver)
+    try:
+        get_scripts("change_view", User._meta, staff)
+    finally:
+        prompt_resolved.disconnect(receiver)
+
+    assert [(c["key"], c["field"], c["deferred"]) for c in calls] == [
+        ("auth.user:change_view", "first_name", True)
+    ]
+
+
+def test_metrics_endpoint(fake_provider, finished, url, client):
+    parse_events(client.post(url))
+    parse_events(client.post(url))
+
+    data = client.get(reverse("ask_jenna:metrics")).json()
+
+    (entry,) = data["generations"]
+    assert entry["key"] == "auth.user:change_view"
+    assert entry["model"] == "gpt-3.5-turbo"
+    assert entry["count"] == 2
+    assert entry["cache_hits"] == 1
+    assert entry["errors"] == 0
+    assert entry["prompt_tokens"] == 12
+    assert data["prompts"][0]["field"] == "first_name"
+
+
+def test_metrics_requires_staff(client):
+    assert client.get(reverse("ask_jenna:metrics")).status_code == 403
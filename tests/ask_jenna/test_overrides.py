@@ -0,0 +1,107 @@
+import pytest
+
+from django.core.exceptions import ValidationError
+
+from ask_jenna.cache import get_cache
+from ask_jenna.models import PromptOverride
+from ask_jenna.prompts import OVERRIDES_VERSION_KEY, Prompts, get_overrides_version
+
+
+@pytest.fixture
+def registry(db):
+    registry = Prompts(overrides=True)
+    registry.register(
+        {
+            "auth.user:change_view": {
+                "first_name": {"prompt": "A first name", "length": 20},
+            }
+        }
+    )
+    return registry
+
+
+def test_override_is_merged_over_code(registry):
+    PromptOverride.objects.create(
+        key="auth.user:change_view", field="first_name", prompt="", model="small"
+    )
+    PromptOverride.objects.create(
+        key="auth.*:change_view", field="email", prompt="An email", length=50
+    )
+
+    assert registry.get_fields("auth", "user", "change_view") == {
+        "first_name": {"prompt": "A first name", "length": 20, "model": "small"},
+        "email": {"prompt": "An email", "length": 50},
+    }
+    assert "email" in registry.get_fields("auth", "group", "change_view")
+
+
+def test_disabled_override_is_ignored(registry):
+    PromptOverride.objects.create(
+        key="auth.user:change_view", field="first_name", prompt="X", enabled=False
+    )
+
+    fields = registry.get_fields("auth", "user", "change_view")
+
+    assert fields["first_name"]["prompt"] == "A first name"
+
+
+def test_overrides_are_only_reloaded_after_changes(
+    registry, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    override = PromptOverride.objects.create(
+        key="auth.user:change_view", field="first_name", prompt="Old"
+    )
+    registry.get_fields("auth", "user", "change_view")
+
+    with django_assert_num_queries(0):
+        registry.get_fields("auth", "user", "change_view")
+    version = get_overrides_version()
+    override.prompt = "New"
+    with django_capture_on_commit_callbacks(execute=True):
+        override.save()
+        assert get_overrides_version() == version  # Not committed yet
+    assert get_overrides_version() != version
+    with django_assert_num_queries(1):
+        fields = registry.get_fields("auth", "user", "change_view")
+    assert fields["first_name"]["prompt"] == "New"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        override.delete()
+
+    fields = registry.get_fields("auth", "user", "change_view")
+    assert fields["first_name"]["prompt"] == "A first name"
+
+
+def test_overrides_are_reloaded_after_cache_flush(registry):
+    registry.get_fields("auth", "user", "change_view")
+    PromptOverride.objects.bulk_create(
+        [PromptOverride(key="auth.user:change_view", field="first_name", prompt="B")]
+    )
+    get_cache().delete(OVERRIDES_VERSION_KEY)
+
+    fields = registry.get_fields("auth", "user", "change_view")
+    assert fields["first_name"]["prompt"] == "B"
+
+
+def test_registry_without_overrides_does_not_query(django_assert_num_queries, db):
+    registry = Prompts()
+    registry.register({"auth.user:change_view": {"first_name": {"prompt": "A"}}})
+
+    with django_assert_num_queries(0):
+        registry.get_fields("auth", "user", "change_view")
+
+
+@pytest.mark.parametrize(
+    "key,prompt,field",
+    [
+        ("change_view", "", "key"),
+        ("auth.user:change_view", "{% if %}", "prompt"),
+    ],
+)
+def test_invalid_overrides_are_rejected(key, prompt, field):
+    override = PromptOverride(key=key, field="first_name", prompt=prompt)
+
+    with pytest.raises(ValidationError) as info:
+        override.clean()
+
+    assert list(info.value.message_dict) == [field]
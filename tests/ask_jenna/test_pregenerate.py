@@ -0,0 +1,128 @@
+import pytest
+
+from django.contrib.auth.models import Group, User
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.db import transaction
+
+from ask_jenna import config
+from ask_jenna.cache import get_cache
+from ask_jenna.models import SuggestionJob
+from ask_jenna.pregenerate import claim, get_worker_request, process
+from ask_jenna.preview import get_content
+from ask_jenna.templatetags.ask_jenna import get_scripts
+
+from .conftest import USER_KEY
+from .test_llm import parse_events
+
+# Suggestions are queued once the saving transaction commits
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def pregenerate(monkeypatch):
+    monkeypatch.setattr(config, "ASK_JENNA_PREGENERATE", [USER_KEY])
+
+
+def test_saving_queues_fields_once(pregenerate, user_prompts, db):
+    user = User.objects.create(username="ada")
+    user.save()
+    Group.objects.create(name="editors")
+
+    job = SuggestionJob.objects.get()
+    assert (job.key, job.field, job.object_pk) == (USER_KEY, "first_name", str(user.pk))
+    assert job.status == SuggestionJob.Status.PENDING
+
+
+def test_rolled_back_saves_queue_nothing(pregenerate, user_prompts, db):
+    with pytest.raises(RuntimeError), transaction.atomic():
+        User.objects.create(username="ada")
+        raise RuntimeError
+
+    assert not SuggestionJob.objects.exists()
+
+
+def test_saving_does_not_queue_without_setting(user_prompts, db):
+    User.objects.create(username="ada")
+
+    assert not SuggestionJob.objects.exists()
+
+
+def test_worker_request_renders_as_user_without_saving_a_session(staff):
+    request = get_worker_request(staff)
+
+    assert request.user == staff
+    assert not hasattr(request, "session")
+    content = get_content(request, f"/render/user/{staff.pk}/")
+
+    assert "Rendered for staff" in content
+    assert not Session.objects.exists()
+    assert "AnonymousUser" in get_content(get_worker_request(), "/render/user/1/")
+
+
+def test_worker_generates_and_button_shows_suggestion(
+    fake_provider, pregenerate, user_prompts, staff, client
+):
+    call_command("ask_jenna_worker", once=True, stdout=None)
+    assert SuggestionJob.objects.get().status == SuggestionJob.Status.DONE
+    assert len(fake_provider.requests) == 1
+    client.force_login(staff)
+    url = get_scripts("change_view", User._meta, staff)["first_name"]["generate"]
+
+    get_cache().clear()  # Not answered from the response cache of this process
+    events = parse_events(client.post(url))
+
+    assert events[-1] == ("done", {"text": "Hello from the fake provider"})
+    assert len(fake_provider.requests) == 1
+    parse_events(client.post(f"{url}?regenerate=1"))
+    assert len(fake_provider.requests) == 2
+
+
+def test_failed_jobs_and_requeue_while_running(
+    fake_provider, pregenerate, user_prompts, db
+):
+    user = User.objects.create(username="ada")
+    fake_provider.failures = 10
+    request = get_worker_request()
+
+    [job] = claim()
+    assert not process(job, request)
+    job.refresh_from_db()
+    assert (job.status, job.attempts) == (SuggestionJob.Status.FAILED, 1)
+    assert "503" in job.error
+
+    fake_provider.failures = 0
+    user.save()
+    [job] = claim()
+    user.save()  # Queued again while generating
+    assert process(job, request)
+    job.refresh_from_db()
+    assert job.status == SuggestionJob.Status.PENDING
+
+
+def test_worker_generations_are_reported(
+    fake_provider, pregenerate, user_prompts, db, finished
+):
+    user = User.objects.create(username="ada")
+    fake_provider.failures = 10
+    request = get_worker_request()
+    [job] = claim()
+    process(job, request)
+    fake_provider.failures = 0
+    user.save()
+    [job] = claim()
+    process(job, request)
+
+    assert [call["field"] for call in finished] == ["first_name", "first_name"]
+    assert "503" in finished[0]["error"]
+    assert finished[1]["error"] is None
+    assert finished[1]["completion_tokens"] > 0
+
+
+def test_jobs_of_deleted_objects_are_dropped(pregenerate, user_prompts, db):
+    user = User.objects.create(username="ada")
+    [job] = claim()
+    user.delete()
+
+    assert not process(job, get_worker_request())
+    assert not SuggestionJob.objects.exists()
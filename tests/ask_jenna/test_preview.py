@@ -0,0 +1,86 @@
+import pytest
+
+from django.contrib.auth.models import User
+from ask_jenna import preview
+from ask_jenna.cache import get_cache
+from ask_jenna.preview import get_content_url
+
+
+@pytest.fixture
+def staff(db):
+    return User.objects.create_superuser("staff", "staff@example.com", "pw")
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    calls = []
+
+    def get_preview_url(instance, language=None):
+        calls.append(instance.pk)
+        return f"/render/user/{instance.pk}/"
+
+    monkeypatch.setattr(preview, "get_preview_url", get_preview_url)
+    monkeypatch.setattr(preview, "REVISION_FIELDS", ("date_joined",))
+    yield calls
+
+
+def test_preview_returns_markdown_without_toolbar(staff, rendered, client):
+    client.force_login(staff)
+
+    response = client.get(get_content_url(staff))
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/markdown")
+    assert response["ETag"]
+    content = response.content.decode()
+    assert f"# User {staff.pk}" in content
+    assert "Rendered for staff" in content
+    assert "Toolbar" not in content
+    assert "alert" not in content
+
+
+def test_preview_is_cached_and_revalidated_by_etag(staff, rendered, client):
+    client.force_login(staff)
+    url = get_content_url(staff)
+
+    first = client.get(url)
+    second = client.get(url)
+    not_modified = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    assert second.content == first.content
+    assert not_modified.status_code == 304
+    assert rendered == [staff.pk]
+
+    get_cache().clear()  # The ASK_JENNA_CACHE alias
+    client.get(url)
+    assert rendered == [staff.pk, staff.pk]
+
+
+def test_preview_etag_changes_with_revision(staff, rendered, client, monkeypatch):
+    client.force_login(staff)
+    url = get_content_url(staff)
+    first = client.get(url)
+
+    monkeypatch.setattr(preview, "REVISION_FIELDS", ("last_login",))
+    response = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    assert response.status_code == 200
+    assert response["ETag"] != first["ETag"]
+    assert rendered == [staff.pk, staff.pk]
+
+
+def test_unversioned_preview_uses_content_etag(staff, rendered, client, monkeypatch):
+    monkeypatch.setattr(preview, "REVISION_FIELDS", ())
+    client.force_login(staff)
+    url = get_content_url(staff)
+
+    first = client.get(url)
+    second = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    assert second.status_code == 200
+    assert second["ETag"] == first["ETag"]
+    assert rendered == [staff.pk, staff.pk]
+
+
+def test_preview_requires_staff(staff, rendered, client):
+    assert client.get(get_content_url(staff)).status_code == 403
@@ -0,0 +1,168 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+
+from ask_jenna.prompts import Prompts, parse_value, validate
+
+
+class StaffUser(User):
+    class Meta:
+        app_label = "auth"
+        proxy = True
+
+
+@pytest.fixture
+def registry():
+    registry = Prompts()
+    registry.register(
+        {
+            "auth.user:change_view": {
+                "username": {
+                    "prompt": "Suggest a username for {{ instance.first_name }} "
+                    "using {{ dynamic_content }}",
+                    "dynamic_content": lambda x: x.last_name if x else None,
+                },
+            }
+        }
+    )
+    return registry
+
+
+def test_get_does_not_mutate_registry(registry):
+    spec = registry.all()["auth.user:change_view"]["username"]
+    template = spec["prompt"]
+    callback = spec["dynamic_content"]
+
+    resolved = registry.get(
+        "change_view", User._meta, User(first_name="Ada", last_name="Lovelace")
+    )
+
+    assert resolved["username"]["prompt"] == "Suggest a username for Ada using Lovelace"
+    assert resolved["username"]["dynamic_content"] == "Lovelace"
+    assert spec["prompt"] == template
+    assert spec["dynamic_content"] is callback
+
+
+def test_registered_specs_are_read_only(registry):
+    spec = registry.all()["auth.user:change_view"]["username"]
+
+    with pytest.raises(TypeError):
+        spec["prompt"] = "changed"
+    with pytest.raises(TypeError):
+        registry.all()["auth.user:change_view"]["other"] = {}
+
+
+def test_resolution_is_isolated_between_instances(registry):
+    users = [User(first_name=f"First{i}", last_name=f"Last{i}") for i in range(20)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda u: registry.get("change_view", User._meta, u), users)
+        )
+
+    for i, result in enumerate(results):
+        assert result["username"]["prompt"] == (
+            f"Suggest a username for First{i} using Last{i}"
+        )
+
+
+def test_unknown_view_returns_empty_dict(registry):
+    assert registry.get("add_view", User._meta) == {}
+
+
+@pytest.mark.parametrize(
+    "field_prompt,value,expected",
+    [
+        ({}, " Title ", "Title"),
+        ({"type": "text", "length": 5}, "Short", "Short"),
+        ({"type": "number"}, 3, 3),
+        ({"type": "boolean"}, False, False),
+    ],
+)
+def test_validate_accepts_matching_values(field_prompt, value, expected):
+    assert validate(field_prompt, value) == expected
+
+
+@pytest.mark.parametrize(
+    "field_prompt,value",
+    [
+        ({}, None),
+        ({"length": 5}, "Too long"),
+        ({"type": "number"}, "3"),
+        ({"type": "number"}, True),
+        ({"type": "boolean"}, "yes"),
+    ],
+)
+def test_validate_rejects_mismatching_values(field_prompt, value):
+    with pytest.raises(ValueError):
+        validate(field_prompt, value)
+
+
+def test_pattern_keys_apply_to_matching_models():
+    registry = Prompts()
+    registry.register(
+        {
+            "*:add_view": {"name": {"prompt": "Any {{ instance }}"}},
+            "auth.*:add_view": {"name": {"length": 10}, "code": {"prompt": "Code"}},
+            "auth.user:add_view": {"code": None},
+        }
+    )
+
+    assert registry.get_fields("auth", "user", "add_view") == {
+        "name": {"prompt": "Any {{ instance }}", "length": 10}
+    }
+    assert set(registry.get_fields("auth", "group", "add_view")) == {"name", "code"}
+    assert registry.get_fields("contenttypes", "contenttype", "add_view") == {
+        "name": {"prompt": "Any {{ instance }}"}
+    }
+    assert registry.get_fields("contenttypes", "contenttype", "change_view") == {}
+
+
+def test_prompts_of_parent_models_apply_to_children():
+    registry = Prompts()
+    registry.register(
+        {
+            "auth.*:change_view": {"email": {"prompt": "App"}},
+            "auth.user:change_view": {"email": {"prompt": "Parent"}},
+        }
+    )
+
+    fields = registry.get_fields("auth", "staffuser", "change_view")
+
+    assert fields["email"]["prompt"] == "Parent"
+
+
+def test_unregister_recompiles_table():
+    registry = Prompts()
+    registry.register({"*:add_view": {"name": {"prompt": "Any"}}})
+
+    registry.unregister("*:add_view")
+
+    assert registry.get_fields("auth", "user", "add_view") == {}
+
+
+@pytest.mark.parametrize(
+    "key", ["auth.user", "auth.user:*", "*.user:add_view", "au*th.user:add_view"]
+)
+def test_invalid_keys(key):
+    with pytest.raises(ImproperlyConfigured):
+        Prompts().register({key: {}})
+
+
+@pytest.mark.parametrize(
+    "field_prompt,text,expected",
+    [
+        ({}, "Plain text", "Plain text"),
+        ({}, '"Quoted"', "Quoted"),
+        ({}, '{"title": ["Nested"]}', "Nested"),
+        ({}, "42", "42"),
+        ({}, '{"a": 1, "b": 2}', {"a": 1, "b": 2}),
+        ({"type": "number"}, '{"count": 42}', 42),
+        ({"type": "boolean"}, "true", True),
+    ],
+)
+def test_parse_value_decodes_json_like_the_admin(field_prompt, text, expected):
+    assert parse_value(field_prompt, text) == expected
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from ask_jenna import config, llm
+from ask_jenna.replay import get_request_key
+
+
+@pytest.fixture
+def replay_file(monkeypatch, tmp_path):
+    path = tmp_path / "replay.json"
+    monkeypatch.setattr(config, "ASK_JENNA_REPLAY_FILE", str(path))
+    return path
+
+
+@pytest.fixture
+def replay(monkeypatch, replay_file):
+    monkeypatch.setattr(config, "ASK_JENNA_SERVICE", "replay")
+    monkeypatch.setattr(config, "ASK_JENNA_FALLBACK_SERVICE", None)
+    llm.reset_client()
+    yield replay_file
+    llm.reset_client()
+
+
+def test_recorded_responses_are_replayed(fake_provider, replay_file, monkeypatch):
+    monkeypatch.setattr(config, "ASK_JENNA_REPLAY_RECORD", True)
+    messages = llm.get_messages("Hi")
+    assert llm.complete(messages) == "Hello from the fake provider"
+    fake_provider.reply = "Streamed reply"
+    assert "".join(llm.stream(llm.get_messages("Stream"))) == "Streamed reply"
+    recorded = json.loads(replay_file.read_text())
+    assert recorded[get_request_key(messages, llm.get_options())] == (
+        "Hello from the fake provider"
+    )
+
+    monkeypatch.setattr(config, "ASK_JENNA_SERVICE", "replay")
+    llm.reset_client()
+
+    assert "".join(llm.stream(messages)) == "Hello from the fake provider"
+    assert llm.complete(llm.get_messages("Stream")) == "Streamed reply"
+    assert len(fake_provider.requests) == 2
+    assert json.loads(replay_file.read_text()) == recorded
+
+
+def test_missing_and_default_responses(replay):
+    with pytest.raises(httpx.HTTPStatusError):
+        llm.complete(llm.get_messages("Hi"))
+
+    replay.write_text(json.dumps({"*": "Any reply"}))
+    llm.reset_client()
+
+    assert llm.complete(llm.get_messages("Hi")) == "Any reply"
+
+
+def test_latency_and_token_rate_are_simulated(replay, monkeypatch):
+    replay.write_text(json.dumps({"*": "one two three four five six seven eight"}))
+    monkeypatch.setattr(config, "ASK_JENNA_REPLAY_LATENCY", 0.1)
+    monkeypatch.setattr(config, "ASK_JENNA_REPLAY_TOKEN_RATE", 100)
+    llm.reset_client()
+    messages = llm.get_messages("Hi")
+
+    started = time.monotonic()
+    generation = llm.stream(messages)
+    chunks = list(generation)
+
+    assert len(chunks) == 8
+    assert generation.latency >= 0.1
+    assert time.monotonic() - started >= 0.1 + 8 * 0.01
+    assert generation.usage == llm.Usage(1, 10)
+
+
+def test_replay_streams_asynchronously(replay):
+    replay.write_text(json.dumps({"*": "Async reply"}))
+    llm.reset_client()
+
+    async def run():
+        return [chunk async for chunk in llm.astream(llm.get_messages("Hi"))]
+
+    assert asyncio.run(run()) == ["Async", " reply"]
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from django.contrib.auth.models import User
+
+from ask_jenna import config, llm, routing
+from ask_jenna.templatetags.ask_jenna import get_scripts
+
+from .test_llm import parse_events
+
+
+ROUTES = [
+    {"max_length": 80, "model": "small"},
+    {"type": "text", "model": "large", "max_latency": 2, "fallback_model": "small"},
+]
+
+
+@pytest.fixture
+def routes(monkeypatch):
+    monkeypatch.setattr(config, "ASK_JENNA_ROUTES", ROUTES)
+    routing.latency.clear()
+    yield
+    routing.latency.clear()
+
+
+@pytest.mark.parametrize(
+    "field_prompt,model",
+    [
+        ({"length": 20}, "small"),
+        ({"length": 280}, "large"),
+        ({}, "large"),
+        ({"type": "number"}, config.ASK_JENNA_MODEL),
+        ({"length": 20, "model": "explicit"}, "explicit"),
+    ],
+)
+def test_get_model_follows_rules(routes, field_prompt, model):
+    assert routing.get_model(field_prompt) == model
+
+
+def test_slow_model_falls_back(routes):
+    routing.latency.observe("large", 1)
+    assert routing.get_model({"length": 280}) == "large"
+
+    routing.latency.observe("large", 10)
+
+    assert routing.latency.get("large") == pytest.approx(3.7)
+    assert routing.get_model({"length": 280}) == "small"
+
+
+def test_slow_model_is_probed_periodically(routes, monkeypatch):
+    monkeypatch.setattr(config, "ASK_JENNA_LATENCY_PROBE_INTERVAL", 0.05)
+    routing.latency.observe("large", 10)
+    assert routing.get_model({"length": 280}) == "small"
+
+    time.sleep(0.06)
+
+    assert routing.get_model({"length": 280}) == "large"
+    assert routing.get_model({"length": 280}) == "small"
+
+
+def test_fields_are_routed_by_their_total_length(routes):
+    assert routing.get_fields_model([{"length": 20}, {"length": 40}]) == "small"
+    assert routing.get_fields_model([{"length": 20}, {"length": 100}]) == "large"
+    assert routing.get_fields_model([{"length": 20}, {}]) == "large"
+    assert routing.get_fields_model([{"model": "x"}, {"model": "x"}]) == "x"
+
+
+def test_generate_uses_routed_model_and_tracks_latency(
+    routes, fake_provider, user_prompts, staff, client
+):
+    client.force_login(staff)
+    url = get_scripts("change_view", User._meta, staff)["first_name"]["generate"]
+
+    parse_events(client.post(url))
+
+    assert fake_provider.requests[0]["body"]["model"] == "large"
+    assert routing.latency.get("large") is not None
+
+
+def test_complete_does_not_track_latency(fake_provider):
+    # The time until the first text is unknown without streaming
+    llm.complete(llm.get_messages("Hi"), model="untracked")
+
+    assert routing.latency.get("untracked") is None
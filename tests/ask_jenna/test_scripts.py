@@ -0,0 +1,78 @@
+import pytest
+
+from django.utils import translation
+
+from ask_jenna import config
+from ask_jenna.prompts import prompts
+from ask_jenna.signals import prompt_resolved
+from ask_jenna.templatetags.ask_jenna import ask_jenna_scripts
+from cms_mcp.models import MCPPrompt
+
+
+KEY = "cms_mcp.mcpprompt:change_view"
+
+
+@pytest.fixture
+def mcp_prompts():
+    prompts.register({KEY: {"description": {"prompt": "Describe {{ instance.name }}"}}})
+    yield
+    prompts.unregister(KEY)
+
+
+@pytest.fixture
+def resolved():
+    calls = []
+
+    def receiver(sender, **kwargs):
+        calls.append(kwargs["field"])
+
+    prompt_resolved.connect(receiver)
+    yield calls
+    prompt_resolved.disconnect(receiver)
+
+
+@pytest.fixture
+def prompt(db):
+    return MCPPrompt.objects.create(name="greeting", content="Hello")
+
+
+def test_scripts_are_cached_per_object_version(mcp_prompts, resolved, prompt):
+    first = ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+    second = ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+
+    assert first == second
+    assert "Describe greeting" in second
+    assert resolved == ["description"]
+
+    prompt.name = "welcome"
+    prompt.save()
+    third = ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+
+    assert "Describe welcome" in third
+    assert resolved == ["description"] * 2
+
+
+def test_scripts_cache_depends_on_language(mcp_prompts, resolved, prompt):
+    ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+    with translation.override("de"):
+        ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+
+    assert len(resolved) == 2
+
+
+def test_scripts_cache_is_invalidated_by_new_prompts(mcp_prompts, prompt):
+    ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+    prompts.register({KEY: {"description": {"prompt": "New {{ instance.name }}"}}})
+
+    assert "New greeting" in ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+
+
+def test_scripts_cache_can_be_disabled(
+    mcp_prompts, resolved, prompt, monkeypatch
+):
+    monkeypatch.setattr(config, "ASK_JENNA_SCRIPTS_TIMEOUT", 0)
+    ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+    ask_jenna_scripts("change_view", MCPPrompt._meta, prompt)
+    ask_jenna_scripts("change_view", MCPPrompt._meta, None)
+
+    assert len(resolved) == 3
@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.utils import timezone, translation
+
+from ask_jenna import preview
+from ask_jenna.cache import get_cache
+from ask_jenna.prompts import prompts
+from ask_jenna.templatetags.ask_jenna import get_scripts
+
+
+KEY = "auth.user:change_view"
+
+
+@pytest.fixture
+def user_prompts():
+    calls = []
+
+    def last_name(user):
+        calls.append(user.pk)
+        return user.last_name
+
+    async def email(user):
+        return user.email
+
+    prompts.register(
+        {
+            KEY: {
+                "last_name": {
+                    "prompt": "Name: {{ dynamic_content }}",
+                    "dynamic_content": last_name,
+                    "dynamic_content_timeout": 60,
+                },
+                "email": {
+                    "prompt": "Mail: {{ dynamic_content }}",
+                    "dynamic_content": email,
+                },
+                "first_name": {"prompt": "Static for {{ instance.username }}"},
+            }
+        }
+    )
+    get_cache().clear()
+    yield calls
+    prompts.unregister(KEY)
+    get_cache().clear()
+
+
+@pytest.fixture
+def staff(db):
+    return User.objects.create_superuser("staff", "staff@example.com", "pw")
+
+
+def test_scripts_defer_dynamic_content(user_prompts, staff):
+    scripts = get_scripts("change_view", User._meta, staff)
+
+    assert user_prompts == []
+    assert scripts["last_name"]["deferred"] is True
+    assert scripts["last_name"]["dynamic_content"] is None
+    assert scripts["last_name"]["generate"] == (
+        f"/ask-jenna/generate/auth/user/change_view/last_name/{staff.pk}/"
+    )
+    assert scripts["first_name"]["prompt"] == "Static for staff"
+    assert "deferred" not in scripts["first_name"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_dynamic_content_is_cached_in_the_ask_jenna_cache(user_prompts):
+    staff = await User.objects.acreate(username="staff", last_name="Lovelace")
+
+    first = await prompts.aget_dynamic_content(KEY, "last_name", staff)
+    second = await prompts.aget_dynamic_content(KEY, "last_name", staff)
+
+    assert first == second == "Lovelace"
+    assert user_prompts == [staff.pk]
+    assert get_cache().get(prompts._cache_key(KEY, "last_name", staff)) == "Lovelace"
+
+
+def test_dynamic_content_is_cached_per_revision_and_language(
+    user_prompts, staff, monkeypatch
+):
+    monkeypatch.setattr(preview, "REVISION_FIELDS", ("last_login",))
+    staff.last_login = timezone.now()
+    prompts.get_dynamic_content(KEY, "last_name", staff)
+    prompts.get_dynamic_content(KEY, "last_name", staff)
+    assert user_prompts == [staff.pk]
+
+    with translation.override("de"):
+        prompts.get_dynamic_content(KEY, "last_name", staff)
+    staff.last_name = "Lovelace"
+    staff.last_login = timezone.now() + timedelta(seconds=1)
+    staff.save()
+
+    assert prompts.get_dynamic_content(KEY, "last_name", staff) == "Lovelace"
+    assert user_prompts == [staff.pk] * 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_dynamic_content_supports_async_callables(user_prompts):
+    staff = await User.objects.acreate(username="staff", email="staff@example.com")
+
+    assert await prompts.aget_dynamic_content(KEY, "email", staff) == (
+        "staff@example.com"
+    )
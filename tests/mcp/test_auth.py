@@ -0,0 +1,194 @@
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.core.cache import caches
+
+from cms_mcp import auth, limits, tool_cache
+from cms_mcp.models import MCPToken
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth.token_cache.clear()
+    caches[tool_cache.MCP_TOOL_CACHE].clear()
+    yield
+    auth.token_cache.clear()
+
+
+@pytest.fixture
+def token(db):
+    user = get_user_model().objects.create_user(username="mcp", password="pw12345")
+    return MCPToken.objects.create(user=user)
+
+
+def test_get_key_reads_bearer_tokens():
+    assert auth.get_key("Bearer cms_mcp_abc") == "cms_mcp_abc"
+    assert auth.get_key("bearer  cms_mcp_abc ") == "cms_mcp_abc"
+    assert auth.get_key("Basic dXNlcjpwdw==") is None
+    assert auth.get_key("Bearer ") is None
+    assert auth.get_key(None) is None
+
+
+def test_verified_tokens_are_cached(token, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert auth.authenticate(token.key).user == token.user
+        assert auth.authenticate(token.key).principal == f"token:{token.pk}"
+
+
+def test_invalid_keys_are_cached(db, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert auth.authenticate("cms_mcp_unknown") is None
+        assert auth.authenticate("cms_mcp_unknown") is None
+
+
+def test_revoking_a_token_takes_effect_at_once(token):
+    assert auth.authenticate(token.key) is not None
+
+    token.revoked = True
+    token.save()
+
+    assert auth.authenticate(token.key) is None
+
+
+def test_deleting_a_token_takes_effect_at_once(token):
+    assert auth.authenticate(token.key) is not None
+
+    token.delete()
+
+    assert auth.authenticate(token.key) is None
+
+
+def test_deactivating_a_user_takes_effect_at_once(token):
+    assert auth.authenticate(token.key) is not None
+
+    token.user.is_active = False
+    token.user.save()
+
+    assert auth.authenticate(token.key) is None
+
+
+def test_tokens_expiring_while_cached_are_rejected(
+    token, monkeypatch, django_assert_num_queries
+):
+    assert auth.authenticate(token.key) is not None
+    later = token.expires_at + timedelta(seconds=1)
+    monkeypatch.setattr(auth.timezone, "now", lambda: later)
+
+    with django_assert_num_queries(0):
+        assert auth.authenticate(token.key) is None
+
+
+def test_changes_committed_by_other_processes_take_effect(token):
+    assert auth.authenticate(token.key) is not None
+
+    # Another process revokes the token and starts a new generation
+    MCPToken.objects.filter(pk=token.pk).update(revoked=True)
+    tool_cache.bump_generation(auth.GENERATION_LABEL)
+
+    assert auth.authenticate(token.key) is None
+
+
+def test_changes_start_a_new_generation_once_committed(
+    token, django_capture_on_commit_callbacks
+):
+    generation = tool_cache.get_generations([auth.GENERATION_LABEL])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        token.revoked = True
+        token.save()
+        assert tool_cache.get_generations([auth.GENERATION_LABEL]) == generation
+
+    assert tool_cache.get_generations([auth.GENERATION_LABEL]) != generation
+
+
+def test_logging_in_keeps_the_cached_tokens(
+    token, django_capture_on_commit_callbacks, django_assert_num_queries
+):
+    assert auth.authenticate(token.key) is not None
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        update_last_login(None, token.user)
+
+    assert callbacks == []
+    with django_assert_num_queries(0):
+        assert auth.authenticate(token.key) is not None
+
+
+def test_lookups_overtaken_by_an_invalidation_are_not_cached(token):
+    generation = auth.token_cache.generation
+    credentials = auth.get_credentials(token.key)
+    auth.token_cache.invalidate(keys=[token.key])
+
+    auth.token_cache.set(token.key, credentials, generation, "shared")
+
+    assert auth.token_cache.get(token.key, "shared") is auth._missing
+
+
+def test_entries_of_other_generations_are_not_used(token):
+    credentials = auth.get_credentials(token.key)
+    auth.token_cache.set(token.key, credentials, auth.token_cache.generation, "old")
+
+    assert auth.token_cache.get(token.key, "new") is auth._missing
+    assert auth.token_cache.get(token.key, "old") is auth._missing  # Dropped
+
+
+def test_cache_is_bounded(token):
+    credentials = auth.get_credentials(token.key)
+    cache = auth.TokenCache(negative_size=2)
+    cache.set(token.key, credentials, cache.generation, "shared")
+
+    for key in ("a", "b", "c"):
+        cache.set(key, None, cache.generation, "shared")
+
+    assert cache.get("a", "shared") is auth._missing
+    assert cache.get("c", "shared") is None
+    # Invalid keys do not evict valid ones
+    assert cache.get(token.key, "shared") == credentials
+
+
+async def call_middleware(headers):
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen.update(
+            user=scope["user"],
+            current=auth.get_user(),
+            principal=limits.principal.get(),
+        )
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "path": "/mcp/", "headers": headers}
+    await auth.BearerAuthMiddleware(app)(scope, None, send)
+    return messages[0]["status"], seen
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_middleware_authenticates_requests():
+    user = await sync_to_async(get_user_model().objects.create_user)(username="mcp")
+    token = await MCPToken.objects.acreate(user=user)
+
+    status, seen = await call_middleware(
+        [(b"authorization", f"Bearer {token.key}".encode())]
+    )
+
+    assert status == 200
+    assert seen == {"user": user, "current": user, "principal": f"token:{token.pk}"}
+    assert auth.get_user() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_middleware_rejects_requests_without_valid_token():
+    assert (await call_middleware([]))[0] == 401
+    assert (await call_middleware([(b"authorization", b"Bearer nope")]))[0] == 401
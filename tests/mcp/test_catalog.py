@@ -0,0 +1,75 @@
+import hashlib
+
+import pytest
+
+from django.core.cache import caches
+
+from cms_mcp import catalog, tool_cache
+from cms_mcp.models import MCPPrompt, MCPResource
+from cms_mcp.prompts import get_prompt
+from cms_mcp.resources.static import list_resources, read_resource
+
+
+@pytest.fixture(autouse=True)
+def clear_catalogs():
+    caches[tool_cache.MCP_TOOL_CACHE].clear()
+    catalog.prompts.clear()
+    catalog.resources.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_resources_are_read_from_memory(monkeypatch):
+    await MCPResource.objects.acreate(
+        uri="cms://pages", name="Pages", content="Zürich", enabled=True
+    )
+    await MCPResource.objects.acreate(uri="cms://hidden", name="Hidden", enabled=False)
+
+    resources = await list_resources()
+    monkeypatch.setattr(catalog.resources, "load", None)  # No more queries
+    assert await list_resources() == resources
+    assert await read_resource("cms://pages") == "Zürich"
+
+    assert [resource.uri for resource in resources] == ["cms://pages"]
+    assert resources[0].size == len("Zürich".encode())
+    entry = (await catalog.resources.aget()).entries["cms://pages"]
+    assert entry.hash == hashlib.sha256("Zürich".encode()).hexdigest()
+    with pytest.raises(ValueError):
+        await read_resource("cms://hidden")
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_changes_are_visible_at_once():
+    prompt = await MCPPrompt.objects.acreate(name="welcome", content="Hello")
+    assert (await get_prompt("welcome")).messages[0].content.text == "Hello"
+
+    prompt.content = "Welcome"
+    await prompt.asave()
+    assert (await get_prompt("welcome")).messages[0].content.text == "Welcome"
+
+    await prompt.adelete()
+    with pytest.raises(ValueError):
+        await get_prompt("welcome")
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_changes_of_other_models_keep_the_catalog():
+    await MCPPrompt.objects.acreate(name="welcome", content="Hello")
+    prompts = await catalog.prompts.aget()
+
+    await MCPResource.objects.acreate(uri="cms://pages", name="Pages")
+
+    assert await catalog.prompts.aget() is prompts
+
+
+def test_invalidate_waits_for_the_commit(django_capture_on_commit_callbacks, db):
+    cache = caches[tool_cache.MCP_TOOL_CACHE]
+    key = tool_cache.get_generation_key("cms_mcp.mcpprompt")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        catalog.invalidate(sender=MCPPrompt, instance=None)
+        assert not cache.has_key(key)
+
+    assert cache.has_key(key)
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from cms_mcp.executor import MCP_DB_THREADS, db_read
+from cms_mcp.models import MCPPrompt
+
+SESSIONS = min(8, MCP_DB_THREADS)
+
+
+class InFlight:
+    """Count the reads running at the same time."""
+
+    def __init__(self, barrier: threading.Barrier | None = None):
+        self.barrier = barrier
+        self.count = self.peak = 0
+        self._lock = threading.Lock()
+
+    def load_prompts(self):
+        with self._lock:
+            self.count += 1
+            self.peak = max(self.peak, self.count)
+        try:
+            if self.barrier is not None:
+                # Passes only once all sessions' reads are running at once
+                self.barrier.wait(timeout=5)
+            return list(MCPPrompt.objects.filter(enabled=True))
+        finally:
+            with self._lock:
+                self.count -= 1
+
+
+async def run_sessions(load) -> None:
+    results = await asyncio.gather(*(load() for _ in range(SESSIONS)))
+    assert all(len(rows) == 1 for rows in results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_reads_of_concurrent_sessions_run_in_parallel():
+    await MCPPrompt.objects.acreate(name="prompt", content="Content")
+    serial = InFlight()
+    parallel = InFlight(threading.Barrier(SESSIONS))
+
+    await run_sessions(sync_to_async(serial.load_prompts, thread_sensitive=True))
+    await run_sessions(db_read(parallel.load_prompts))
+
+    assert serial.peak == 1
+    assert parallel.peak == SESSIONS
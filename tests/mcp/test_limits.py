@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from mcp import MCPError, Tool
+
+from cms_mcp import errors, limits
+from cms_mcp.registry import MCPTool
+
+
+@pytest.fixture(autouse=True)
+def clear_limiters():
+    limits.limiters.clear()
+    yield
+    limits.limiters.clear()
+
+
+def make_tool(call, **kwargs) -> MCPTool:
+    return MCPTool(
+        tool=Tool(name="tool", input_schema={"type": "object"}),
+        call=call,
+        related=None,
+        **kwargs,
+    )
+
+
+async def call_as(principal, tool, name):
+    limits.principal.set(principal)
+    return await limits.call(tool, name, {})
+
+
+@pytest.mark.asyncio
+async def test_slots_are_shared_fairly_between_principals():
+    order = []
+    release = asyncio.Event()
+
+    async def call(name, input_data):
+        order.append(name)
+        await release.wait()
+        return name
+
+    tool = make_tool(call, max_in_flight=1)
+    calls = [
+        asyncio.create_task(call_as(principal, tool, f"{principal}{i}"))
+        for principal, count in (("a", 3), ("b", 1))
+        for i in range(count)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*calls) == ["a0", "a1", "a2", "b0"]
+    assert order == ["a0", "a1", "b0", "a2"]
+    limiter = limits.limiters["default"]
+    assert (limiter.in_flight, limiter.queued) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_as_busy(monkeypatch):
+    release = asyncio.Event()
+
+    async def call(name, input_data):
+        await release.wait()
+
+    tool = make_tool(call, max_in_flight=1)
+    limits.limiters["default"] = limits.Limiter(1, max_queued=1)
+    calls = [asyncio.create_task(call_as("a", tool, "tool")) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(MCPError) as e:
+        await call_as("b", tool, "tool")
+
+    assert e.value.code == errors.BUSY
+    assert e.value.error.data["retry_after"] >= 1
+    release.set()
+    await asyncio.gather(*calls)
+
+
+@pytest.mark.asyncio
+async def test_timeout_keeps_slot_until_call_returns():
+    release = asyncio.Event()
+
+    async def call(name, input_data):
+        await release.wait()
+
+    tool = make_tool(call, max_in_flight=1, timeout=0.01)
+
+    with pytest.raises(MCPError) as e:
+        await call_as("a", tool, "tool")
+
+    assert e.value.code == errors.TIMEOUT
+    limiter = limits.limiters["default"]
+    assert limiter.in_flight == 1
+    release.set()
+    await asyncio.sleep(0.01)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_free_the_slot():
+    async def call(name, input_data):
+        raise ValueError("Invalid")
+
+    tool = make_tool(call, concurrency_class="write", max_in_flight=1)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await call_as("a", tool, "tool")
+
+    assert limits.limiters["write"].in_flight == 0
@@ -67,3 +67,14 @@ def test_admin_bulk_revoke_marks_tokens_revoked(db):
     token2.refresh_from_db()
     assert token1.revoked is True
     assert token2.revoked is True
+
+
+def test_revoked_and_unlimited_tokens(db):
+    user = get_user_model().objects.create_user(
+        username="tokenuser5", email="token5@example.com", password="pw12345"
+    )
+    unlimited = MCPToken.objects.create(user=user, expires_at=None)
+    revoked = MCPToken.objects.create(user=user, revoked=True)
+    assert unlimited.is_expired is False
+    assert unlimited.is_active is True
+    assert revoked.is_active is False
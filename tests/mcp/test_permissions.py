@@ -0,0 +1,89 @@
+import pytest
+from asgiref.sync import sync_to_async
+from mcp import Tool
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+
+from cms_mcp import permissions, tool_cache
+from cms_mcp.registry import MCPTool, ToolRegistry
+
+checks = []
+
+
+async def call(name, input_data):
+    return {}
+
+
+def is_staff(user):
+    checks.append(user.pk)
+    return user.is_staff
+
+
+def register_tools(tools):
+    for name, permission in (("public", None), ("staff", is_staff)):
+        tools[name] = MCPTool(
+            tool=Tool(name=name, input_schema={"type": "object"}),
+            call=call,
+            related=None,
+            permission=permission,
+        )
+
+
+@pytest.fixture
+def snapshot():
+    checks.clear()
+    caches[tool_cache.MCP_TOOL_CACHE].clear()
+    return ToolRegistry([__name__], get_fingerprint=lambda: ("v1",)).build()
+
+
+def create_user(username, **kwargs):
+    return sync_to_async(get_user_model().objects.create_user)(username, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_permissions_are_resolved_once_per_user(snapshot):
+    staff = await create_user("staff", is_staff=True)
+    editor = await create_user("editor")
+
+    assert await permissions.aget_permitted(staff, snapshot) == {"public", "staff"}
+    assert await permissions.aget_permitted(staff, snapshot) == {"public", "staff"}
+    assert await permissions.aget_permitted(editor, snapshot) == {"public"}
+    assert await permissions.aget_permitted(editor, snapshot) == {"public"}
+
+    assert checks == [staff.pk, editor.pk]
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_permissions_are_resolved_again_for_new_tools(snapshot):
+    staff = await create_user("staff", is_staff=True)
+    await permissions.aget_permitted(staff, snapshot)
+
+    registry = ToolRegistry([__name__], get_fingerprint=lambda: ("v2",))
+    await permissions.aget_permitted(staff, registry.build())
+
+    assert checks == [staff.pk, staff.pk]
+
+
+@pytest.mark.asyncio
+async def test_anonymous_users_may_only_call_public_tools(snapshot):
+    assert await permissions.aget_permitted(None, snapshot) == {"public"}
+    assert checks == []
+
+
+@pytest.mark.django_db
+def test_home_page_is_looked_up_again_after_a_page_change(
+    monkeypatch, django_capture_on_commit_callbacks
+):
+    caches[tool_cache.MCP_TOOL_CACHE].clear()
+    pages = iter(["home", "new home"])
+    monkeypatch.setattr(permissions, "load_home_page", lambda: next(pages))
+
+    assert permissions.get_home_page() == "home"
+    assert permissions.get_home_page() == "home"
+    with django_capture_on_commit_callbacks(execute=True):
+        permissions.invalidate_home_page(sender=None)
+        assert permissions.get_home_page() == "home"  # Not committed yet
+    assert permissions.get_home_page() == "new home"
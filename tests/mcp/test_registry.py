@@ -0,0 +1,77 @@
+import pytest
+from mcp import Tool
+
+from django.core.exceptions import ImproperlyConfigured
+
+from cms_mcp.registry import MCPTool, ToolRegistry, check_concurrency_classes
+
+registrations = []
+
+
+async def call(name, input_data):
+    return {"name": name}
+
+
+def register_tools(tools):
+    registrations.append(True)
+    for name in fingerprint:
+        tools[name] = MCPTool(
+            tool=Tool(name=name, input_schema={"type": "object"}),
+            call=call,
+            related=None,
+        )
+
+
+fingerprint = ["first"]
+
+
+@pytest.fixture
+def registry():
+    registrations.clear()
+    fingerprint[:] = ["first"]
+    return ToolRegistry([__name__], get_fingerprint=lambda: tuple(fingerprint))
+
+
+@pytest.mark.asyncio
+async def test_tools_are_built_once(registry):
+    snapshot = await registry.aget_snapshot()
+
+    assert [tool.name for tool in snapshot.tool_list] == ["first"]
+    assert await registry.aget_snapshot() is snapshot
+    assert registry.build() is snapshot
+    assert len(registrations) == 1
+    with pytest.raises(TypeError):
+        snapshot.tools["other"] = snapshot.tools["first"]
+
+
+@pytest.mark.asyncio
+async def test_tools_are_rebuilt_when_registrations_change(registry):
+    await registry.aget_snapshot()
+    fingerprint.append("second")
+
+    assert registry.get_snapshot() is None
+    snapshot = await registry.aget_snapshot()
+
+    assert list(snapshot.tools) == ["first", "second"]
+    assert len(registrations) == 2
+
+
+def test_tools_of_a_concurrency_class_share_its_limit():
+    def make_tool(name, **kwargs):
+        return MCPTool(
+            tool=Tool(name=name, input_schema={"type": "object"}),
+            call=call,
+            related=None,
+            **kwargs,
+        )
+
+    tools = {
+        "list": make_tool("list", concurrency_class="read", max_in_flight=8),
+        "get": make_tool("get", concurrency_class="read", max_in_flight=8),
+        "create": make_tool("create", max_in_flight=2),
+    }
+    check_concurrency_classes(tools)
+
+    tools["get"].max_in_flight = 4
+    with pytest.raises(ImproperlyConfigured, match="list and get"):
+        check_concurrency_classes(tools)
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+from mcp import types
+
+from django.core.cache import caches
+
+from cms_mcp import catalog, subscriptions, tool_cache
+from cms_mcp.mcp_server import server
+from cms_mcp.models import MCPResource
+from cms_mcp.resources import static  # noqa: F401
+from cms_mcp.subscriptions import Subscriptions
+
+
+class Session:
+    def __init__(self):
+        self.updated = []
+
+    async def send_resource_updated(self, uri):
+        self.updated.append(uri)
+
+
+@pytest.fixture(autouse=True)
+def clear_subscriptions(monkeypatch):
+    caches[tool_cache.MCP_TOOL_CACHE].clear()
+    catalog.resources.clear()
+    monkeypatch.setattr(subscriptions.subscriptions, "interval", 0)
+    yield
+    subscriptions.subscriptions.clear()
+
+
+async def wait_for(condition):
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_subscribed_sessions_are_notified_of_changes():
+    resource = await MCPResource.objects.acreate(
+        uri="cms://pages", name="Pages", content="Home"
+    )
+    await MCPResource.objects.acreate(uri="cms://other", name="Other")
+    subscribed, other = Session(), Session()
+    await subscriptions.subscriptions.subscribe("cms://pages", subscribed)
+    await subscriptions.subscriptions.subscribe("cms://other", other)
+
+    resource.content = "Home, About"
+    await resource.asave()
+    await wait_for(lambda: subscribed.updated)
+
+    assert subscribed.updated == ["cms://pages"]
+    assert other.updated == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_saves_without_changes_are_not_notified():
+    resource = await MCPResource.objects.acreate(
+        uri="cms://pages", name="Pages", content="Home"
+    )
+    session = Session()
+    await subscriptions.subscriptions.subscribe("cms://pages", session)
+
+    resource.description = "All pages"
+    await resource.asave()
+    await subscriptions.subscriptions.check()
+
+    assert session.updated == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_changes_of_other_processes_are_found():
+    resource = await MCPResource.objects.acreate(
+        uri="cms://pages", name="Pages", content="Home"
+    )
+    watcher = Subscriptions(interval=0)
+    session, unsubscribed = Session(), Session()
+    await watcher.subscribe("cms://pages", session)
+    await watcher.subscribe("cms://pages", unsubscribed)
+    watcher.unsubscribe("cms://pages", unsubscribed)
+
+    # Disabled by another process: no signal is sent here
+    await MCPResource.objects.filter(pk=resource.pk).aupdate(enabled=False)
+    tool_cache.bump_generation("cms_mcp.mcpresource")
+    await watcher.check()
+    await watcher.check()
+
+    assert session.updated == ["cms://pages"]
+    assert unsubscribed.updated == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(
+    not hasattr(server, "request_handlers"),
+    reason="Needs the decorator API of the lowlevel server",
+)
+async def test_clients_subscribe_and_are_notified():
+    from mcp.shared.memory import create_connected_server_and_client_session
+
+    resource = await MCPResource.objects.acreate(
+        uri="cms://pages", name="Pages", content="Home"
+    )
+    updated = []
+
+    async def message_handler(message):
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ResourceUpdatedNotification
+        ):
+            updated.append(str(message.root.params.uri))
+
+    async with create_connected_server_and_client_session(
+        server, message_handler=message_handler
+    ) as client:
+        assert client.get_server_capabilities().resources.subscribe is True
+        await client.subscribe_resource("cms://pages")
+
+        resource.content = "Home, About"
+        await resource.asave()
+        await wait_for(lambda: updated)
+
+    assert updated == ["cms://pages"]
@@ -0,0 +1,134 @@
+import pytest
+from mcp import Tool
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+
+from cms_mcp import limits, tool_cache
+from cms_mcp.models import MCPPrompt
+from cms_mcp.registry import MCPTool
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    limits.limiters.clear()
+    caches[tool_cache.MCP_TOOL_CACHE].clear()
+    yield
+    limits.limiters.clear()
+
+
+def make_counting_tool(**kwargs) -> tuple[MCPTool, list]:
+    calls = []
+
+    async def call(name, input_data):
+        calls.append(input_data)
+        return {"count": len(calls)}
+
+    tool = MCPTool(
+        tool=Tool(name="tool", input_schema={"type": "object"}),
+        call=call,
+        related=None,
+        **kwargs,
+    )
+    return tool, calls
+
+
+@pytest.mark.asyncio
+async def test_results_of_read_only_tools_are_cached():
+    tool, calls = make_counting_tool(read_only=True)
+
+    first = await tool_cache.call(tool, "tool", {"a": 1, "b": 2})
+    second = await tool_cache.call(tool, "tool", {"b": 2, "a": 1})
+
+    assert first == second == {"count": 1}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_other_tools_are_always_called():
+    tool, calls = make_counting_tool()
+
+    await tool_cache.call(tool, "tool", {})
+    await tool_cache.call(tool, "tool", {})
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_results_are_not_shared_between_scopes():
+    tool, calls = make_counting_tool(read_only=True)
+    editor = User(pk=1, is_staff=True)
+
+    await tool_cache.call(tool, "tool", {}, editor)
+    await tool_cache.call(tool, "tool", {}, User(pk=1, is_staff=True))
+    assert len(calls) == 1
+
+    await tool_cache.call(tool, "tool", {}, User(pk=2, is_staff=True))
+    editor.is_superuser = True
+    await tool_cache.call(tool, "tool", {}, editor)
+    await tool_cache.call(tool, "tool", {})
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_results_are_recomputed_after_a_write_commits():
+    tool, calls = make_counting_tool(read_only=True, depends_on=("cms_mcp.mcpprompt",))
+    prompt = await MCPPrompt.objects.acreate(name="welcome", content="Hello")
+
+    assert await tool_cache.call(tool, "tool", {}) == {"count": 1}
+    assert await tool_cache.call(tool, "tool", {}) == {"count": 1}
+
+    prompt.content = "Welcome"
+    await prompt.asave()
+    assert await tool_cache.call(tool, "tool", {}) == {"count": 2}
+
+
+@pytest.mark.asyncio
+async def test_changes_only_invalidate_dependent_results():
+    tool, calls = make_counting_tool(read_only=True, depends_on=("cms.cmsplugin",))
+
+    await tool_cache.call(tool, "tool", {})
+    tool_cache.bump_generation("cms.page")
+    await tool_cache.call(tool, "tool", {})
+    assert len(calls) == 1
+
+    tool_cache.bump_generation("cms.cmsplugin")
+    assert await tool_cache.call(tool, "tool", {}) == {"count": 2}
+
+
+@pytest.mark.asyncio
+async def test_results_are_recomputed_after_a_cache_flush():
+    tool, calls = make_counting_tool(read_only=True)
+
+    await tool_cache.call(tool, "tool", {})
+    caches[tool_cache.MCP_TOOL_CACHE].clear()
+    await tool_cache.call(tool, "tool", {})
+
+    assert len(calls) == 2
+
+
+def test_invalidate_ignores_other_models():
+    cache = caches[tool_cache.MCP_TOOL_CACHE]
+
+    tool_cache.invalidate(sender=User, instance=None)
+
+    assert tool_cache.get_content_label(User) is None
+    assert not any(
+        cache.has_key(tool_cache.get_generation_key(label))
+        for label in tool_cache.CONTENT_MODELS
+    )
+
+
+def test_invalidate_waits_for_the_commit(
+    monkeypatch, django_capture_on_commit_callbacks, db
+):
+    monkeypatch.setattr(tool_cache, "CONTENT_MODELS", ("auth.user",))
+    cache = caches[tool_cache.MCP_TOOL_CACHE]
+    key = tool_cache.get_generation_key("auth.user")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tool_cache.invalidate(sender=User, instance=None)
+        assert not cache.has_key(key)
+
+    assert cache.has_key(key)
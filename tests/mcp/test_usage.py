@@ -0,0 +1,60 @@
+import pytest
+
+from django.contrib.auth import get_user_model
+
+from cms_mcp.models import MCPToken
+from cms_mcp.usage import UsageBuffer
+
+
+@pytest.fixture
+def tokens(db):
+    user = get_user_model().objects.create_user(username="mcp", password="pw12345")
+    return [MCPToken.objects.create(user=user) for _ in range(3)]
+
+
+def test_usage_is_written_with_one_query(tokens, django_assert_num_queries):
+    buffer = UsageBuffer(interval=0)
+    for token, requests in zip(tokens, (3, 1)):
+        for _ in range(requests):
+            buffer.record(token.pk)
+
+    with django_assert_num_queries(1):
+        assert buffer.flush() == 2
+
+    for token in tokens:
+        token.refresh_from_db()
+    assert [token.request_count for token in tokens] == [3, 1, 0]
+    assert tokens[0].last_used_at is not None
+    assert tokens[2].last_used_at is None
+
+
+def test_usage_is_added_to_the_stored_counts(tokens):
+    buffer = UsageBuffer(interval=0)
+    buffer.record(tokens[0].pk)
+    buffer.flush()
+    buffer.record(tokens[0].pk)
+    buffer.flush()
+
+    tokens[0].refresh_from_db()
+    assert tokens[0].request_count == 2
+
+
+def test_nothing_is_written_without_usage(db, django_assert_num_queries):
+    with django_assert_num_queries(0):
+        assert UsageBuffer(interval=0).flush() == 0
+
+
+def test_usage_is_kept_if_writing_fails(tokens, monkeypatch):
+    buffer = UsageBuffer(interval=0)
+    buffer.record(tokens[0].pk)
+
+    def fail(self, **kwargs):
+        raise RuntimeError("Database unavailable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("django.db.models.query.QuerySet.update", fail)
+        assert buffer.flush() == 0
+    assert buffer.flush() == 1
+
+    tokens[0].refresh_from_db()
+    assert tokens[0].request_count == 1
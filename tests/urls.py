@@ -1 +1,19 @@
-urlpatterns = []
+from django.http import HttpResponse
+from django.urls import include, path
+
+
+def render_user(request, pk):
+    return HttpResponse(
+        f"""<html><body>
+        <div id="cms-top"><ul><li>Toolbar</li></ul></div>
+        <h1>User {pk}</h1>
+        <p>Rendered for {request.user}</p>
+        <script>alert("hi")</script>
+        </body></html>"""
+    )
+
+
+urlpatterns = [
+    path("ask-jenna/", include("ask_jenna.urls")),
+    path("render/user/<int:pk>/", render_user),
+]